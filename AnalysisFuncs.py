@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 import datetime as dt
+import DataGeneration as dg
 
 # create a python function to create a daily summary of the portfolio
 def create_daily_summary(df):
@@ -59,42 +60,93 @@ def cumulative_by_settle_date(df):
 
 def calculate_daily_returns(df, include_portfolio_return=True):
     # The total return for each position is (current close - previous close) + dividend per share / previous close
-    ts = []
+    # Number the positions and dates in sorted order (a missing name gets -1 and is dropped, as groupby would),
+    # then one stable sort on the combined number puts every position's rows in date order
+    codes, names = pd.factorize(df['Position name'], sort=True)
+    days, _ = pd.factorize(df['Settle date'], sort=True, use_na_sentinel=False)
+    rows = np.flatnonzero(codes >= 0)
+    order = rows[np.argsort(days[rows].astype('int64') * len(names) + codes[rows], kind='stable')]
+    df = df.take(order).reset_index(drop=True)
+    positions = pd.Series(codes[order])
 
-    # write a loop to iterate over groups in df by 'Position name' and calculate the daily return
-    for _, group_df in df.groupby('Position name'):
-        group_df = group_df.sort_values(by='Settle date')
-        group_df['Daily Return %'] = np.where(
-            group_df['Close'].shift(1).bfill() == 0, 
-            0.0,
-            100.0 * (((group_df['Close'] - group_df['Close'].shift(1).bfill()) + np.where(group_df['Income Qty'] > 0.0, group_df['Income'] / group_df['Income Qty'], 0.0)) / (group_df['Close'].shift(1).bfill()))
-        )
-        #group_df['Daily Return %'] = 100.0 * (((group_df['Close'] - group_df['Close'].shift(1).bfill()) + np.where(group_df['Income Qty'] > 0.0, group_df['Income'] / group_df['Income Qty'], 0.0)) / (group_df['Close'].shift(1).bfill()))
-        if include_portfolio_return:
-            group_df['Portfolio Return %'] = group_df['Daily Return %'] * group_df['Portfolio Weight %'] / 100
-        ts.append(group_df)
+    # the first row of each position has no previous close, so it takes the next available one (i.e. its own)
+    prev_close = df['Close'].groupby(positions, sort=False).shift(1).groupby(positions, sort=False).bfill()
+    income_per_share = np.where(df['Income Qty'] > 0.0, df['Income'] / df['Income Qty'], 0.0)
 
-    return pd.concat(ts, ignore_index=True).sort_values(by=['Settle date', 'Position name']).reset_index(drop=True)
+    df['Daily Return %'] = np.where(
+        prev_close == 0,
+        0.0,
+        100.0 * (((df['Close'] - prev_close) + income_per_share) / prev_close)
+    )
+    if include_portfolio_return:
+        df['Portfolio Return %'] = df['Daily Return %'] * df['Portfolio Weight %'] / 100
+
+    return df
+
+def rolling_compound_return(returns, window):
+    # Compound a series of daily % returns over a trailing window of `window` rows, giving the window's total % return.
+    # Matches returns.rolling(window).apply(lambda x: 100.0 * ((1 + x / 100).cumprod().iloc[-1] - 1)): NaN until the
+    # window is full or while it holds a NaN. The product is taken as exp of a rolling sum of log growth factors, so
+    # it is O(n) rather than O(n * window). Factors of zero or below have no log, so they are counted instead: any
+    # zero in the window makes the product zero, and an odd number of negative factors makes it negative.
+    factors = 1.0 + returns.astype('float') / 100.0
+    magnitude = factors.abs()
+    log_sum = np.log(magnitude.where(magnitude != 0, 1.0)).rolling(window=window).sum()
+    zeros = (magnitude == 0).astype('float').rolling(window=window).sum()
+    negatives = (factors < 0).astype('float').rolling(window=window).sum()
+
+    product = np.where(zeros > 0, 0.0, np.where(negatives % 2 == 1, -1.0, 1.0) * np.exp(log_sum))
+    return pd.Series(100.0 * (product - 1), index=returns.index, name=returns.name)
 
 def calculate_composite_returns(df):
     ts = []
 
-    for _, group_df in df.groupby('Position name'):
+    for _, group_df in df.groupby('Position name', observed=True):
         group_df = group_df.sort_values(by='Settle date')
         group_df['Settle date'] = pd.to_datetime(group_df['Settle date'])
         # ITD
         group_df['ITD Portfolio Return %'] = 100.0*((1 + group_df['Portfolio Return %'] / 100).cumprod() - 1)
         # Ann. ITD
         first_trade_date = np.datetime64(group_df['Settle date'].min(), 'D')
-        group_df['Ann. ITD Portfolio Return %'] = 100.0 * ((1 + group_df['ITD Portfolio Return %'] / 100) ** (260 / np.maximum(np.busday_count(first_trade_date, group_df['Settle date'].values.astype('datetime64[D]')), 1)) - 1)
+        group_df['Ann. ITD Portfolio Return %'] = 100.0 * ((1 + group_df['ITD Portfolio Return %'] / 100) ** (260 / np.maximum(dg.business_day_calendar().busday_count(first_trade_date, group_df['Settle date'].values), 1)) - 1)
         # 1Y
-        group_df['1Y Portfolio Return %'] = group_df['Portfolio Return %'].rolling(window=260 * 1).apply(lambda x: 100.0 * ((1 + x / 100).cumprod().iloc[-1] - 1))
+        group_df['1Y Portfolio Return %'] = rolling_compound_return(group_df['Portfolio Return %'], 260 * 1)
         # 3Y
-        group_df['3Y Portfolio Return %'] = group_df['Portfolio Return %'].rolling(window=260 * 3).apply(lambda x: 100.0 * ((1 + x / 100).cumprod().iloc[-1] - 1))
+        group_df['3Y Portfolio Return %'] = rolling_compound_return(group_df['Portfolio Return %'], 260 * 3)
         group_df['3Y Portfolio Return %'] = ((1 + group_df['3Y Portfolio Return %'] / 100.0) ** (1/3) - 1) * 100.0
         # 5Y
-        group_df['5Y Portfolio Return %'] = group_df['Portfolio Return %'].rolling(window=260 * 5).apply(lambda x: 100.0 * ((1 + x / 100).cumprod().iloc[-1] - 1))
+        group_df['5Y Portfolio Return %'] = rolling_compound_return(group_df['Portfolio Return %'], 260 * 5)
         group_df['5Y Portfolio Return %'] = ((1 + group_df['5Y Portfolio Return %'] / 100.0) ** (1/5) - 1) * 100.0
         ts.append(group_df)
     
-    return pd.concat(ts, ignore_index=True).sort_values(by=['Settle date', 'Position name']).reset_index(drop=True)
\ No newline at end of file
+    return pd.concat(ts, ignore_index=True).sort_values(by=['Settle date', 'Position name']).reset_index(drop=True)
+
+def create_daily_summary_with_composite_returns(df):
+    # (1) calculate the weighted, daily return for each position
+    df['Portfolio Return %'] = df['Daily Return %'] * (df['Weight %'] / 100)
+
+    # (2) group positions by settle date
+    daily_summary = create_daily_summary(df)
+
+    # (3) add in composite returns (ITD, Ann. ITD, 1Y, 3Y, 5Y) for the whole portfolio
+    daily_summary['Portfolio Return %'] = daily_summary['Portfolio Return %'].fillna(0)
+
+    # ITD
+    daily_summary['ITD Portfolio Return %'] = 100.0*((1 + daily_summary['Portfolio Return %'] / 100).cumprod() - 1)
+
+    # Ann. ITD
+    first_trade_date = np.datetime64(daily_summary['Settle date'].min(), 'D')
+    daily_summary['Ann. ITD Portfolio Return %'] = 100.0 * ((1 + daily_summary['ITD Portfolio Return %'] / 100) ** (260 / np.maximum(dg.business_day_calendar().busday_count(first_trade_date, daily_summary['Settle date'].values), 1)) - 1)
+
+    # 1Y
+    daily_summary['1Y Portfolio Return %'] = rolling_compound_return(daily_summary['Portfolio Return %'], 260 * 1)
+
+    # 3Y, annualised
+    daily_summary['3Y Portfolio Return %'] = rolling_compound_return(daily_summary['Portfolio Return %'], 260 * 3)
+    daily_summary['3Y Portfolio Return %'] = ((1 + daily_summary['3Y Portfolio Return %'] / 100.0) ** (1/3) - 1) * 100.0
+
+    # 5Y, annualised
+    daily_summary['5Y Portfolio Return %'] = rolling_compound_return(daily_summary['Portfolio Return %'], 260 * 5)
+    daily_summary['5Y Portfolio Return %'] = ((1 + daily_summary['5Y Portfolio Return %'] / 100.0) ** (1/5) - 1) * 100.0
+
+    return daily_summary
@@ -0,0 +1,89 @@
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+# bump when the layout of the stored holdings changes, so older snapshots are rebuilt rather than misread
+SNAPSHOT_VERSION = 1
+
+
+def position_inputs_hash(transactions: pd.DataFrame, income: pd.DataFrame, static: dict) -> str:
+    """Return a hash of everything a position's holdings are built from, other than prices."""
+    digest = hashlib.sha256()
+    digest.update(str(SNAPSHOT_VERSION).encode())
+    for frame in (transactions, income):
+        digest.update(frame.to_csv(index=False).encode())
+    digest.update(json.dumps(static, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+class HoldingsSnapshot:
+    """Persisted per-position outputs of DataFormatting.create_holding_dataframe.
+
+    Each position is stored as a Parquet file, and manifest.json records the hash of the inputs it was built from
+    and the last date it covers. A position whose hash still matches only needs its series extending over the
+    business days after that date, rather than rebuilding from its first transaction.
+    """
+
+    MANIFEST = "manifest.json"
+
+    def __init__(self, snapshot_dir: str) -> None:
+        self._dir = snapshot_dir
+        os.makedirs(snapshot_dir, exist_ok=True)
+        self._manifest = self._load_manifest()
+        self._seen: set[str] = set()
+
+    def _load_manifest(self) -> dict:
+        path = os.path.join(self._dir, self.MANIFEST)
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, "r") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get("version") != SNAPSHOT_VERSION:
+            return {}
+        return manifest.get("positions", {})
+
+    @staticmethod
+    def _file_name(position: str) -> str:
+        # position names are free text, so they are not used as file names directly
+        return hashlib.sha1(position.encode()).hexdigest() + ".parquet"
+
+    def load(self, position: str, inputs_hash: str) -> pd.DataFrame | None:
+        """Return the stored holdings for the position, or None if there are none or they were built from different inputs."""
+        self._seen.add(position)
+        entry = self._manifest.get(position)
+        if entry is None or entry["hash"] != inputs_hash:
+            return None
+        try:
+            return pd.read_parquet(os.path.join(self._dir, entry["file"]))
+        except (OSError, ValueError):
+            return None
+
+    def save(self, position: str, inputs_hash: str, holdings: pd.DataFrame) -> None:
+        self._seen.add(position)
+        file_name = self._file_name(position)
+        holdings.to_parquet(os.path.join(self._dir, file_name), index=False)
+        self._manifest[position] = {
+            "hash": inputs_hash,
+            "file": file_name,
+            "last": holdings["Settle date"].max().date().isoformat(),
+        }
+
+    def flush(self) -> None:
+        """Write the manifest, dropping positions that were not loaded or saved in this run."""
+        for position in [p for p in self._manifest if p not in self._seen]:
+            entry = self._manifest.pop(position)
+            try:
+                os.remove(os.path.join(self._dir, entry["file"]))
+            except OSError:
+                pass
+
+        path = os.path.join(self._dir, self.MANIFEST)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"version": SNAPSHOT_VERSION, "positions": self._manifest}, f, indent=2)
+        os.replace(tmp_path, path)
@@ -1,4 +1,5 @@
 import datetime
+import threading
 from typing import Optional
 from urllib.parse import quote
 
@@ -9,7 +10,16 @@ import requests
 class MarketDataClient:
     def __init__(self, base_url: str = "http://localhost:8000") -> None:
         self._base_url = base_url.rstrip("/")
-        self._session = requests.Session()
+        self._local = threading.local()
+
+    @property
+    def _session(self) -> requests.Session:
+        # requests.Session is not thread-safe, so each worker thread gets its own
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        return session
 
     def resolve_ticker(self, identifier: str) -> Optional[str]:
         """Return the ticker for an ISIN/CUSIP/SEDOL, or None if not found or unresolvable."""
@@ -69,3 +79,60 @@ class MarketDataClient:
         df["Close"] = pd.to_numeric(df["Close"], errors="coerce")
 
         return df
+
+    def get_price_histories(
+        self,
+        requests_: list[tuple[str, datetime.date | datetime.datetime, datetime.date | datetime.datetime]],
+        currency: str = "GBP",
+    ) -> list:
+        """Fetch many price histories in one round trip via the batch history endpoint.
+
+        Takes (ticker, from_date, to_date) tuples and returns one result per request, in order.
+        Each result is a DataFrame as returned by get_price_history, None when the ticker has
+        no data, or a RuntimeError describing why that ticker alone could not be priced.
+        Raises RuntimeError if the batch request itself fails.
+        """
+        items = []
+        for ticker, from_date, to_date in requests_:
+            if isinstance(from_date, datetime.datetime):
+                from_date = from_date.date()
+            if isinstance(to_date, datetime.datetime):
+                to_date = to_date.date()
+            items.append({"ticker": ticker, "from": from_date.isoformat(), "to": to_date.isoformat()})
+
+        if not items:
+            return []
+
+        try:
+            resp = self._session.post(
+                f"{self._base_url}/securities/history:batch",
+                json={"items": items, "currency": currency},
+                timeout=300,
+            )
+            resp.raise_for_status()
+        except requests.RequestException as exc:
+            raise RuntimeError(f"Market data service error for batch of {len(items)} ticker(s): {exc}") from exc
+
+        results = []
+        for entry in resp.json()["entries"]:
+            if entry["status_code"] == 404:
+                results.append(None)
+                continue
+            if entry["status_code"] != 200:
+                detail = (entry.get("error") or {}).get("detail", "")
+                results.append(RuntimeError(
+                    f"Market data service error for {entry['ticker']}: {entry['status_code']} {detail}"
+                ))
+                continue
+
+            prices = entry["history"].get("prices", [])
+            if not prices:
+                results.append(None)
+                continue
+
+            df = pd.DataFrame([{"Settle date": p["date"], "Close": p["close"]} for p in prices])
+            df["Settle date"] = pd.to_datetime(df["Settle date"])
+            df["Close"] = pd.to_numeric(df["Close"], errors="coerce")
+            results.append(df)
+
+        return results
@@ -0,0 +1,66 @@
+import glob
+import importlib.util
+import os
+
+import pandas as pd
+import pyarrow.feather as feather
+
+
+def excel_engine() -> str:
+    """Return the fastest Excel reader available: calamine when python-calamine is installed, otherwise openpyxl."""
+    return "calamine" if importlib.util.find_spec("python_calamine") is not None else "openpyxl"
+
+
+class WorkbookReader:
+    """Reads sheets from a workbook, keeping a Feather copy of each sheet alongside it.
+
+    The copies are keyed on the workbook's modification time and size, so a run against an unchanged workbook loads
+    the sheets from them without parsing the workbook at all. Sheets that are not cached are parsed from the workbook
+    in a single pass.
+    """
+
+    def __init__(self, data_file: str, cache_dir: str | None = None) -> None:
+        self._data_file = data_file
+        self._cache_dir = cache_dir if cache_dir is not None else data_file + ".sheets"
+
+    def _key(self) -> str:
+        stat = os.stat(self._data_file)
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+    def _sidecar(self, sheet: str, key: str) -> str:
+        return os.path.join(self._cache_dir, f"{sheet}.{key}.feather")
+
+    def read_sheets(self, sheets: list[str]) -> dict[str, pd.DataFrame]:
+        key = self._key()
+        frames = {}
+        for sheet in sheets:
+            path = self._sidecar(sheet, key)
+            if os.path.exists(path):
+                try:
+                    frames[sheet] = feather.read_feather(path)
+                except (OSError, ValueError):
+                    pass
+
+        missing = [sheet for sheet in sheets if sheet not in frames]
+        if missing:
+            engine = excel_engine()
+            print(f"Reading sheet(s) {', '.join(missing)} from {self._data_file} using {engine}...")
+            parsed = pd.read_excel(self._data_file, sheet_name=missing, engine=engine)
+            for sheet in missing:
+                frames[sheet] = parsed[sheet]
+                self._write_sidecar(sheet, key, parsed[sheet])
+
+        return {sheet: frames[sheet] for sheet in sheets}
+
+    def _write_sidecar(self, sheet: str, key: str, frame: pd.DataFrame) -> None:
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            # copies taken from earlier versions of the workbook are no longer needed
+            for stale in glob.glob(os.path.join(glob.escape(self._cache_dir), f"{glob.escape(sheet)}.*.feather")):
+                os.remove(stale)
+            path = self._sidecar(sheet, key)
+            feather.write_feather(frame, path + ".tmp")
+            os.replace(path + ".tmp", path)
+        except Exception as exc:
+            # e.g. columns mixing numbers and text, which Arrow cannot store; the sheet is just parsed again next run
+            print(f"   WARNING: Could not cache sheet '{sheet}' of {self._data_file}: {exc}")
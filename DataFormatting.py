@@ -1,5 +1,7 @@
 import pandas as pd
+import numpy as np
 import datetime as dt
+import DataGeneration as dg
 
 
 def create_holding_dataframe(dfTransactions, dfIncome, dsDateSeries, dfClosePrices, positionName, theme):
@@ -8,81 +10,170 @@ def create_holding_dataframe(dfTransactions, dfIncome, dsDateSeries, dfClosePric
         Creates a DataFrame of holdings by merging transactions, income, date series, and close prices.
     """
 
-    # Fold all data in together
-    dfFinal = pd.merge(dsDateSeries, dfTransactions, on='Settle date', how='left').sort_values(by='Settle date')
-    # multiply the 'Value (£)' by the sign of the 'Quantity' to ensure correct direction of values
-    dfFinal['Value (£)'] = dfFinal['Value (£)'] * dfFinal['Quantity'].apply(lambda x: 1.0 if x >= 0.0 else -1.0)
-    dfFinal = dfFinal.groupby('Settle date').agg(
-        Cumulative_Quantity=('Quantity', 'sum'),
-        Cumulative_Value=('Value (£)', 'sum')
-    ).reset_index()
-    dfFinal['Quantity'] = dfFinal['Cumulative_Quantity'].cumsum()
-    dfFinal['Book cost'] = dfFinal['Cumulative_Value'].cumsum()
-    dfFinal = dfFinal.drop(columns=['Cumulative_Quantity','Cumulative_Value'], errors='ignore')
+    # Every input is aggregated by date and reindexed onto the (sorted, distinct) dates of the series, so anything
+    # dated outside the series is dropped, as with the left merges this replaced
+    dates = pd.Index(dsDateSeries['Settle date']).dropna().unique().sort_values()
+
+    # multiply the 'Value (£)' by the sign of the 'Quantity' to ensure correct direction of values (a zero quantity counts as positive)
+    dfTrades = pd.DataFrame({
+        'Settle date': dfTransactions['Settle date'],
+        'Quantity': dfTransactions['Quantity'],
+        'Book cost': dfTransactions['Value (£)'] * np.where(dfTransactions['Quantity'] >= 0.0, 1.0, -1.0),
+    })
+    dfFinal = dfTrades.groupby('Settle date').sum().reindex(dates, fill_value=0).cumsum()
     # (1) we want (Settle date, Quantity, Book Cost) over all dates
 
-    # alias dfIncome columns
-    dfIncome = dfIncome.groupby('Settle date').agg(
-        Income_Qty=('Quantity', 'sum'),
-        Income=('Value (£)', 'sum')
-    ).reset_index()
-    dfIncome = dfIncome.rename(columns={'Income_Qty': 'Income Qty'})
-    
-    dfFinal = pd.merge(dfFinal, dfIncome, on='Settle date', how='left').fillna(0)
+    dfIncome = dfIncome.groupby('Settle date')[['Quantity', 'Value (£)']].sum().reindex(dates, fill_value=0)
+    dfFinal['Income Qty'] = dfIncome['Quantity']
+    dfFinal['Income'] = dfIncome['Value (£)']
     # (2) we want (Settle date, Quantity, Book Cost, Income Qty, Income) over all dates
 
-    dfFinal = pd.merge(dfFinal, dfClosePrices, on='Settle date', how='left').ffill()
+    # carry the last close forward over dates with no price; dates before the first price have a close of zero
+    dsClose = dfClosePrices.set_index('Settle date')['Close']
+    dsClose = dsClose[~dsClose.index.duplicated(keep='last')]
+    dfFinal['Close'] = dsClose.reindex(dates).ffill().fillna(0)
     # (3) we want (Settle date, Quantity, Book Cost, Income Qty, Income, Close) over all dates
 
     # Add in capital
-    dfLodgements = dfTransactions[dfTransactions['Reference'].str.startswith('L')][['Settle date', 'Value (£)']].rename(columns={'Value (£)': 'Capital'})
-    dfSubscriptions = dfTransactions[dfTransactions['Reference'].str.lower().isin(['fpc', 'card web', 'contrib', 'bacs'])][['Settle date', 'Value (£)']].rename(columns={'Value (£)': 'Capital'})
-    
-    if dfLodgements.empty:
-        dfLodgements = pd.DataFrame(columns=['Settle date', 'Capital'])
-    if dfSubscriptions.empty:
-        dfSubscriptions = pd.DataFrame(columns=['Settle date', 'Capital'])
-
-    dfCapital = pd.concat([dfLodgements, dfSubscriptions], ignore_index=True, sort=False).groupby('Settle date').agg(
-        Capital=('Capital', 'sum')
-    ).reset_index()
-
-    dfFinal = dfFinal.infer_objects(copy=False)
-    dfCapital = dfCapital.infer_objects(copy=False)
-    dfFinal = pd.merge(dfFinal, dfCapital, on='Settle date', how='left').fillna(0)
-    dfFinal['Capital'] = dfFinal['Capital'].cumsum()
+    dfLodgements = dfTransactions[dfTransactions['Reference'].str.startswith('L')]
+    dfSubscriptions = dfTransactions[dfTransactions['Reference'].str.lower().isin(['fpc', 'card web', 'contrib', 'bacs'])]
+    dfCapital = pd.concat([dfLodgements, dfSubscriptions])[['Settle date', 'Value (£)']]
+    dfFinal['Capital'] = dfCapital.groupby('Settle date')['Value (£)'].sum().reindex(dates, fill_value=0).cumsum()
 
     # Filter negative quantities - we dont go short here
-    dfFinal['Quantity'] = dfFinal['Quantity'].apply(lambda x: max(x, 0))
+    dfFinal['Quantity'] = np.clip(dfFinal['Quantity'], 0, None)
 
     # Calculate derived columns
     dfFinal['Market value'] = dfFinal['Quantity'] * dfFinal['Close']
     dfFinal['Day PnL'] = dfFinal['Market value'].diff().fillna(0)
-    dfFinal['ITD PnL'] = dfFinal['Day PnL'] + dfFinal['Income']
-    dfFinal['ITD PnL'] = dfFinal['ITD PnL'].cumsum()
+    dfFinal['ITD PnL'] = (dfFinal['Day PnL'] + dfFinal['Income']).cumsum()
+
+    # Ensure numeric columns are in the correct format
+    numeric_columns = ['Capital', 'Quantity', 'Book cost', 'Income Qty', 'Income', 'Close', 'Market value', 'Day PnL', 'ITD PnL']
+    dfFinal = dfFinal[numeric_columns].astype('float')
 
-    # Add static columns
-    dfFinal['Position name'] = positionName
-    dfFinal['Theme'] = theme
+    # Add static columns, then reorder columns
+    dfFinal.insert(0, 'Settle date', pd.to_datetime(dates))
+    dfFinal.insert(1, 'Position name', str(positionName))
+    dfFinal.insert(2, 'Theme', str(theme))
 
-    # reorder colummns
-    dfFinal = dfFinal[['Settle date', 'Position name', 'Theme', 'Capital', 'Quantity', 'Book cost', 'Income Qty', 'Income', 'Close', 
-                       'Market value', 'Day PnL', 'ITD PnL']]   
+    # Return results
+    return dfFinal.reset_index(drop=True)
 
-    # Ensure the 'Settle date' is in datetime format
-    dfFinal['Settle date'] = pd.to_datetime(dfFinal['Settle date'])
 
-    # Ensure the 'Position name' is a string
-    dfFinal['Position name'] = dfFinal['Position name'].astype(str)
-    dfFinal['Theme'] = dfFinal['Theme'].astype(str)
+def create_portfolio_holdings(dfPositions, dfTransactions, dfIncome, dfClosePrices):
+    """
+        create_portfolio_holdings
+        Creates the holdings of every position at once, as create_holding_dataframe would for each position over the
+        business days from its 'First date' to its 'Last date', concatenated in the order of dfPositions.
+
+        dfPositions has a row per position ('Position name', 'Theme', 'First date', 'Last date'). The transactions,
+        income and close prices are long frames with a 'Position name' column, and rows for positions not in
+        dfPositions are ignored.
+    """
+    names = pd.Index(dfPositions['Position name'])
+    themes = dfPositions['Theme'].astype(str).to_numpy()
+
+    # (date x position) grid: each position's business days, laid out one position after another
+    first = pd.to_datetime(dfPositions['First date']).to_numpy().astype('datetime64[D]')
+    last = pd.to_datetime(dfPositions['Last date']).to_numpy().astype('datetime64[D]')
+    calendar = dg.business_day_calendar()
+    first_ordinals = calendar.ordinals(first)
+    counts = np.maximum(calendar.ordinals(last + np.timedelta64(1, 'D')) - first_ordinals, 0)
+    codes = np.repeat(np.arange(len(names)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    dates = calendar.dates(np.repeat(first_ordinals, counts) + offsets)
+    grid = pd.MultiIndex.from_arrays([codes, dates], names=['Position', 'Settle date'])
+
+    def on_grid(df, values):
+        # sums the values by (position, date) onto the grid; anything off the grid is dropped and gaps are zero
+        df = df.assign(Position=names.get_indexer(df['Position name']), **{'Settle date': pd.to_datetime(df['Settle date']).astype('datetime64[ns]')})
+        return df[df['Position'] >= 0].groupby(['Position', 'Settle date'])[values].sum().reindex(grid, fill_value=0)
+
+    # multiply the 'Value (£)' by the sign of the 'Quantity' to ensure correct direction of values (a zero quantity counts as positive)
+    dfTrades = dfTransactions.assign(**{'Book cost': dfTransactions['Value (£)'] * np.where(dfTransactions['Quantity'] >= 0.0, 1.0, -1.0)})
+    dfFinal = on_grid(dfTrades, ['Quantity', 'Book cost']).groupby(level='Position').cumsum()
+
+    dfIncome = on_grid(dfIncome, ['Quantity', 'Value (£)'])
+    dfFinal['Income Qty'] = dfIncome['Quantity']
+    dfFinal['Income'] = dfIncome['Value (£)']
+
+    # carry each position's last close forward over dates with no price; dates before its first price have a close of zero
+    dfPrices = dfClosePrices.assign(Position=names.get_indexer(dfClosePrices['Position name']), **{'Settle date': pd.to_datetime(dfClosePrices['Settle date']).astype('datetime64[ns]')})
+    dfPrices = dfPrices[dfPrices['Position'] >= 0].set_index(['Position', 'Settle date'])['Close']
+    dfPrices = dfPrices[~dfPrices.index.duplicated(keep='last')]
+    dfFinal['Close'] = dfPrices.reindex(grid).groupby(level='Position').ffill().fillna(0)
+
+    # Add in capital
+    dfLodgements = dfTransactions[dfTransactions['Reference'].str.startswith('L')]
+    dfSubscriptions = dfTransactions[dfTransactions['Reference'].str.lower().isin(['fpc', 'card web', 'contrib', 'bacs'])]
+    dfFinal['Capital'] = on_grid(pd.concat([dfLodgements, dfSubscriptions]), 'Value (£)').groupby(level='Position').cumsum()
+
+    # Filter negative quantities - we dont go short here
+    dfFinal['Quantity'] = np.clip(dfFinal['Quantity'], 0, None)
+
+    # Calculate derived columns
+    dfFinal['Market value'] = dfFinal['Quantity'] * dfFinal['Close']
+    dfFinal['Day PnL'] = dfFinal['Market value'].groupby(level='Position').diff().fillna(0)
+    dfFinal['ITD PnL'] = (dfFinal['Day PnL'] + dfFinal['Income']).groupby(level='Position').cumsum()
 
     # Ensure numeric columns are in the correct format
-    numeric_columns = ['Quantity', 'Capital', 'Book cost', 'Income Qty', 'Income', 'Close', 'Market value', 'Day PnL', 'ITD PnL']
-    for col in numeric_columns:     
-        dfFinal[col] = pd.to_numeric(dfFinal[col], errors='coerce').astype('float')
+    numeric_columns = ['Capital', 'Quantity', 'Book cost', 'Income Qty', 'Income', 'Close', 'Market value', 'Day PnL', 'ITD PnL']
+    dfFinal = dfFinal[numeric_columns].astype('float')
+
+    # Add static columns, then reorder columns
+    dfFinal.insert(0, 'Settle date', dates)
+    dfFinal.insert(1, 'Position name', names.astype(str).to_numpy(dtype=object)[codes])
+    dfFinal.insert(2, 'Theme', themes.astype(object)[codes])
 
     # Return results
-    return dfFinal
+    return dfFinal.reset_index(drop=True)
+
+
+def extend_holding_dataframe(dfHolding, dsNewDates, dfClosePrices):
+    """
+        extend_holding_dataframe
+        Appends the dates in dsNewDates to a DataFrame from create_holding_dataframe, without rebuilding it from the
+        first transaction. Only valid when no transactions or income fall on the new dates, so quantity, book cost
+        and capital carry forward unchanged and only the close price moves.
+    """
+    dsNewDates = dsNewDates[dsNewDates['Settle date'] > dfHolding['Settle date'].max()]
+    if dsNewDates.empty:
+        return dfHolding
+
+    last = dfHolding.iloc[-1]
+
+    dfNew = pd.merge(dsNewDates[['Settle date']], dfClosePrices[['Settle date', 'Close']], on='Settle date', how='left')
+    for col in ('Position name', 'Theme', 'Capital', 'Quantity', 'Book cost'):
+        dfNew[col] = last[col]
+    dfNew['Income Qty'] = 0.0
+    dfNew['Income'] = 0.0
+
+    # run the derived columns on from the last stored row, in the same order of operations as the full build
+    dfNew = pd.concat([dfHolding.iloc[[-1]], dfNew], ignore_index=True)
+    dfNew['Close'] = pd.to_numeric(dfNew['Close'], errors='coerce').astype('float').ffill()
+    dfNew['Market value'] = dfNew['Quantity'] * dfNew['Close']
+    dfNew['Day PnL'] = dfNew['Market value'].diff()
+    dfNew.loc[1:, 'ITD PnL'] = (dfNew['Day PnL'] + dfNew['Income']).iloc[1:]
+    dfNew['ITD PnL'] = dfNew['ITD PnL'].cumsum()
+    dfNew = dfNew.iloc[1:]
+
+    dfNew = dfNew[dfHolding.columns].astype(dfHolding.dtypes.to_dict())
+    return pd.concat([dfHolding, dfNew], ignore_index=True)
+
+
+def partition_by_position(df, column='Position Name'):
+    """
+        partition_by_position
+        Splits a ledger into one DataFrame per distinct value of column, keyed by that value. The ledger is sorted by
+        position once (stably, so each position keeps its rows in ledger order) and each position is a contiguous
+        slice of it, rather than a boolean mask over the whole ledger per position. Rows with no position are dropped.
+    """
+    codes, names = pd.factorize(df[column])
+    order = np.argsort(codes, kind='stable')
+    dfSorted = df.take(order)
+    bounds = np.searchsorted(codes[order], np.arange(len(names) + 1))
+    return {name: dfSorted.iloc[bounds[i]:bounds[i + 1]] for i, name in enumerate(names)}
 
 
 def create_portfolio(dfHoldings):
@@ -94,6 +185,33 @@ def create_portfolio(dfHoldings):
 
 
 
+def compact_portfolio(df, float32_columns=()):
+    """
+        compact_portfolio
+        Returns the portfolio DataFrame with 'Position name' and 'Theme' held as categoricals rather than a string
+        object per row. Any columns in float32_columns are narrowed to float32, which halves their size but keeps
+        only ~7 significant digits, so it is only suitable for columns that are displayed rather than calculated on.
+    """
+    dtypes = {col: 'category' for col in ('Position name', 'Theme') if col in df.columns}
+    dtypes.update({col: 'float32' for col in float32_columns})
+    return df.astype(dtypes)
+
+
+def memory_usage_report(before, after):
+    """
+        memory_usage_report
+        Compares the in-memory size of each column of two versions of a DataFrame, in bytes.
+    """
+    report = pd.DataFrame({
+        'Before dtype': before.dtypes.astype(str),
+        'Before bytes': before.memory_usage(index=False, deep=True),
+        'After dtype': after.dtypes.astype(str),
+        'After bytes': after.memory_usage(index=False, deep=True),
+    })
+    report.loc['Total'] = ['', report['Before bytes'].sum(), '', report['After bytes'].sum()]
+    return report
+
+
 def drop_unwanted_columns(df, columns_to_keep):
     """
     Drops any column not in the specified list from the DataFrame.
@@ -1,11 +1,100 @@
 import pandas as pd
+import numpy as np
+
+# ordinals count business days from this date, so they are the same however far the calendar has been extended
+_ORDINAL_EPOCH = np.datetime64('1970-01-01', 'D')
+
+class BusinessDayCalendar:
+    """
+        BusinessDayCalendar
+        Weekdays, less any holidays, precomputed as an index of dates together with each date's ordinal (the number of
+        business days before it since 1970-01-01). Date series are slices of that index and business-day counts are
+        differences between ordinals, so neither is rebuilt for every position or report. The index covers the dates
+        asked for so far and is extended, with some slack, when a date outside it is used.
+
+        holidays is optional: a list of dates, or a pandas holiday calendar (e.g. USFederalHolidayCalendar()), whose
+        holidays are resolved once over its whole span. Without it the calendar matches freq='B' and np.busday_count.
+    """
+
+    # slack added either side when the index is extended, so that nearby dates do not each extend it again
+    PADDING = np.timedelta64(5 * 366, 'D')
+
+    def __init__(self, holidays=None):
+        if holidays is not None and hasattr(holidays, 'holidays'):
+            holidays = holidays.holidays()
+        holidays = np.unique(np.asarray([] if holidays is None else holidays, dtype='datetime64[D]'))
+        # a weekday-only calendar passes no busdaycalendar at all, keeping numpy on its default path
+        self._busdaycal = {'busdaycal': np.busdaycalendar(holidays=holidays)} if len(holidays) else {}
+        self._days = np.empty(0, dtype='datetime64[D]')
+        self._index = pd.DatetimeIndex([])
+        self._before = np.empty(0, dtype='int64')
+        self._first_ordinal = 0
+
+    def _cover(self, lo, hi):
+        if len(self._days) and self._start <= lo and hi <= self._end:
+            return
+        start = lo - self.PADDING if not len(self._days) else min(lo - self.PADDING, self._start)
+        end = hi + self.PADDING if not len(self._days) else max(hi + self.PADDING, self._end)
+        days = np.arange(start, end + np.timedelta64(1, 'D'), dtype='datetime64[D]')
+        is_busday = np.is_busday(days, **self._busdaycal)
+        self._start, self._end = start, end
+        self._days = days[is_busday]
+        # for every calendar day covered, the business days before it, so an ordinal is a single array lookup
+        self._before = np.cumsum(is_busday) - is_busday
+        self._index = pd.DatetimeIndex(self._days.astype('datetime64[ns]'))
+        self._first_ordinal = int(np.busday_count(_ORDINAL_EPOCH, start, **self._busdaycal))
+
+    def ordinals(self, dates):
+        """Business days before each date since 1970-01-01; a non-business day has the ordinal of the business day after it."""
+        dates = np.asarray(dates, dtype='datetime64[D]')
+        if dates.size:
+            self._cover(dates.min(), dates.max())
+        return self._first_ordinal + self._before[(dates - self._start).astype('int64')]
+
+    def dates(self, ordinals) -> np.ndarray:
+        """The business day with each ordinal, as datetime64[ns]."""
+        ordinals = np.asarray(ordinals, dtype='int64')
+        if ordinals.size:
+            # roughly seven days per five business days from the epoch, extended further if holidays push them out
+            self._cover(_ORDINAL_EPOCH + np.timedelta64(int(ordinals.min()) * 7 // 5 - 7, 'D'),
+                        _ORDINAL_EPOCH + np.timedelta64(int(ordinals.max()) * 7 // 5 + 7, 'D'))
+            while ordinals.min() < self._first_ordinal or ordinals.max() >= self._first_ordinal + len(self._days):
+                self._cover(self._start - self.PADDING, self._end + self.PADDING)
+        return self._index.values[ordinals - self._first_ordinal]
+
+    def date_range(self, start_date, end_date) -> pd.DatetimeIndex:
+        """The business days from start_date to end_date inclusive, as pd.date_range(freq='B') would give without holidays."""
+        start, end = self.ordinals([start_date, np.datetime64(end_date, 'D') + np.timedelta64(1, 'D')])
+        return self._index[start - self._first_ordinal:max(start, end) - self._first_ordinal]
+
+    def busday_count(self, begin_dates, end_dates):
+        """Business days from begin_dates up to but excluding end_dates, as np.busday_count."""
+        begin_dates = np.asarray(begin_dates, dtype='datetime64[D]')
+        end_dates = np.asarray(end_dates, dtype='datetime64[D]')
+        # like np.busday_count, a count backwards excludes the begin date and includes the end date instead
+        shift = (end_dates < begin_dates).astype('timedelta64[D]')
+        return self.ordinals(end_dates + shift) - self.ordinals(begin_dates + shift)
+
+
+_calendars = {}
+
+def business_day_calendar(holidays=None) -> BusinessDayCalendar:
+    # one shared calendar per set of holidays, so every caller reuses the same precomputed index. A holiday calendar
+    # is keyed on the dates it resolves to, as calendars of one class can differ in their rules or span
+    if holidays is not None and hasattr(holidays, 'holidays'):
+        holidays = holidays.holidays()
+    key = None if holidays is None else tuple(np.unique(np.asarray(holidays, dtype='datetime64[D]')).tolist())
+    calendar = _calendars.get(key)
+    if calendar is None:
+        calendar = _calendars[key] = BusinessDayCalendar(holidays)
+    return calendar
 
 # create a python function to create a time series of dates from a start date to an end date skipping weekends and holidays
-def create_date_series(start_date, end_date):
-    # Create a date range excluding weekends
-    date_range = pd.date_range(start=start_date, end=end_date, freq='B')
-    
+def create_date_series(start_date, end_date, calendar: BusinessDayCalendar = None):
+    # Slice the business days from the shared calendar (weekdays only unless a holiday calendar is given)
+    date_range = (calendar or business_day_calendar()).date_range(start_date, end_date)
+
     # Convert to a DataFrame
-    date_series = pd.DataFrame(date_range, columns=['Settle date'])
-    
-    return date_series
\ No newline at end of file
+    date_series = pd.DataFrame({'Settle date': date_range})
+
+    return date_series
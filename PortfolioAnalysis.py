@@ -18,10 +18,16 @@ import datetime as dt
 import AnalysisFuncs as af
 import DataFormatting
 import DataGeneration as dg
-from Reports import DailyDetails, MonthlySummary, QuarterlySummary, DailySummary, MultiReport, AnnualSummary,ForwardProjection,CurrentHoldings,PeriodicPerformance
+from Reports import BaseReport, DailyDetails, MonthlySummary, QuarterlySummary, DailySummary, MultiReport, AnnualSummary,ForwardProjection,CurrentHoldings,PeriodicPerformance
 import pandas as pd
 from Data.MarketDataClient import MarketDataClient
+from Data.HoldingsSnapshot import HoldingsSnapshot, position_inputs_hash
+from Data.WorkbookReader import WorkbookReader
 import json
+from concurrent.futures import ThreadPoolExecutor
+
+# number of positions whose price histories are requested from the market data service in one batch request
+HISTORY_BATCH_SIZE = 10
 
 report_types = {
     "DailyDetails": DailyDetails.DailyDetailsReport(),
@@ -43,167 +49,306 @@ report_types = {
     ])
 }
 
-# select the type of report to use by inspecting the command line arguments
-report=None
-if len(sys.argv) > 1 and sys.argv[1] in report_types:   
-    report = report_types[sys.argv[1]]
-
-if report is None:
-    print("Please specify a valid report type as the first argument:")
-    print("Options are: " + ", ".join(report_types.keys()))
-    sys.exit(1)
-
-print(f"Selected report: {report.report_name()}")
-
-# extract params
-kv_args = sys.argv[2:]  # Skip script name and first argument
-params = dict(arg.split('=', 1) for arg in kv_args if '=' in arg)
-print(f"Parameters: {params}")
-
-# decode params
-data_file = params.get('data_file')
-static_file = params.get('static_file')
-trans_sheet = params.get('transactions_sheet', 'Transactions')
-income_sheet = params.get('income_sheet', 'Income')
-output_file = params.get('output_file', 'output.csv')
-api_url = params.get('api_url', 'http://localhost:8000')
-
-df = pd.read_excel(data_file, sheet_name=trans_sheet)
-dfIncome = pd.read_excel(data_file, sheet_name=income_sheet)
-
-if static_file is None:
-    print("Error: static_file parameter is required.")
-    sys.exit(1)
-
-with open(static_file, 'r') as f:
-    static_data = json.load(f)
-position_lookup = {item["name"]: item for item in static_data}
-
-# get distinct values from the 'Position Name' column except for values equal to "Cash"
-distinct_positions = df['Position Name'].unique()
-frames = []
-market_data_errors = []
-
-client = MarketDataClient(api_url)
-
-for position in distinct_positions:
-    static = position_lookup.get(position, {})
-    if static.get("ignore", False):
-        print(f"Skipping ignored position: {position}")
-        continue
-    print(' ')
-    print('================================')
-    print(f"Processing... Name: {position}, Isin: {static.get('isin','')}, Ticker: {static.get('ticker','')}")
-
-    if static.get("ticker"):
-        ticker = static.get("ticker")
-    else:
+def render_charts():
+    # Charts mode: render the charts deferred by an earlier run with charts=defer and the same output_file, without
+    # reading any portfolio data or calling the market data service
+    params = dict(arg.split('=', 1) for arg in sys.argv[2:] if '=' in arg)
+    print(f"Parameters: {params}")
+    output_file = params.get('output_file', 'output.csv')
+    # one by default, as rendering in order draws every chart exactly as the report would have done
+    workers = int(params.get('render_workers', 1))
+    rendered = BaseReport.render_deferred_charts(output_file, workers)
+    print(f"Rendered {rendered} chart(s)")
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "Charts":
+        render_charts()
+        return
+
+    # select the type of report to use by inspecting the command line arguments
+    report=None
+    if len(sys.argv) > 1 and sys.argv[1] in report_types:   
+        report = report_types[sys.argv[1]]
+
+    if report is None:
+        print("Please specify a valid report type as the first argument:")
+        print("Options are: " + ", ".join(report_types.keys()) + ", Charts")
+        sys.exit(1)
+
+    print(f"Selected report: {report.report_name()}")
+
+    # extract params
+    kv_args = sys.argv[2:]  # Skip script name and first argument
+    params = dict(arg.split('=', 1) for arg in kv_args if '=' in arg)
+    print(f"Parameters: {params}")
+
+    # decode params
+    data_file = params.get('data_file')
+    static_file = params.get('static_file')
+    trans_sheet = params.get('transactions_sheet', 'Transactions')
+    income_sheet = params.get('income_sheet', 'Income')
+    output_file = params.get('output_file', 'output.csv')
+    api_url = params.get('api_url', 'http://localhost:8000')
+
+    sheets = WorkbookReader(data_file, params.get('workbook_cache_dir')).read_sheets([trans_sheet, income_sheet])
+    df = sheets[trans_sheet]
+    dfIncome = sheets[income_sheet]
+
+    if static_file is None:
+        print("Error: static_file parameter is required.")
+        sys.exit(1)
+
+    with open(static_file, 'r') as f:
+        static_data = json.load(f)
+    position_lookup = {item["name"]: item for item in static_data}
+
+    # get distinct values from the 'Position Name' column except for values equal to "Cash"
+    distinct_positions = df['Position Name'].unique()
+
+    # split the ledgers by position once, rather than scanning them for every position
+    transactions_by_position = DataFormatting.partition_by_position(df)
+    income_by_position = DataFormatting.partition_by_position(dfIncome)
+    no_income = dfIncome.iloc[0:0]
+    frames = []
+    market_data_errors = []
+
+    client = MarketDataClient(api_url)
+    max_workers = int(params.get('max_workers', 8))
+
+    # opt-in: snapshot_dir=<dir> persists each position's holdings, so later runs only build what has changed
+    snapshot_dir = params.get('snapshot_dir')
+    snapshot = HoldingsSnapshot(snapshot_dir) if snapshot_dir else None
+
+    def resolve_position_ticker(static):
+        # returns the ticker to price the position with, plus a note on how it was derived
+        if static.get("ticker"):
+            return static.get("ticker"), None
+
         ident = static.get("isin", "")
-        if ident:
-            resolved = client.resolve_ticker(ident)
-            if resolved is not None:
-                ticker = resolved
-                print(f"   Translated {ident} to ticker {ticker}")
-            else:
-                ticker = ident  # use identifier directly (e.g. FX tickers like GBP=)
-                print(f"   Could not resolve {ident} via identifier service, using as ticker directly")
-        else:
-            ticker = "N/A"
-
-    identifier = static.get("isin") or static.get("ticker") or "N/A"
-
-    df2 = df[df['Position Name'] == position]
-
-    df3 = af.cumulative_by_settle_date(df2)
-    df3['Position Name'] = position
-    df3['ISIN']= static.get("isin", "")
-    df3['Ticker'] = ticker
-
-    positionFirstTran = pd.to_datetime(df3['Settle date']).min()
-    positionLastTran = pd.to_datetime(df3['Settle date']).max()
-    if df3['Cm.Qty'].iloc[-1] != 0:
-        positionLastTran = dt.datetime.today().date() - pd.tseries.offsets.BDay(2) # assume data is up to 2 business days old in YFinance API
-
-    ds = dg.create_date_series(positionFirstTran, positionLastTran)
-
-    # hack for new positions where we dont get the 2BD history yet
-    if positionFirstTran > dt.datetime.today().date() - pd.tseries.offsets.BDay(2):
-        print(f"   Skipping inclusion of new position '{position}' with insufficient history. Need at least 2 business days of history, looking for data from {positionFirstTran}.")
-        continue
-
-    try:
-        if ticker == "N/A" and position.lower() == "cash":
-            ts = ds[["Settle date"]].copy()
-            ts["Close"] = 1.0
-        else:
-            ts = client.get_price_history(ticker, positionFirstTran, positionLastTran)
-            if ts is None:
-                print(f"   WARNING: No market data returned for '{position}' (ticker: {ticker}). Skipping.")
-                market_data_errors.append({"Position": position, "Identifier": identifier, "Ticker": ticker, "Error Code": "404", "Message": "No market data found"})
-                continue
-
-        transactions = df[df['Position Name'] == position][['Settle date', 'Reference', 'Adj Qty', 'Value (£)']].rename(columns={'Adj Qty': 'Quantity'})
+        if not ident:
+            return "N/A", None
+
+        resolved = client.resolve_ticker(ident)
+        if resolved is not None:
+            return resolved, f"   Translated {ident} to ticker {resolved}"
+
+        # use identifier directly (e.g. FX tickers like GBP=)
+        return ident, f"   Could not resolve {ident} via identifier service, using as ticker directly"
+
+    # (1) work out which positions need pricing, and over which dates
+    pending = []
+    for position in distinct_positions:
+        static = position_lookup.get(position, {})
+        if static.get("ignore", False):
+            print(f"Skipping ignored position: {position}")
+            continue
+
+        position_transactions = transactions_by_position.get(position, df.iloc[0:0])
+        df3 = af.cumulative_by_settle_date(position_transactions)
+
+        positionFirstTran = pd.to_datetime(df3['Settle date']).min()
+        positionLastTran = pd.to_datetime(df3['Settle date']).max()
+        if df3['Cm.Qty'].iloc[-1] != 0:
+            positionLastTran = dt.datetime.today().date() - pd.tseries.offsets.BDay(2) # assume data is up to 2 business days old in YFinance API
+
+        # hack for new positions where we dont get the 2BD history yet
+        if positionFirstTran > dt.datetime.today().date() - pd.tseries.offsets.BDay(2):
+            print(f"   Skipping inclusion of new position '{position}' with insufficient history. Need at least 2 business days of history, looking for data from {positionFirstTran}.")
+            continue
+
+        transactions = position_transactions[['Settle date', 'Reference', 'Adj Qty', 'Value (£)']].rename(columns={'Adj Qty': 'Quantity'})
         transactions['Value (£)'] = transactions['Value (£)'].abs()
 
-        income = dfIncome[dfIncome['Position Name'] == position][['Settle date', 'Quantity', 'Value (£)']]
-
-        theme = static.get("theme", "n/a")
-
-        PositionDf = DataFormatting.create_holding_dataframe(
-            transactions,
-            income,
-            ds,
-            ts,
-            position,
-            theme
+        income = income_by_position.get(position, no_income)[['Settle date', 'Quantity', 'Value (£)']]
+
+        item = {
+            "position": position,
+            "static": static,
+            "first": positionFirstTran,
+            "last": positionLastTran,
+            "identifier": static.get("isin") or static.get("ticker") or "N/A",
+            "transactions": transactions,
+            "income": income,
+            "stored": None,
+        }
+
+        if snapshot is not None:
+            item["hash"] = position_inputs_hash(transactions, income, static)
+            stored = snapshot.load(position, item["hash"])
+            if stored is not None:
+                storedLast = stored['Settle date'].max()
+                if storedLast >= pd.Timestamp(positionLastTran):
+                    # nothing new since the snapshot was taken
+                    item["stored"] = stored[stored['Settle date'] <= pd.Timestamp(positionLastTran)]
+                    item["from"] = None
+                elif pd.to_datetime(pd.concat([transactions['Settle date'], income['Settle date']])).max() <= storedLast:
+                    # only new days of prices since the snapshot, so it can be extended. The request starts on the
+                    # last stored day, not the day after: the service back-fills days before its first price, so a
+                    # first new day with no price (e.g. a bank holiday) would otherwise take the next day's close
+                    # rather than carrying the last one forward as a full rebuild does. The stored day is dropped again
+                    # by extend_holding_dataframe.
+                    item["stored"] = stored
+                    item["from"] = storedLast
+
+        pending.append(item)
+
+    # (2) resolve identifiers concurrently, then pull the price histories in batch requests, several at a time
+    up_to_date = [item for item in pending if item["stored"] is not None and item["from"] is None]
+    to_fetch = [item for item in pending if item["stored"] is None or item["from"] is not None]
+    for item in up_to_date:
+        item["ticker"] = item["static"].get("ticker") or item["identifier"]
+        item["note"] = "   Up to date in holdings snapshot"
+        item["cash"] = False
+    if snapshot is not None:
+        print(f"Holdings snapshot: {len(up_to_date)} position(s) up to date, {sum(1 for item in to_fetch if item['stored'] is not None)} to extend, {sum(1 for item in to_fetch if item['stored'] is None)} to build")
+
+    def fetch_batch(batch):
+        try:
+            return client.get_price_histories([(item["ticker"], item["from"] if item["stored"] is not None else item["first"], item["last"]) for item in batch])
+        except RuntimeError as exc:
+            # the whole batch failed, so each of its positions reports the same error
+            return [exc] * len(batch)
+
+    print(f"Fetching market data for {len(to_fetch)} position(s) using {max_workers} worker(s)...")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for item, (ticker, note) in zip(to_fetch, executor.map(lambda p: resolve_position_ticker(p["static"]), to_fetch)):
+            item["ticker"] = ticker
+            item["note"] = note
+            item["cash"] = ticker == "N/A" and item["position"].lower() == "cash"
+
+        # each batch has its own timeout, so a slow or failed batch only affects its own positions
+        priced = [item for item in to_fetch if not item["cash"]]
+        batches = [priced[i:i + HISTORY_BATCH_SIZE] for i in range(0, len(priced), HISTORY_BATCH_SIZE)]
+        for batch, histories in zip(batches, executor.map(fetch_batch, batches)):
+            for item, history in zip(batch, histories):
+                item["history"] = history
+
+    # (3) build the daily holdings: positions in the snapshot are extended one at a time, and every other
+    # position is built together in one pass over the whole portfolio
+    to_build = []
+    for item in pending:
+        position = item["position"]
+        static = item["static"]
+        ticker = item["ticker"]
+        identifier = item["identifier"]
+        positionFirstTran = item["first"]
+        positionLastTran = item["last"]
+
+        print(' ')
+        print('================================')
+        print(f"Processing... Name: {position}, Isin: {static.get('isin','')}, Ticker: {static.get('ticker','')}")
+        if item["note"]:
+            print(item["note"])
+
+        if item["stored"] is not None and item["from"] is None:
+            frames.append(item["stored"])
+            continue
+
+        try:
+            if item["cash"]:
+                ts = dg.create_date_series(positionFirstTran, positionLastTran)
+                ts["Close"] = 1.0
+            else:
+                ts = item["history"]
+                if isinstance(ts, RuntimeError):
+                    raise ts
+                if ts is None and item["stored"] is not None:
+                    # no prices published since the snapshot, so the last close carries forward
+                    ts = pd.DataFrame({'Settle date': pd.Series(dtype='datetime64[ns]'), 'Close': pd.Series(dtype='float')})
+                if ts is None:
+                    print(f"   WARNING: No market data returned for '{position}' (ticker: {ticker}). Skipping.")
+                    market_data_errors.append({"Position": position, "Identifier": identifier, "Ticker": ticker, "Error Code": "404", "Message": "No market data found"})
+                    continue
+
+            if item["stored"] is not None:
+                PositionDf = DataFormatting.extend_holding_dataframe(item["stored"], dg.create_date_series(positionFirstTran, positionLastTran), ts)
+                if snapshot is not None:
+                    snapshot.save(position, item["hash"], PositionDf)
+                frames.append(PositionDf)
+            else:
+                item["prices"] = ts
+                to_build.append(item)
+
+        except RuntimeError as exc:
+            print(f"   WARNING: Market data service error for '{position}' (ticker: {ticker}): {exc}. Skipping.")
+            market_data_errors.append({"Position": position, "Identifier": identifier, "Ticker": ticker, "Error Code": "ERROR", "Message": str(exc)})
+            continue
+
+    if to_build:
+        print(' ')
+        print(f"Building holdings for {len(to_build)} position(s)...")
+        built = DataFormatting.create_portfolio_holdings(
+            pd.DataFrame({
+                'Position name': [item["position"] for item in to_build],
+                'Theme': [item["static"].get("theme", "n/a") for item in to_build],
+                'First date': [item["first"] for item in to_build],
+                'Last date': [item["last"] for item in to_build],
+            }),
+            df[['Settle date', 'Position Name', 'Reference', 'Adj Qty', 'Value (£)']].rename(columns={'Position Name': 'Position name', 'Adj Qty': 'Quantity'}).assign(**{'Value (£)': df['Value (£)'].abs()}),
+            dfIncome[['Settle date', 'Position Name', 'Quantity', 'Value (£)']].rename(columns={'Position Name': 'Position name'}),
+            pd.concat([item["prices"][['Settle date', 'Close']].assign(**{'Position name': item["position"]}) for item in to_build], ignore_index=True)
         )
-
-        frames.append(PositionDf)
-
-    except RuntimeError as exc:
-        print(f"   WARNING: Market data service error for '{position}' (ticker: {ticker}): {exc}. Skipping.")
-        market_data_errors.append({"Position": position, "Identifier": identifier, "Ticker": ticker, "Error Code": "ERROR", "Message": str(exc)})
-        continue
-
-if market_data_errors:
-    print(' ')
-    print('================================')
-    print(f"MARKET DATA ERRORS — {len(market_data_errors)} position(s) excluded from report:")
-    error_df = pd.DataFrame(market_data_errors)
-    print(error_df.to_string(index=False))
-    print('================================')
-
-# Concatenate all dataframes in the list into a single dataframe
-print("Generating final dataframe...")
-final_df = DataFormatting.create_portfolio(frames)
-
-# Expected schema:
-# 'Settle date', 'Position name', 'Capital', 'Quantity', 'Book cost', 'Close', 'Market value', 'Income'
-
-# Interrogate the report to see what measures it needs
-print("Report requires the following measures: " + ", ".join(report.required_measures()))
-
-if "Daily Return %" in report.required_measures():
-    print("Calculating 'Daily Return %'...")
-    final_df = af.calculate_daily_returns(final_df, False)
-
-if "Weight %" in report.required_measures():
-    print("Calculating 'Weight %'...")
-    final_df = af.calculate_position_weights(final_df)
-
-if "ITD PnL" in report.required_measures():
-    print("Calculating 'ITD PnL'...")
-    final_df = af.calculate_itd_pnl(final_df)
-
-# Check that we've populated the required measures
-missing_measures = [measure for measure in report.required_measures() if measure not in final_df.columns]
-if missing_measures:
-    print(f"Error: The following required measures are missing from the data: {', '.join(missing_measures)}")
-    sys.exit(1)
-
-# Determine params passed into report
-report_args = {key : params[key] for key in params if key not in ['data_file', 'static_file', 'transactions_sheet', 'income_sheet', 'output_file', 'api_url']}
-
-# Run the report
-print("Generating report, saving to " + output_file)
-report.generate(output_file, final_df, report_args)
\ No newline at end of file
+        frames.append(built)
+
+        if snapshot is not None:
+            hashes = {item["position"]: item["hash"] for item in to_build}
+            for position, PositionDf in built.groupby('Position name', sort=False):
+                snapshot.save(position, hashes[position], PositionDf.reset_index(drop=True))
+
+    if snapshot is not None:
+        snapshot.flush()
+
+    if market_data_errors:
+        print(' ')
+        print('================================')
+        print(f"MARKET DATA ERRORS — {len(market_data_errors)} position(s) excluded from report:")
+        error_df = pd.DataFrame(market_data_errors)
+        print(error_df.to_string(index=False))
+        print('================================')
+
+    # Concatenate all dataframes in the list into a single dataframe
+    print("Generating final dataframe...")
+    final_df = DataFormatting.create_portfolio(frames)
+
+    # hold the names and themes as categoricals (and any float32_columns=a,b as float32) unless compact=false
+    if params.get('compact', 'true').lower() != 'false':
+        float32_columns = [col for col in params.get('float32_columns', '').split(',') if col]
+        compact_df = DataFormatting.compact_portfolio(final_df, float32_columns)
+        print("Memory usage of final dataframe:")
+        print(DataFormatting.memory_usage_report(final_df, compact_df).to_string())
+        final_df = compact_df
+
+    # Expected schema:
+    # 'Settle date', 'Position name', 'Capital', 'Quantity', 'Book cost', 'Close', 'Market value', 'Income'
+
+    # Interrogate the report to see what measures it needs
+    print("Report requires the following measures: " + ", ".join(report.required_measures()))
+
+    if "Daily Return %" in report.required_measures():
+        print("Calculating 'Daily Return %'...")
+        final_df = af.calculate_daily_returns(final_df, False)
+
+    if "Weight %" in report.required_measures():
+        print("Calculating 'Weight %'...")
+        final_df = af.calculate_position_weights(final_df)
+
+    if "ITD PnL" in report.required_measures():
+        print("Calculating 'ITD PnL'...")
+        final_df = af.calculate_itd_pnl(final_df)
+
+    # Check that we've populated the required measures
+    missing_measures = [measure for measure in report.required_measures() if measure not in final_df.columns]
+    if missing_measures:
+        print(f"Error: The following required measures are missing from the data: {', '.join(missing_measures)}")
+        sys.exit(1)
+
+    # Determine params passed into report
+    report_args = {key : params[key] for key in params if key not in ['data_file', 'static_file', 'transactions_sheet', 'income_sheet', 'output_file', 'api_url', 'max_workers', 'snapshot_dir', 'workbook_cache_dir', 'compact', 'float32_columns']}
+
+    # Run the report
+    print("Generating report, saving to " + output_file)
+    report.generate(output_file, final_df, report_args)
+
+# child report workers re-import this module when processes are spawned (e.g. on Windows), so only run when executed directly
+if __name__ == "__main__":
+    main()
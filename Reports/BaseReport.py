@@ -1,7 +1,112 @@
 from abc import ABC, abstractmethod
 from typing import List
+import glob
+import os
+import pickle
+import traceback
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+import AnalysisFuncs as af
+
+# Stages shared by several reports, memoised per input frame so that reports run over the same data
+# (e.g. every report in a MultiReport) compute them once. An entry is dropped when its input frame is freed.
+_daily_summary_cache = {}
+
+def init_render_worker():
+    # worker processes only ever render charts to files, so never let matplotlib pick an interactive backend
+    import matplotlib
+    matplotlib.use('Agg')
+
+def write_excel_streaming(output_filename: str, sheets: dict, chunk_rows: int = 10000):
+    # Writes each frame to its own sheet through openpyxl's write-only mode, which streams rows out to disk as they
+    # are appended rather than building every cell of the workbook in memory. Rows are converted a chunk at a time,
+    # so memory stays bounded by the chunk however long the frame is. Headers are written unstyled.
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    for sheet_name, df in sheets.items():
+        ws = wb.create_sheet(title=sheet_name)
+        ws.append([str(col) for col in df.columns])
+        for start in range(0, len(df), chunk_rows):
+            chunk = df.iloc[start:start + chunk_rows].astype(object)
+            for row in chunk.where(chunk.notna(), None).itertuples(index=False, name=None):
+                ws.append(row)
+    wb.save(output_filename)
+
+def flatten_for_output(df: pd.DataFrame, index: bool) -> pd.DataFrame:
+    # Columnar formats want a plain index and one level of string column names, so the index becomes columns and
+    # multi-level column names are joined into one
+    if index:
+        df = df.reset_index()
+    if isinstance(df.columns, pd.MultiIndex):
+        df = df.set_axis([" ".join(str(part) for part in col if str(part) != "").strip() for col in df.columns], axis=1)
+    return df.reset_index(drop=True)
+
+# writers for each supported output format, other than xlsx, taking (frame, filename)
+OUTPUT_FORMATS = {
+    "xlsx": None,
+    "csv": lambda df, filename: df.to_csv(filename, index=False),
+    "parquet": lambda df, filename: df.to_parquet(filename, index=False),
+    "feather": lambda df, filename: df.to_feather(filename),
+}
+
+# charts=defer saves each chart's render call next to where the chart would be written, with this appended to its name
+DEFERRED_CHART_SUFFIX = ".chart.pkl"
+
+def charts_mode(report_args: dict) -> str:
+    # charts=true renders charts as the report is generated (the default), false skips them, and defer saves them to
+    # be rendered by a later run in Charts mode
+    mode = str(report_args.get("charts", "true")).lower()
+    if mode not in ("true", "false", "defer"):
+        raise ValueError(f"Unsupported charts mode '{mode}', expected one of true, false, defer")
+    return mode
+
+def _render_deferred_chart(path: str):
+    with open(path, "rb") as f:
+        render, data, args = pickle.load(f)
+    # the chart is written alongside its saved render call, so the output directory can be moved between runs
+    render(data, path[:-len(DEFERRED_CHART_SUFFIX)], *args)
+    os.remove(path)
+
+def render_deferred_charts(output_filename: str, workers: int = 1) -> int:
+    # Renders every chart deferred by reports written to output_filename (including the children of a MultiReport,
+    # which are named after it), across a pool of workers processes if more than one. Returns the number rendered.
+    # The saved render calls are pickles, so only ever point this at output of your own.
+    pattern = glob.escape(os.path.splitext(output_filename)[0]) + "*" + DEFERRED_CHART_SUFFIX
+    # in the order they were saved, as some charts (e.g. mplfinance's) change matplotlib's global style for the
+    # charts drawn after them, and rendering in the same order keeps them as they would have been drawn inline
+    paths = sorted(glob.glob(pattern), key=lambda path: (os.stat(path).st_mtime_ns, path))
+    print(f"Rendering {len(paths)} deferred chart(s) matching {pattern}")
+
+    failed = []
+    if workers > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_render_worker) as executor:
+            futures = [(path, executor.submit(_render_deferred_chart, path)) for path in paths]
+            for path, future in futures:
+                try:
+                    future.result()
+                except Exception:
+                    failed.append((path, traceback.format_exc()))
+    else:
+        init_render_worker()
+        for path in paths:
+            try:
+                _render_deferred_chart(path)
+            except Exception:
+                failed.append((path, traceback.format_exc()))
+
+    for path, error in failed:
+        print(f"   WARNING: Failed to render {path}:")
+        print(error)
+    if failed:
+        raise RuntimeError(f"{len(failed)} chart(s) failed to render")
+    return len(paths)
 
 class BaseReport(ABC):
+    # reports whose sheets can run to millions of rows set this to always write xlsx in streaming mode
+    streaming_excel = False
+
     @abstractmethod
     def generate(self, output_filename: str, data, report_args: dict = dict()):
         pass
@@ -11,4 +116,67 @@ class BaseReport(ABC):
 
     @abstractmethod    
     def required_measures(self) -> List[str]:
-        return []
\ No newline at end of file
+        return []
+
+    def daily_summary_with_composite_returns(self, data):
+        # Portfolio-level daily summary with ITD/Ann. ITD/1Y/3Y/5Y returns, computed once per input frame.
+        # Each caller gets its own copy, so reports are free to add columns to it.
+        key = id(data)
+        daily_summary = _daily_summary_cache.get(key)
+        if daily_summary is None:
+            daily_summary = af.create_daily_summary_with_composite_returns(data)
+            _daily_summary_cache[key] = daily_summary
+            weakref.finalize(data, _daily_summary_cache.pop, key, None)
+        return daily_summary.copy()
+
+    def output_format(self, output_filename: str, report_args: dict = dict()) -> str:
+        # output_format= on the CLI wins, otherwise the extension of the output file, otherwise xlsx
+        output_format = report_args.get("output_format") or os.path.splitext(output_filename)[1].lstrip(".") or "xlsx"
+        output_format = output_format.lower()
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format '{output_format}', expected one of {', '.join(OUTPUT_FORMATS)}")
+        return output_format
+
+    def chart_filename(self, output_filename: str, suffix: str) -> str:
+        # charts are named after the output file, whatever format it is written in
+        return os.path.splitext(output_filename)[0] + suffix + ".png"
+
+    def render_chart(self, report_args: dict, render, data, output_filename: str, *args):
+        # Calls render(data, output_filename, *args), one of the report's graph methods, unless charts are switched
+        # off or deferred (see charts_mode). A deferred chart saves the call, data included, to be rendered later.
+        mode = charts_mode(report_args)
+        if mode == "false":
+            return
+        if mode == "defer":
+            with open(output_filename + DEFERRED_CHART_SUFFIX, "wb") as f:
+                pickle.dump((render, data, args), f, protocol=pickle.HIGHEST_PROTOCOL)
+            return
+        render(data, output_filename, *args)
+
+    def write_sheets(self, output_filename: str, sheets: dict, report_args: dict = dict(), index: bool = False):
+        # Writes the report's sheets (sheet name -> frame) in the format picked by output_format():
+        #   xlsx                   - one workbook at output_filename, streamed if streaming_excel is set here or on the CLI
+        #   csv / parquet / feather - one file per sheet named after output_filename and the sheet (just the output
+        #                            file's name if there is only one sheet), or with dataset=true a directory named
+        #                            after output_filename holding one sheet=<name> partition per sheet
+        output_format = self.output_format(output_filename, report_args)
+        if output_format == "xlsx":
+            if self.streaming_excel or str(report_args.get("streaming_excel", "false")).lower() == "true":
+                write_excel_streaming(output_filename, {name: flatten_for_output(df, index) for name, df in sheets.items()})
+            else:
+                with pd.ExcelWriter(output_filename, engine='openpyxl') as writer:
+                    for sheet_name, df in sheets.items():
+                        df.to_excel(writer, sheet_name=sheet_name, index=index)
+            return
+
+        stem = os.path.splitext(output_filename)[0]
+        dataset = str(report_args.get("dataset", "false")).lower() == "true"
+        for sheet_name, df in sheets.items():
+            if dataset:
+                sheet_filename = os.path.join(stem, f"sheet={sheet_name.replace(' ', '')}", f"part-0.{output_format}")
+                os.makedirs(os.path.dirname(sheet_filename), exist_ok=True)
+            elif len(sheets) == 1:
+                sheet_filename = f"{stem}.{output_format}"
+            else:
+                sheet_filename = f"{stem}_{sheet_name.replace(' ', '')}.{output_format}"
+            OUTPUT_FORMATS[output_format](flatten_for_output(df, index), sheet_filename)
@@ -47,7 +47,7 @@ class CurrentHoldingsReport(BaseReport):
         current_holdings = current_holdings[['Position name', 'Theme', 'Quantity', 'Book cost', 'Market value', 'Weight %']]
 
         # (2) Add in total income for each position
-        agg_holdings = data.groupby('Position name').agg({'Income': 'sum', 'Settle date' : 'min'}).reset_index()
+        agg_holdings = data.groupby('Position name', observed=True).agg({'Income': 'sum', 'Settle date' : 'min'}).reset_index()
         agg_holdings.rename(columns={'Income': 'Total income', 'Settle date': 'First acquisition date'}, inplace=True)
         current_holdings = current_holdings.merge(agg_holdings, on='Position name', how='left')
 
@@ -63,7 +63,7 @@ class CurrentHoldingsReport(BaseReport):
         current_holdings = current_holdings.sort_values(by='Total PnL', ascending=False)
         
         # (6) Aggregate by theme for summary
-        by_theme = current_holdings.groupby('Theme').agg({
+        by_theme = current_holdings.groupby('Theme', observed=True).agg({
             'Book cost': 'sum',
             'Market value': 'sum',
             'Total income': 'sum',
@@ -72,15 +72,16 @@ class CurrentHoldingsReport(BaseReport):
         }).reset_index()
 
         # === Format and save as CSV ===
-        with pd.ExcelWriter(output_filename, engine='openpyxl') as writer:
-            current_holdings.to_excel(writer, sheet_name='Current Holdings', index=False)
-            by_theme.to_excel(writer, sheet_name='Themes', index=False)
+        self.write_sheets(output_filename, {
+            'Current Holdings': current_holdings,
+            'Themes': by_theme,
+        }, report_args)
 
         by_theme['Total return %'] = ((by_theme['Market value'] + by_theme['Total income'] - by_theme['Book cost']) / by_theme['Book cost']) * 100
         by_theme = by_theme.sort_values(by='Market value', ascending=False)
 
-        graph_market_value_filename = output_filename.replace('.xlsx', '_MarketValueByTheme.png')
-        self.graph_market_value_by_theme(by_theme, graph_market_value_filename)
+        graph_market_value_filename = self.chart_filename(output_filename, '_MarketValueByTheme')
+        self.render_chart(report_args, self.graph_market_value_by_theme, by_theme, graph_market_value_filename)
                 
         return
     
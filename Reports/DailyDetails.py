@@ -1,10 +1,12 @@
 from .BaseReport import BaseReport
+from .Rendering import chart_renderer
 import pandas as pd
 import numpy as np
 import AnalysisFuncs as af
-import matplotlib.pyplot as plt
 
 class DailyDetailsReport(BaseReport):
+    # one row per position per day, so the workbook is written in streaming mode
+    streaming_excel = True
 
     def graph_market_value_by_position(self, daily_details: pd.DataFrame, output_filename: str, pivot_column: str, days: int = -1):
         graphDf = daily_details[['Settle date', pivot_column, 'Market value']]
@@ -13,21 +15,19 @@ class DailyDetailsReport(BaseReport):
         if days > 0:
             graphDf = graphDf.tail(days)
 
-        fig,ax = plt.subplots(figsize=(12,8))
-        graphDf.plot.area(ax=ax, cmap='tab20', alpha=0.7)
+        renderer = chart_renderer(figsize=(12,8), dpi=300)
+        with renderer.chart(output_filename) as ax:
+            graphDf = renderer.decimate(graphDf)
+            graphDf.plot.area(ax=ax, cmap='tab20', alpha=0.7)
 
-        ax.set_title(f'Daily Market Value by {pivot_column}')
-        ax.set_ylabel('Market Value (£)')   
-        ax.set_xlabel('Date')
-        ax.grid(axis='y', linestyle='--', alpha=0.7, linewidth=0.8, which='major')
-        ax.grid(axis='y', linestyle='--', alpha=0.4, linewidth=0.4, which='minor')
+            ax.set_title(f'Daily Market Value by {pivot_column}')
+            ax.set_ylabel('Market Value (£)')   
+            ax.set_xlabel('Date')
+            ax.grid(axis='y', linestyle='--', alpha=0.7, linewidth=0.8, which='major')
+            ax.grid(axis='y', linestyle='--', alpha=0.4, linewidth=0.4, which='minor')
 
-        ncols = min(len(graphDf.columns), 2)
-        ax.legend(title=pivot_column, loc='upper center', bbox_to_anchor=(0.5, -0.12), ncol=ncols, fontsize='small')
-
-        plt.tight_layout()
-        plt.savefig(output_filename, dpi=300)
-        plt.close(fig)
+            ncols = min(len(graphDf.columns), 2)
+            ax.legend(title=pivot_column, loc='upper center', bbox_to_anchor=(0.5, -0.12), ncol=ncols, fontsize='small')
 
     def graph_weight_by_position(self, daily_details: pd.DataFrame, output_filename: str, pivot_column: str, days: int = -1):
         graphDf = daily_details[['Settle date', pivot_column, 'Weight %']]
@@ -36,21 +36,19 @@ class DailyDetailsReport(BaseReport):
         if days > 0:
             graphDf = graphDf.tail(days)
         
-        fig,ax = plt.subplots(figsize=(12,8))
-        graphDf.plot.area(ax=ax, cmap='tab20', alpha=0.7)
-
-        ax.set_title('Daily Position Weighting')
-        ax.set_ylabel('Portfolio Weight (%)')   
-        ax.set_xlabel('Date')
-        ax.grid(axis='y', linestyle='--', alpha=0.7, linewidth=0.8, which='major')
-        ax.grid(axis='y', linestyle='--', alpha=0.4, linewidth=0.4, which='minor')
+        renderer = chart_renderer(figsize=(12,8), dpi=300)
+        with renderer.chart(output_filename) as ax:
+            graphDf = renderer.decimate(graphDf)
+            graphDf.plot.area(ax=ax, cmap='tab20', alpha=0.7)
 
-        ncols = min(len(graphDf.columns), 2)
-        ax.legend(title=pivot_column, loc='upper center', bbox_to_anchor=(0.5, -0.12), ncol=ncols, fontsize='small')
+            ax.set_title('Daily Position Weighting')
+            ax.set_ylabel('Portfolio Weight (%)')   
+            ax.set_xlabel('Date')
+            ax.grid(axis='y', linestyle='--', alpha=0.7, linewidth=0.8, which='major')
+            ax.grid(axis='y', linestyle='--', alpha=0.4, linewidth=0.4, which='minor')
 
-        plt.tight_layout()
-        plt.savefig(output_filename, dpi=300)
-        plt.close(fig)
+            ncols = min(len(graphDf.columns), 2)
+            ax.legend(title=pivot_column, loc='upper center', bbox_to_anchor=(0.5, -0.12), ncol=ncols, fontsize='small')
 
     def generate(self, output_filename: str, data, report_args: dict = dict()):
         print("Generating Daily Details Report")
@@ -65,40 +63,41 @@ class DailyDetailsReport(BaseReport):
 
         # (4) prepare daily details by theme
         daily_by_theme = daily_details.copy()
-        daily_by_theme = daily_by_theme.groupby(['Settle date', 'Theme'], as_index=False).agg({
+        daily_by_theme = daily_by_theme.groupby(['Settle date', 'Theme'], as_index=False, observed=True).agg({
             'Market value': 'sum',
             'Weight %': 'sum'
         })
         
         # === Format and save as CSV ===
-        with pd.ExcelWriter(output_filename, engine='openpyxl') as writer:
-            daily_details.to_excel(writer, sheet_name='Daily Positions', index=False)
-            daily_by_theme.to_excel(writer, sheet_name='Daily by Theme', index=False)
+        self.write_sheets(output_filename, {
+            'Daily Positions': daily_details,
+            'Daily by Theme': daily_by_theme,
+        }, report_args)
 
         # === Format and save as visual ===
-        graph_market_value_filename = output_filename.replace('.xlsx', '_MarketValueByPosition.png')
-        self.graph_market_value_by_position(daily_details, graph_market_value_filename, 'Position name')
+        graph_market_value_filename = self.chart_filename(output_filename, '_MarketValueByPosition')
+        self.render_chart(report_args, self.graph_market_value_by_position, daily_details, graph_market_value_filename, 'Position name')
 
-        graph_market_value_filename = output_filename.replace('.xlsx', '_MarketValueByPosition_Last_3yr.png')
-        self.graph_market_value_by_position(daily_details, graph_market_value_filename, 'Position name', 52 * 5 * 3)
+        graph_market_value_filename = self.chart_filename(output_filename, '_MarketValueByPosition_Last_3yr')
+        self.render_chart(report_args, self.graph_market_value_by_position, daily_details, graph_market_value_filename, 'Position name', 52 * 5 * 3)
 
-        graph_weight_filename = output_filename.replace('.xlsx', '_WeightByPosition.png')
-        self.graph_weight_by_position(daily_details, graph_weight_filename, 'Position name')
+        graph_weight_filename = self.chart_filename(output_filename, '_WeightByPosition')
+        self.render_chart(report_args, self.graph_weight_by_position, daily_details, graph_weight_filename, 'Position name')
 
-        graph_weight_filename = output_filename.replace('.xlsx', '_WeightByPosition_Last_3yr.png')
-        self.graph_weight_by_position(daily_details, graph_weight_filename, 'Position name', 52 * 5 * 3)
+        graph_weight_filename = self.chart_filename(output_filename, '_WeightByPosition_Last_3yr')
+        self.render_chart(report_args, self.graph_weight_by_position, daily_details, graph_weight_filename, 'Position name', 52 * 5 * 3)
 
-        graph_market_value_filename = output_filename.replace('.xlsx', '_MarketValueByTheme.png')
-        self.graph_market_value_by_position(daily_by_theme, graph_market_value_filename, 'Theme')
+        graph_market_value_filename = self.chart_filename(output_filename, '_MarketValueByTheme')
+        self.render_chart(report_args, self.graph_market_value_by_position, daily_by_theme, graph_market_value_filename, 'Theme')
 
-        graph_market_value_filename = output_filename.replace('.xlsx', '_MarketValueByTheme_Last_3yr.png')
-        self.graph_market_value_by_position(daily_by_theme, graph_market_value_filename, 'Theme', 52 * 5 * 3)
+        graph_market_value_filename = self.chart_filename(output_filename, '_MarketValueByTheme_Last_3yr')
+        self.render_chart(report_args, self.graph_market_value_by_position, daily_by_theme, graph_market_value_filename, 'Theme', 52 * 5 * 3)
 
-        graph_weight_filename = output_filename.replace('.xlsx', '_WeightByTheme.png')
-        self.graph_weight_by_position(daily_by_theme, graph_weight_filename, 'Theme')
+        graph_weight_filename = self.chart_filename(output_filename, '_WeightByTheme')
+        self.render_chart(report_args, self.graph_weight_by_position, daily_by_theme, graph_weight_filename, 'Theme')
 
-        graph_weight_filename = output_filename.replace('.xlsx', '_WeightByTheme_Last_3yr.png')
-        self.graph_weight_by_position(daily_by_theme, graph_weight_filename, 'Theme', 52 * 5 * 3)
+        graph_weight_filename = self.chart_filename(output_filename, '_WeightByTheme_Last_3yr')
+        self.render_chart(report_args, self.graph_weight_by_position, daily_by_theme, graph_weight_filename, 'Theme', 52 * 5 * 3)
         
         return
     
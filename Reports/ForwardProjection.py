@@ -34,54 +34,33 @@ class ForwardProjectionReport(BaseReport):
         
         # === Generate raw data for this report ===
 
-        # (1) calculate the weighted, daily return for each position
-        data['Portfolio Return %'] = data['Daily Return %'] * (data['Weight %'] / 100)
-
-        # (2) group positions by settle date
-        daily_summary = af.create_daily_summary(data)
-
-        # (4) calculate composite returns (ITD, 1Y, 3Y, 5Y, Ann. ITD) for each position
-        daily_summary['Portfolio Return %'] = daily_summary['Portfolio Return %'].fillna(0)
-
-        # ITD
-        daily_summary['ITD Portfolio Return %'] = 100.0*((1 + daily_summary['Portfolio Return %'] / 100).cumprod() - 1)
-
-        # Ann. ITD
-        first_trade_date = np.datetime64(daily_summary['Settle date'].min(), 'D')
-        daily_summary['Ann. ITD Portfolio Return %'] = 100.0 * ((1 + daily_summary['ITD Portfolio Return %'] / 100) ** (260 / np.maximum(np.busday_count(first_trade_date, daily_summary['Settle date'].values.astype('datetime64[D]')), 1)) - 1)
-
-        # 1Y
-        daily_summary['1Y Portfolio Return %'] = daily_summary['Portfolio Return %'].rolling(window=260 * 1).apply(lambda x: 100.0 * ((1 + x / 100).cumprod().iloc[-1] - 1))
-        
-        # 3Y
-        daily_summary['3Y Portfolio Return %'] = daily_summary['Portfolio Return %'].rolling(window=260 * 3).apply(lambda x: 100.0 * ((1 + x / 100).cumprod().iloc[-1] - 1))
-        daily_summary['3Y Portfolio Return %'] = ((1 + daily_summary['3Y Portfolio Return %'] / 100.0) ** (1/3) - 1) * 100.0
-        
-        # 5Y
-        daily_summary['5Y Portfolio Return %'] = daily_summary['Portfolio Return %'].rolling(window=260 * 5).apply(lambda x: 100.0 * ((1 + x / 100).cumprod().iloc[-1] - 1))
-        daily_summary['5Y Portfolio Return %'] = ((1 + daily_summary['5Y Portfolio Return %'] / 100.0) ** (1/5) - 1) * 100.0
+        # (1) daily portfolio summary with composite returns (ITD, Ann. ITD, 1Y, 3Y, 5Y), shared with the other summary reports
+        daily_summary = self.daily_summary_with_composite_returns(data)
 
         # project forward
         proj_return_itd_daily = daily_summary['ITD Portfolio Return %'].iloc[-1] / 100.0
-        proj_1y_return_daily = (((daily_summary['Portfolio Return %'].rolling(window=260 * 1).apply(lambda x: ((1 + x / 100).cumprod().iloc[-1] - 1)).iloc[-1]) + 1.0) ** (1/(260*1))) - 1.0
-        proj_3y_return_daily = (((daily_summary['Portfolio Return %'].rolling(window=260 * 3).apply(lambda x: ((1 + x / 100).cumprod().iloc[-1] - 1)).iloc[-1]) + 1.0) ** (1/(260*3))) - 1.0
-        proj_5y_return_daily = (((daily_summary['Portfolio Return %'].rolling(window=260 * 5).apply(lambda x: ((1 + x / 100).cumprod().iloc[-1] - 1)).iloc[-1]) + 1.0) ** (1/(260*5))) - 1.0
+        # the 1Y return is a one year return and the 3Y and 5Y returns are annualised, so each compounds to a daily rate over 260 days
+        proj_1y_return_daily = ((daily_summary['1Y Portfolio Return %'].iloc[-1] / 100.0 + 1.0) ** (1/260)) - 1.0
+        proj_3y_return_daily = ((daily_summary['3Y Portfolio Return %'].iloc[-1] / 100.0 + 1.0) ** (1/260)) - 1.0
+        proj_5y_return_daily = ((daily_summary['5Y Portfolio Return %'].iloc[-1] / 100.0 + 1.0) ** (1/260)) - 1.0
 
         first_date = np.datetime64(daily_summary['Settle date'].min(), 'D')
         last_date = np.datetime64(daily_summary['Settle date'].max(), 'D')
         last_market_value = daily_summary['Market value'].iloc[-1]
 
-        proj_return_itd_daily = ((1 + proj_return_itd_daily) ** (1 / np.busday_count(first_date, last_date))) - 1
+        calendar = df.business_day_calendar()
+        proj_return_itd_daily = ((1 + proj_return_itd_daily) ** (1 / calendar.busday_count(first_date, last_date))) - 1
 
         fwd_periods = int(report_args["fwd_periods"])
 
         print(f'Projecting forward {fwd_periods} business days using ITD daily return of {proj_return_itd_daily:.6f}%, 1Y={proj_1y_return_daily:.6f}, 3Y={proj_3y_return_daily:.6f}, 5Y={proj_5y_return_daily:.6f} and a last market value of {last_market_value:.2f} on {last_date}')
 
-        projection = df.create_date_series(last_date + np.timedelta64(1, 'D'), last_date + np.timedelta64(report_args["fwd_periods"], 'D'))
-        projection['Proj. Market Value (ITD)'] = last_market_value * (1 + proj_return_itd_daily) ** np.busday_count(last_date, projection['Settle date'].values.astype('datetime64[D]'))
-        projection['Proj. Market Value (1Y)'] = last_market_value * (1 + proj_1y_return_daily) ** np.busday_count(last_date, projection['Settle date'].values.astype('datetime64[D]'))
-        projection['Proj. Market Value (3Y)'] = last_market_value * (1 + proj_3y_return_daily) ** np.busday_count(last_date, projection['Settle date'].values.astype('datetime64[D]'))
-        projection['Proj. Market Value (5Y)'] = last_market_value * (1 + proj_5y_return_daily) ** np.busday_count(last_date, projection['Settle date'].values.astype('datetime64[D]'))
+        projection = df.create_date_series(last_date + np.timedelta64(1, 'D'), last_date + np.timedelta64(report_args["fwd_periods"], 'D'), calendar)
+        projection_days = calendar.busday_count(last_date, projection['Settle date'].values)
+        projection['Proj. Market Value (ITD)'] = last_market_value * (1 + proj_return_itd_daily) ** projection_days
+        projection['Proj. Market Value (1Y)'] = last_market_value * (1 + proj_1y_return_daily) ** projection_days
+        projection['Proj. Market Value (3Y)'] = last_market_value * (1 + proj_3y_return_daily) ** projection_days
+        projection['Proj. Market Value (5Y)'] = last_market_value * (1 + proj_5y_return_daily) ** projection_days
 
         # union results together
         daily_summary = pd.concat([daily_summary, projection], axis=0, ignore_index=True, sort=True)
@@ -112,11 +91,11 @@ class ForwardProjectionReport(BaseReport):
 
         # === Format and save as CSV ===
         daily_summary = daily_summary[['Settle date', 'Capital', 'Book cost', 'Market value','Proj. Market Value (ITD)', 'Proj. Market Value (1Y)', 'Proj. Market Value (3Y)', 'Proj. Market Value (5Y)']].sort_values(by='Settle date')
-        daily_summary.to_excel(output_filename, index=False)
+        self.write_sheets(output_filename, {'Sheet1': daily_summary}, report_args)
 
         # === Format and save as visual ===
-        graph_filename = output_filename.replace('.xlsx', '_FwdProjection.png')
-        self.graph_projection(daily_summary, graph_filename)
+        graph_filename = self.chart_filename(output_filename, '_FwdProjection')
+        self.render_chart(report_args, self.graph_projection, daily_summary, graph_filename)
         
         return
     
@@ -1,7 +1,26 @@
-from .BaseReport import BaseReport
+from .BaseReport import BaseReport, init_render_worker
+import os
+import shutil
+import tempfile
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
 import AnalysisFuncs as af
+import pyarrow as pa
+import pyarrow.feather as feather
+
+def _run_report(report: BaseReport, report_filename: str, data_path: str, report_args: dict):
+    # Runs one child report in a worker process against the frame in the memory-mapped Arrow file at data_path
+    start = time.perf_counter()
+    try:
+        with pa.memory_map(data_path, 'r') as source:
+            data = pa.ipc.open_file(source).read_all().to_pandas()
+        report.generate(report_filename, data, report_args)
+        return time.perf_counter() - start, None
+    except Exception:
+        return time.perf_counter() - start, traceback.format_exc()
 
 class MultiReport(BaseReport):
 
@@ -11,18 +30,76 @@ class MultiReport(BaseReport):
 
     def generate(self, output_filename: str, data, report_args: dict = dict()):
         print("Generating Multi Report")
-        
-        for report in self.reports:
-            report_filename = output_filename.replace(".xlsx", f"_{report.report_name()}.xlsx")
-            report.generate(report_filename, data, report_args)
-        
+
+        # opt-in: report_workers=N runs the child reports in a pool of N processes
+        workers = int(report_args.get("report_workers", 1))
+        stem, ext = os.path.splitext(output_filename)
+        jobs = [(report, f"{stem}_{report.report_name()}{ext}") for report in self.reports]
+
+        if workers > 1:
+            results = self.generate_parallel(jobs, data, report_args, workers)
+        else:
+            results = []
+            for report, report_filename in jobs:
+                start = time.perf_counter()
+                try:
+                    report.generate(report_filename, data, report_args)
+                    results.append((time.perf_counter() - start, None))
+                except Exception:
+                    results.append((time.perf_counter() - start, traceback.format_exc()))
+
+        self.print_summary(jobs, results)
+
+        failed = [report.report_name() for (report, _), (_, error) in zip(jobs, results) if error is not None]
+        if failed:
+            raise RuntimeError(f"{len(failed)} report(s) failed: {', '.join(failed)}")
+
         return
-    
+
+    def generate_parallel(self, jobs, data: pd.DataFrame, report_args: dict, workers: int):
+        # Workers read the frame from an uncompressed Arrow IPC file that they memory-map, rather than each being
+        # sent a pickled copy of it. Each worker computes its own shared stages, as memoisation is per process.
+        print(f"Running {len(jobs)} report(s) across {workers} worker process(es)...")
+        tmp_dir = tempfile.mkdtemp(prefix="multireport_")
+        try:
+            data_path = os.path.join(tmp_dir, "data.arrow")
+            feather.write_feather(data, data_path, compression='uncompressed')
+
+            with ProcessPoolExecutor(max_workers=workers, initializer=init_render_worker) as executor:
+                futures = [executor.submit(_run_report, report, report_filename, data_path, report_args) for report, report_filename in jobs]
+                results = []
+                for future in futures:
+                    try:
+                        results.append(future.result())
+                    except Exception:
+                        # the worker itself died (e.g. killed or out of memory), so no timing is available
+                        results.append((float('nan'), traceback.format_exc()))
+            return results
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def print_summary(self, jobs, results):
+        print(' ')
+        print('================================')
+        print("REPORT TIMINGS")
+        summary = pd.DataFrame({
+            "Report": [report.report_name() for report, _ in jobs],
+            "Seconds": [round(seconds, 2) for seconds, _ in results],
+            "Status": ["OK" if error is None else "FAILED" for _, error in results],
+        })
+        print(summary.to_string(index=False))
+        for (report, _), (_, error) in zip(jobs, results):
+            if error is not None:
+                print(' ')
+                print(f"{report.report_name()} failed:")
+                print(error)
+        print('================================')
+
     def required_measures(self) -> list[str]:
         measures = set()
         for report in self.reports:
             measures.update(report.required_measures())
         return list(measures)
-    
+
     def get_report_name(self) -> str:
-        return "MultiReport: " + ", ".join([report.report_name() for report in self.reports])
\ No newline at end of file
+        return "MultiReport: " + ", ".join([report.report_name() for report in self.reports])
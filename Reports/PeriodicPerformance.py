@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from .BaseReport import BaseReport
+from .BaseReport import BaseReport, charts_mode, init_render_worker
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
 import AnalysisFuncs as af
@@ -13,44 +14,52 @@ class PeriodicPerformanceReport(BaseReport):
     def required_measures(self) -> list[str]:
         return ["ITD PnL", "Daily Return %", "Weight %"]
 
-    def create_periodic_performance(self, data: pd.DataFrame, granularity: str, pivot_column: str, lookback: int = -1, pnl : bool = False) -> pd.DataFrame:
-        # Select appropriate columns
-        data = data[['Settle date', pivot_column, 'Market value', 'Income', 'Book cost']]
+    def create_daily_pivot(self, data: pd.DataFrame, pivot_column: str) -> dict[str, pd.DataFrame]:
+        # Aggregate all values on a daily basis, one column per value of the pivot column. Every granularity,
+        # lookback and mode for this pivot column is derived from these frames without going back to the raw data.
+        daily = data.groupby(['Settle date', pivot_column], observed=True)[['Market value', 'Income', 'Book cost']].sum()
+
+        # Income was made a cumulative sum within each (date, pivot) group here, but after the daily aggregation each
+        # group is a single row, so that sum is the daily value itself
 
-        # Aggregate all values on a daily basis first
-        data = data.groupby(['Settle date', pivot_column]).agg({
-            'Market value': 'sum',
-            'Income': 'sum',
-            'Book cost': 'sum'
-        }).reset_index()
+        # which (date, pivot) pairs have data at all, as only those appear as cells in the pivot
+        present = daily['Market value'].notna().unstack(pivot_column, fill_value=False)
 
-        # Make income a cumulative sum over time
-        data['Income'] = data.groupby(['Settle date', pivot_column])['Income'].cumsum()
+        return {
+            'Market value': daily['Market value'].unstack(pivot_column),
+            'Income': daily['Income'].unstack(pivot_column),
+            'Book cost': daily['Book cost'].unstack(pivot_column),
+            'Present': present,
+        }
 
+    def create_periodic_performance_from_pivot(self, daily: dict[str, pd.DataFrame], granularity: str, pivot_column: str, lookback: int = -1, pnl : bool = False) -> pd.DataFrame:
         # Calculate pivot value
         if pnl:
-            data['Pivot value'] = data['Market value'] + data['Income'] - data['Book cost']
+            pivot_df = daily['Market value'] + daily['Income'] - daily['Book cost']
         else:
-            data['Pivot value'] = 100.0 * (((data['Market value'] + data['Income']) / data['Book cost']) - 1.0)
-
-        # Drop intermediary columns
-        data = data[['Settle date', pivot_column, 'Pivot value']]
+            pivot_df = 100.0 * (((daily['Market value'] + daily['Income']) / daily['Book cost']) - 1.0)
 
+        present = daily['Present']
         if lookback is not None and lookback > 0:
             # remove all rows where 'Settle date' is older than lookback days from the latest date
-            cutoff_date = data['Settle date'].max() - pd.Timedelta(days=lookback)
-            data = data[data['Settle date'] >= cutoff_date]  
+            cutoff_date = pivot_df.index.max() - pd.Timedelta(days=lookback)
+            pivot_df = pivot_df[pivot_df.index >= cutoff_date]
+            present = present[present.index >= cutoff_date]
 
-        # Pivot by desired column
-        pivot_df = data.pivot(index='Settle date', columns=pivot_column, values=['Pivot value'])
+        # only values of the pivot column with data inside the lookback get a column
+        pivot_df = pivot_df.loc[:, present.any(axis=0).to_numpy()]
+        pivot_df.columns = pd.MultiIndex.from_product([['Pivot value'], pivot_df.columns], names=[None, pivot_column])
 
         # Aggregate to desired periodicity
         pivot_df = pivot_df.groupby(pd.Grouper(freq=granularity)).last()
 
         pivot_df = pivot_df.drop(columns=['Cash'], errors='ignore')  # Remove cash column if present
-        
+
         return pivot_df
-    
+
+    def create_periodic_performance(self, data: pd.DataFrame, granularity: str, pivot_column: str, lookback: int = -1, pnl : bool = False) -> pd.DataFrame:
+        return self.create_periodic_performance_from_pivot(self.create_daily_pivot(data, pivot_column), granularity, pivot_column, lookback, pnl)
+
     def render_Graph(self, data: pd.DataFrame, output_filename: str, granularity: str, lb: int, pivot_column: str, pnl: bool = False):
         fig, ax = plt.subplots(figsize=(16,12))
         data.plot.line(ax=ax, cmap='gist_rainbow', alpha=0.8)
@@ -70,9 +79,19 @@ class PeriodicPerformanceReport(BaseReport):
 
     def generate(self, output_filename: str, data, report_args: dict = dict()):
         print("Generating Periodic Performance Report")
-        
-        # Run graphing at different granularities
-        with pd.ExcelWriter(output_filename, engine='openpyxl') as writer:
+
+        # with render_workers > 1, charts are rendered by a pool of that many processes while the sheets are built
+        # (unless they are switched off or deferred, in which case there is nothing to render here). One by default,
+        # as under All with report_workers each report process would otherwise start a pool of its own
+        workers = int(report_args.get("render_workers", 1)) if charts_mode(report_args) == "true" else 1
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=init_render_worker) if workers > 1 else None
+
+        sheets = []
+        renders = []
+        try:
+            daily_pivots = {pv: self.create_daily_pivot(data, pv) for pv in ('Position name', 'Theme')}
+
+            # Run graphing at different granularities
             for g in ('D', 'ME', 'QE', 'YE'):
                 print(' Granularity: ' + g)
                 for pv in ('Position name', 'Theme'):
@@ -81,13 +100,32 @@ class PeriodicPerformanceReport(BaseReport):
                         print('   Lookback: ' + ('all' if lb == -1 else f'{lb} days'))
                         for mode in (False, True):
                             print(f"    Generating periodic {'performance' if not mode else 'PnL'} for granularity '{g}', pivot column '{pv}', {'all' if lb == -1 else f'{lb} days'} history")
-                            ds = data.copy()
-                            ds = self.create_periodic_performance(ds, g, pv, lb, mode)
+                            ds = self.create_periodic_performance_from_pivot(daily_pivots[pv], g, pv, lb, mode)
 
                             sheet_name = f'{g}_{pv.replace(" ","")}_{"all" if lb == -1 else f"{lb}days"}_{"PnL" if mode else "Perf"}'
-                            print(f"     Adding raw data to {output_filename} -> {sheet_name}") 
-                            ds.to_excel(writer, sheet_name=sheet_name, index=True)
+                            sheets.append((sheet_name, ds))
 
-                            graph_filename = output_filename.replace('.xlsx', f'_Periodic{"Performance" if not mode else "PnL"}_{g}_by_{pv.replace(" ","")}_{"all" if lb == -1 else f"{lb}_days"}_history.png')
+                            graph_filename = self.chart_filename(output_filename, f'_Periodic{"Performance" if not mode else "PnL"}_{g}_by_{pv.replace(" ","")}_{"all" if lb == -1 else f"{lb}_days"}_history')
                             print(f"     Graphing to {graph_filename}")
-                            self.render_Graph(ds, graph_filename, g, lb, pv, mode)
+                            if executor is None:
+                                self.render_chart(report_args, self.render_Graph, ds, graph_filename, g, lb, pv, mode)
+                            else:
+                                renders.append((graph_filename, executor.submit(self.render_Graph, ds, graph_filename, g, lb, pv, mode)))
+
+            # assemble the workbook while the charts render
+            for sheet_name, ds in sheets:
+                print(f"     Adding raw data to {output_filename} -> {sheet_name}")
+            self.write_sheets(output_filename, dict(sheets), report_args, index=True)
+
+            failed = []
+            for graph_filename, render in renders:
+                try:
+                    render.result()
+                except Exception as exc:
+                    print(f"   WARNING: Failed to render {graph_filename}: {exc}")
+                    failed.append(graph_filename)
+            if failed:
+                raise RuntimeError(f"{len(failed)} chart(s) failed to render")
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
@@ -29,32 +29,10 @@ class PeriodicSummaryBase(BaseReport):
         
         # === Generate raw data for this report ===
 
-        # (1) calculate the weighted, daily return for each position
-        data['Portfolio Return %'] = data['Daily Return %'] * (data['Weight %'] / 100)
+        # (1) daily portfolio summary with composite returns (ITD, Ann. ITD, 1Y, 3Y, 5Y), shared with the other summary reports
+        daily_summary = self.daily_summary_with_composite_returns(data)
 
-        # (2) group positions by settle date
-        daily_summary = af.create_daily_summary(data)
-
-        # (3) Add in composite returns
-        daily_summary['Portfolio Return %'] = daily_summary['Portfolio Return %'].fillna(0)
-        daily_summary['ITD Portfolio Return %'] = 100.0*((1 + daily_summary['Portfolio Return %'] / 100).cumprod() - 1)
-
-        # Ann. ITD
-        first_trade_date = np.datetime64(daily_summary['Settle date'].min(), 'D')
-        daily_summary['Ann. ITD Portfolio Return %'] = 100.0 * ((1 + daily_summary['ITD Portfolio Return %'] / 100) ** (260 / np.maximum(np.busday_count(first_trade_date, daily_summary['Settle date'].values.astype('datetime64[D]')), 1)) - 1)
-
-        # 1Y
-        daily_summary['1Y Portfolio Return %'] = daily_summary['Portfolio Return %'].rolling(window=260 * 1).apply(lambda x: 100.0 * ((1 + x / 100).cumprod().iloc[-1] - 1))
-        
-        # 3Y
-        daily_summary['3Y Portfolio Return %'] = daily_summary['Portfolio Return %'].rolling(window=260 * 3).apply(lambda x: 100.0 * ((1 + x / 100).cumprod().iloc[-1] - 1))
-        daily_summary['3Y Portfolio Return %'] = ((1 + daily_summary['3Y Portfolio Return %'] / 100.0) ** (1/3) - 1) * 100.0
-        
-        # 5Y
-        daily_summary['5Y Portfolio Return %'] = daily_summary['Portfolio Return %'].rolling(window=260 * 5).apply(lambda x: 100.0 * ((1 + x / 100).cumprod().iloc[-1] - 1))
-        daily_summary['5Y Portfolio Return %'] = ((1 + daily_summary['5Y Portfolio Return %'] / 100.0) ** (1/5) - 1) * 100.0
-
-        # (4) aggregate to desired periodicity
+        # (2) aggregate to desired periodicity
         periodicity = self.get_periodicity()
 
         summary = daily_summary.groupby(pd.Grouper(key='Settle date', freq=periodicity)).agg(
@@ -89,11 +67,11 @@ class PeriodicSummaryBase(BaseReport):
                                             )
 
         # === Format and save as CSV ===
-        summary.to_excel(output_filename, index=False)
+        self.write_sheets(output_filename, {'Sheet1': summary}, report_args)
 
         # === Format and save as visual ===
-        output_filename = output_filename.replace('.xlsx', '_Summary.png')
-        self.graph_summary(summary, output_filename)
+        output_filename = self.chart_filename(output_filename, '_Summary')
+        self.render_chart(report_args, self.graph_summary, summary, output_filename)
         
         return
     
@@ -0,0 +1,81 @@
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+
+def decimate_min_max(df: pd.DataFrame, buckets: int) -> pd.DataFrame:
+    # Reduces a frame of series sharing an index (e.g. one column per position) to at most a few rows per bucket of
+    # consecutive rows, keeping the first and last row of each bucket and the rows where each column reaches its
+    # minimum and maximum within it. With a bucket per pixel column, the drawn chart keeps every peak and trough of
+    # every series. Whole rows are kept, so stacked charts still stack values from the same date.
+    if len(df) <= buckets or df.empty:
+        return df
+
+    bucket = np.arange(len(df)) * buckets // len(df)
+    positions = pd.DataFrame(df.to_numpy(dtype=float), columns=range(df.shape[1])).fillna(0)
+    grouped = positions.groupby(bucket, sort=False)
+    starts = np.flatnonzero(np.diff(bucket, prepend=-1))
+    keep = np.unique(np.concatenate([
+        starts,
+        np.append(starts[1:], len(df)) - 1,
+        grouped.idxmin().to_numpy().ravel(),
+        grouped.idxmax().to_numpy().ravel(),
+    ]))
+    return df.iloc[keep] if len(keep) < len(df) else df
+
+
+class ChartRenderer:
+    """Draws charts to PNG on a single reused figure, always through the Agg canvas whatever pyplot's backend is.
+
+    Each chart is timed, and the time and number of points drawn are printed once it is saved.
+    """
+
+    def __init__(self, figsize: tuple[float, float] = (12, 8), dpi: int = 300) -> None:
+        self.dpi = dpi
+        self._figure = Figure(figsize=figsize)
+        FigureCanvasAgg(self._figure)
+        # tight_layout adjusts the figure's subplot parameters, which clearing it does not undo
+        self._subplot_params = {k: getattr(self._figure.subplotpars, k) for k in ('left', 'bottom', 'right', 'top', 'wspace', 'hspace')}
+        self._points = None
+
+    @property
+    def pixel_width(self) -> int:
+        return int(self._figure.get_figwidth() * self.dpi)
+
+    def decimate(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Decimates the frame to one bucket per pixel across the figure, recording the points in and out."""
+        decimated = decimate_min_max(df, self.pixel_width)
+        self._points = (df.size, decimated.size)
+        return decimated
+
+    @contextmanager
+    def chart(self, output_filename: str):
+        # yields the axes to draw on, then lays out and saves the figure to output_filename and clears it for reuse
+        start = time.perf_counter()
+        self._points = None
+        ax = self._figure.add_subplot()
+        try:
+            yield ax
+            self._figure.tight_layout()
+            self._figure.savefig(output_filename, dpi=self.dpi)
+        finally:
+            self._figure.clear()
+            self._figure.subplots_adjust(**self._subplot_params)
+
+        points = "" if self._points is None else f" ({self._points[0]:,} -> {self._points[1]:,} points)"
+        print(f"     Rendered {output_filename} in {time.perf_counter() - start:.2f}s{points}")
+
+
+_renderers = {}
+
+def chart_renderer(figsize: tuple[float, float] = (12, 8), dpi: int = 300) -> ChartRenderer:
+    # one renderer per figure size and resolution in each process, so every chart of that shape reuses its figure
+    key = (tuple(figsize), dpi)
+    renderer = _renderers.get(key)
+    if renderer is None:
+        renderer = _renderers[key] = ChartRenderer(figsize, dpi)
+    return renderer
@@ -0,0 +1,93 @@
+# Benchmark for AnalysisFuncs.calculate_daily_returns against the original per-position loop.
+#
+# Run from the repository root:
+#     python benchmarks/bench_calculate_daily_returns.py
+#
+# The fixture in test_data/calculate_daily_returns/portfolio_5.csv is grown to 10x and 100x
+# its positions and its dates, plus a 20 year / 100 position portfolio, and both
+# implementations are timed on each. Every run also checks the two produce identical frames.
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import AnalysisFuncs as af
+
+FIXTURE = "./test_data/calculate_daily_returns/portfolio_5.csv"
+
+
+def legacy_calculate_daily_returns(df, include_portfolio_return=True):
+    # The implementation calculate_daily_returns replaced, kept as the reference result
+    ts = []
+    for _, group_df in df.groupby('Position name'):
+        group_df = group_df.sort_values(by='Settle date')
+        group_df['Daily Return %'] = np.where(
+            group_df['Close'].shift(1).bfill() == 0,
+            0.0,
+            100.0 * (((group_df['Close'] - group_df['Close'].shift(1).bfill()) + np.where(group_df['Income Qty'] > 0.0, group_df['Income'] / group_df['Income Qty'], 0.0)) / (group_df['Close'].shift(1).bfill()))
+        )
+        if include_portfolio_return:
+            group_df['Portfolio Return %'] = group_df['Daily Return %'] * group_df['Portfolio Weight %'] / 100
+        ts.append(group_df)
+
+    return pd.concat(ts, ignore_index=True).sort_values(by=['Settle date', 'Position name']).reset_index(drop=True)
+
+
+def load_fixture():
+    df = pd.read_csv(FIXTURE)
+    df['Settle date'] = pd.to_datetime(df['Settle date'])
+    df['Position name'] = df['Position name'].astype('str')
+    return df
+
+
+def scale_portfolio(base, n_positions, n_days, seed=0):
+    # Build n_positions x n_days rows shaped like the fixture, with a random walk for Close
+    # and an occasional income payment, so every branch of the return calculation is exercised
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(base['Settle date'].min(), periods=n_days)
+    names = [f"Holding {i:04d}" for i in range(n_positions)]
+
+    df = pd.DataFrame({
+        'Settle date': np.tile(dates, n_positions),
+        'Position name': np.repeat(names, n_days),
+    })
+    rows = len(df)
+    steps = rng.normal(1.0, 0.01, size=(n_positions, n_days)).cumprod(axis=1)
+    df['Quantity'] = 100.0
+    df['Book cost'] = 500.0
+    paid = rng.random(rows) < 0.01
+    df['Income Qty'] = np.where(paid, 100.0, 0.0)
+    df['Income'] = np.where(paid, 25.0, 0.0)
+    df['Close'] = (5.0 * steps).ravel()
+    df['Market value'] = df['Quantity'] * df['Close']
+    df['Day PnL'] = 0.0
+    df['ITD PnL'] = 0.0
+    df['Portfolio Weight %'] = 100.0 / n_positions
+
+    # shuffle so neither implementation benefits from pre-sorted input
+    return df.sample(frac=1.0, random_state=seed).reset_index(drop=True)
+
+
+def run(label, df, repeat):
+    expected = legacy_calculate_daily_returns(df)
+    pd.testing.assert_frame_equal(af.calculate_daily_returns(df), expected)
+
+    legacy = min(timeit.repeat(lambda: legacy_calculate_daily_returns(df), number=1, repeat=repeat))
+    vectorised = min(timeit.repeat(lambda: af.calculate_daily_returns(df), number=1, repeat=repeat))
+    print(f"{label:<28}{len(df):>10,}{legacy * 1000:>12.1f}{vectorised * 1000:>12.1f}{legacy / vectorised:>9.1f}x")
+
+
+if __name__ == "__main__":
+    base = load_fixture()
+    base_positions = base['Position name'].nunique()
+    base_days = base['Settle date'].nunique()
+
+    print(f"{'case':<28}{'rows':>10}{'legacy ms':>12}{'new ms':>12}{'speedup':>10}")
+    run("fixture", base, repeat=20)
+    run("10x fixture", scale_portfolio(base, base_positions * 10, base_days * 10), repeat=10)
+    run("100x fixture", scale_portfolio(base, base_positions * 100, base_days * 100), repeat=3)
+    run("20y x 100 positions", scale_portfolio(base, 100, 260 * 20), repeat=3)
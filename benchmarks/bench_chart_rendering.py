@@ -0,0 +1,78 @@
+# Benchmark for the chart renderer in Reports/Rendering.py against drawing every point on a new pyplot figure.
+#
+# Run from the repository root:
+#     python benchmarks/bench_chart_rendering.py
+#
+# Stacked area charts of a synthetic daily history (one column per position) are drawn the way
+# DailyDetailsReport drew them before, then through the renderer, which decimates the history to
+# the pixel width of the figure and reuses one figure across charts. The two PNGs are compared
+# pixel by pixel.
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Reports.Rendering import chart_renderer
+
+
+def daily_history(n_positions, n_years, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range('2005-01-03', periods=260 * n_years)
+    values = np.abs(1000 + rng.normal(0, 10, (len(dates), n_positions)).cumsum(axis=0))
+    return pd.DataFrame(values, index=pd.Index(dates, name='Settle date'), columns=[f"Holding {i:02d}" for i in range(n_positions)])
+
+
+def draw(ax, df):
+    df.plot.area(ax=ax, cmap='tab20', alpha=0.7)
+    ax.set_title('Daily Market Value by Position name')
+    ax.legend(title='Position name', loc='upper center', bbox_to_anchor=(0.5, -0.12), ncol=2, fontsize='small')
+
+
+def legacy(df, filename):
+    fig, ax = plt.subplots(figsize=(12, 8))
+    draw(ax, df)
+    plt.tight_layout()
+    plt.savefig(filename, dpi=300)
+    plt.close(fig)
+
+
+def rendered(df, filename):
+    renderer = chart_renderer(figsize=(12, 8), dpi=300)
+    with contextlib.redirect_stdout(io.StringIO()):
+        with renderer.chart(filename) as ax:
+            draw(ax, renderer.decimate(df))
+
+
+def run(label, df, charts=3):
+    with tempfile.TemporaryDirectory() as tmp:
+        timings = {}
+        for name, render in (("legacy", legacy), ("renderer", rendered)):
+            start = time.perf_counter()
+            for i in range(charts):
+                render(df, os.path.join(tmp, f"{name}_{i}.png"))
+            timings[name] = (time.perf_counter() - start) / charts
+
+        a = np.asarray(Image.open(os.path.join(tmp, "legacy_0.png")))
+        b = np.asarray(Image.open(os.path.join(tmp, "renderer_0.png")))
+        differing = (a != b).any(axis=-1).mean() * 100
+
+    print(f"{label:<24}{df.size:>10,}{timings['legacy']:>11.2f}s{timings['renderer']:>11.2f}s"
+          f"{timings['legacy'] / timings['renderer']:>9.1f}x{differing:>12.2f}%")
+
+
+if __name__ == "__main__":
+    print(f"{'case':<24}{'points':>10}{'legacy':>12}{'renderer':>12}{'speedup':>10}{'px differ':>13}")
+    run("5 positions, 10y", daily_history(5, 10))
+    run("20 positions, 20y", daily_history(20, 20))
+    run("20 positions, 40y", daily_history(20, 40))
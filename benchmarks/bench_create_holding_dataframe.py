@@ -0,0 +1,136 @@
+# Benchmark for DataFormatting.create_holding_dataframe against the original merge-and-apply implementation.
+#
+# Run from the repository root:
+#     python benchmarks/bench_create_holding_dataframe.py
+#
+# Each of the five fixtures in test_data/create_holding_dataframe is timed as is, and again grown to
+# 50x its dates, transactions, income payments and prices. Every run also checks the two implementations
+# produce identical frames.
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import DataFormatting
+
+FIXTURES = "./test_data/create_holding_dataframe/"
+
+
+def legacy_create_holding_dataframe(dfTransactions, dfIncome, dsDateSeries, dfClosePrices, positionName, theme):
+    # The implementation create_holding_dataframe replaced, kept as the reference result
+
+    # Fold all data in together
+    dfFinal = pd.merge(dsDateSeries, dfTransactions, on='Settle date', how='left').sort_values(by='Settle date')
+    # multiply the 'Value (£)' by the sign of the 'Quantity' to ensure correct direction of values
+    dfFinal['Value (£)'] = dfFinal['Value (£)'] * dfFinal['Quantity'].apply(lambda x: 1.0 if x >= 0.0 else -1.0)
+    dfFinal = dfFinal.groupby('Settle date').agg(
+        Cumulative_Quantity=('Quantity', 'sum'),
+        Cumulative_Value=('Value (£)', 'sum')
+    ).reset_index()
+    dfFinal['Quantity'] = dfFinal['Cumulative_Quantity'].cumsum()
+    dfFinal['Book cost'] = dfFinal['Cumulative_Value'].cumsum()
+    dfFinal = dfFinal.drop(columns=['Cumulative_Quantity','Cumulative_Value'], errors='ignore')
+    # (1) we want (Settle date, Quantity, Book Cost) over all dates
+
+    # alias dfIncome columns
+    dfIncome = dfIncome.groupby('Settle date').agg(
+        Income_Qty=('Quantity', 'sum'),
+        Income=('Value (£)', 'sum')
+    ).reset_index()
+    dfIncome = dfIncome.rename(columns={'Income_Qty': 'Income Qty'})
+    
+    dfFinal = pd.merge(dfFinal, dfIncome, on='Settle date', how='left').fillna(0)
+    # (2) we want (Settle date, Quantity, Book Cost, Income Qty, Income) over all dates
+
+    dfFinal = pd.merge(dfFinal, dfClosePrices, on='Settle date', how='left').ffill()
+    # (3) we want (Settle date, Quantity, Book Cost, Income Qty, Income, Close) over all dates
+
+    # Add in capital
+    dfLodgements = dfTransactions[dfTransactions['Reference'].str.startswith('L')][['Settle date', 'Value (£)']].rename(columns={'Value (£)': 'Capital'})
+    dfSubscriptions = dfTransactions[dfTransactions['Reference'].str.lower().isin(['fpc', 'card web', 'contrib', 'bacs'])][['Settle date', 'Value (£)']].rename(columns={'Value (£)': 'Capital'})
+    
+    if dfLodgements.empty:
+        dfLodgements = pd.DataFrame(columns=['Settle date', 'Capital'])
+    if dfSubscriptions.empty:
+        dfSubscriptions = pd.DataFrame(columns=['Settle date', 'Capital'])
+
+    dfCapital = pd.concat([dfLodgements, dfSubscriptions], ignore_index=True, sort=False).groupby('Settle date').agg(
+        Capital=('Capital', 'sum')
+    ).reset_index()
+
+    dfFinal = dfFinal.infer_objects(copy=False)
+    dfCapital = dfCapital.infer_objects(copy=False)
+    dfFinal = pd.merge(dfFinal, dfCapital, on='Settle date', how='left').fillna(0)
+    dfFinal['Capital'] = dfFinal['Capital'].cumsum()
+
+    # Filter negative quantities - we dont go short here
+    dfFinal['Quantity'] = dfFinal['Quantity'].apply(lambda x: max(x, 0))
+
+    # Calculate derived columns
+    dfFinal['Market value'] = dfFinal['Quantity'] * dfFinal['Close']
+    dfFinal['Day PnL'] = dfFinal['Market value'].diff().fillna(0)
+    dfFinal['ITD PnL'] = dfFinal['Day PnL'] + dfFinal['Income']
+    dfFinal['ITD PnL'] = dfFinal['ITD PnL'].cumsum()
+
+    # Add static columns
+    dfFinal['Position name'] = positionName
+    dfFinal['Theme'] = theme
+
+    # reorder colummns
+    dfFinal = dfFinal[['Settle date', 'Position name', 'Theme', 'Capital', 'Quantity', 'Book cost', 'Income Qty', 'Income', 'Close', 
+                       'Market value', 'Day PnL', 'ITD PnL']]   
+
+    # Ensure the 'Settle date' is in datetime format
+    dfFinal['Settle date'] = pd.to_datetime(dfFinal['Settle date'])
+
+    # Ensure the 'Position name' is a string
+    dfFinal['Position name'] = dfFinal['Position name'].astype(str)
+    dfFinal['Theme'] = dfFinal['Theme'].astype(str)
+
+    # Ensure numeric columns are in the correct format
+    numeric_columns = ['Quantity', 'Capital', 'Book cost', 'Income Qty', 'Income', 'Close', 'Market value', 'Day PnL', 'ITD PnL']
+    for col in numeric_columns:     
+        dfFinal[col] = pd.to_numeric(dfFinal[col], errors='coerce').astype('float')
+
+    # Return results
+    return dfFinal
+
+
+
+def load_fixture(testNum):
+    dfTransactions = pd.read_csv(f"{FIXTURES}transactions_{testNum}.csv", parse_dates=['Settle date'])
+    dfIncome = pd.read_csv(f"{FIXTURES}income_{testNum}.csv", parse_dates=['Settle date'])
+    dsDateSeries = pd.read_csv(f"{FIXTURES}date_series_{testNum}.csv", parse_dates=['Settle date'])
+    dfClosePrices = pd.read_csv(f"{FIXTURES}close_prices_{testNum}.csv", parse_dates=['Settle date'])
+    return dfTransactions, dfIncome, dsDateSeries, dfClosePrices
+
+
+def scale_fixture(dfTransactions, dfIncome, dsDateSeries, dfClosePrices, factor):
+    # Repeat the fixture factor times back to back, each copy shifted past the end of the one before
+    span = pd.offsets.BDay(len(dsDateSeries))
+
+    def repeat(df):
+        return pd.concat([df.assign(**{'Settle date': df['Settle date'] + span * i}) for i in range(factor)], ignore_index=True)
+
+    return repeat(dfTransactions), repeat(dfIncome), repeat(dsDateSeries), repeat(dfClosePrices)
+
+
+def run(label, inputs, repeat):
+    expected = legacy_create_holding_dataframe(*inputs, 'Test Holding ABC', 'Test Theme')
+    pd.testing.assert_frame_equal(DataFormatting.create_holding_dataframe(*inputs, 'Test Holding ABC', 'Test Theme'), expected)
+
+    legacy = min(timeit.repeat(lambda: legacy_create_holding_dataframe(*inputs, 'Test Holding ABC', 'Test Theme'), number=1, repeat=repeat))
+    vectorised = min(timeit.repeat(lambda: DataFormatting.create_holding_dataframe(*inputs, 'Test Holding ABC', 'Test Theme'), number=1, repeat=repeat))
+    print(f"{label:<28}{len(expected):>10,}{legacy * 1000:>12.2f}{vectorised * 1000:>12.2f}{legacy / vectorised:>9.1f}x")
+
+
+if __name__ == "__main__":
+    print(f"{'case':<28}{'rows':>10}{'legacy ms':>12}{'new ms':>12}{'speedup':>10}")
+    for testNum in range(1, 6):
+        inputs = load_fixture(testNum)
+        run(f"fixture {testNum}", inputs, repeat=50)
+        run(f"50x fixture {testNum}", scale_fixture(*inputs, 50), repeat=20)
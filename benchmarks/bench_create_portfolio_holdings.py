@@ -0,0 +1,80 @@
+# Benchmark for DataFormatting.create_portfolio_holdings against building each position with
+# create_holding_dataframe and concatenating them, as the driver did before.
+#
+# Run from the repository root:
+#     python benchmarks/bench_create_portfolio_holdings.py
+#
+# Synthetic portfolios of 100 and 500 positions over 5 and 20 years are built both ways.
+# Every run also checks the two produce identical frames.
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import DataFormatting
+import DataGeneration as dg
+
+
+def synthetic_portfolio(n_positions, n_years, seed=0):
+    # Each position opens on a random date, trades and pays income now and then, and has a
+    # price on most business days from its first trade
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp('2005-01-03')
+    end = start + pd.offsets.BDay(260 * n_years)
+
+    positions, transactions, income, prices = [], [], [], []
+    for i in range(n_positions):
+        name = f"Holding {i:04d}"
+        dates = pd.bdate_range(start + pd.offsets.BDay(int(rng.integers(0, 260 * n_years // 2))), end)
+        trade_dates = np.sort(rng.choice(dates, size=20, replace=False))
+        quantity = rng.integers(-50, 100, size=20)
+        quantity[0] = 100
+        transactions.append(pd.DataFrame({
+            'Settle date': trade_dates,
+            'Position name': name,
+            'Reference': np.where(rng.random(20) < 0.2, 'L001', 'BUY'),
+            'Quantity': quantity,
+            'Value (£)': rng.uniform(100, 1000, size=20).round(2),
+        }))
+        income_dates = np.sort(rng.choice(dates, size=8, replace=False))
+        income.append(pd.DataFrame({'Settle date': income_dates, 'Position name': name, 'Quantity': 100.0, 'Value (£)': 25.0}))
+        priced = dates[rng.random(len(dates)) < 0.95]
+        prices.append(pd.DataFrame({'Settle date': priced, 'Position name': name, 'Close': 5.0 * rng.normal(1.0, 0.01, len(priced)).cumprod()}))
+        positions.append({'Position name': name, 'Theme': f"Theme {i % 7}", 'First date': dates[0], 'Last date': dates[-1]})
+
+    return (pd.DataFrame(positions), pd.concat(transactions, ignore_index=True),
+            pd.concat(income, ignore_index=True), pd.concat(prices, ignore_index=True))
+
+
+def per_position(dfPositions, dfTransactions, dfIncome, dfClosePrices):
+    frames = []
+    for position in dfPositions.itertuples(index=False):
+        name = position[0]
+        frames.append(DataFormatting.create_holding_dataframe(
+            dfTransactions[dfTransactions['Position name'] == name],
+            dfIncome[dfIncome['Position name'] == name],
+            dg.create_date_series(position[2], position[3]),
+            dfClosePrices[dfClosePrices['Position name'] == name][['Settle date', 'Close']],
+            name,
+            position[1]))
+    return pd.concat(frames, ignore_index=True)
+
+
+def run(label, inputs, repeat):
+    expected = per_position(*inputs)
+    pd.testing.assert_frame_equal(DataFormatting.create_portfolio_holdings(*inputs), expected)
+
+    legacy = min(timeit.repeat(lambda: per_position(*inputs), number=1, repeat=repeat))
+    vectorised = min(timeit.repeat(lambda: DataFormatting.create_portfolio_holdings(*inputs), number=1, repeat=repeat))
+    print(f"{label:<28}{len(expected):>10,}{legacy * 1000:>12.1f}{vectorised * 1000:>12.1f}{legacy / vectorised:>9.1f}x")
+
+
+if __name__ == "__main__":
+    print(f"{'case':<28}{'rows':>10}{'per-pos ms':>12}{'new ms':>12}{'speedup':>10}")
+    run("100 positions, 5y", synthetic_portfolio(100, 5), repeat=3)
+    run("500 positions, 5y", synthetic_portfolio(500, 5), repeat=3)
+    run("500 positions, 20y", synthetic_portfolio(500, 20), repeat=1)
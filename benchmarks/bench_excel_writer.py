@@ -0,0 +1,71 @@
+# Benchmark for the streaming Excel writer in Reports/BaseReport.py against pandas' to_excel.
+#
+# Run from the repository root:
+#     python benchmarks/bench_excel_writer.py
+#
+# A synthetic DailyDetails-shaped frame (one row per position per business day) is written
+# both ways, plus as CSV and Parquet. Each writer is timed on one run and has its peak Python
+# memory traced on another, as tracing slows it down. The streamed workbook is read back and
+# checked against the frame.
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Reports.BaseReport import write_excel_streaming
+
+
+def daily_details(n_positions, n_years, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range('2005-01-03', periods=260 * n_years)
+    df = pd.DataFrame({
+        'Settle date': np.tile(dates, n_positions),
+        'Position name': pd.Categorical(np.repeat([f"Holding {i:04d}" for i in range(n_positions)], len(dates))),
+        'Theme': pd.Categorical(np.repeat([f"Theme {i % 7}" for i in range(n_positions)], len(dates))),
+    })
+    for col in ('Capital', 'Quantity', 'Book cost', 'Income Qty', 'Income', 'Close', 'Market value', 'Day PnL', 'ITD PnL',
+                'Daily Return %', 'Weight %', 'Portfolio Return %', 'ITD Portfolio Return %', '1Y Portfolio Return %'):
+        df[col] = rng.normal(100, 10, len(df))
+    df.loc[df.index[::97], '1Y Portfolio Return %'] = np.nan
+    return df
+
+
+def measure(write):
+    start = time.perf_counter()
+    write()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    write()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def run(label, df):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "out.xlsx")
+        writers = {
+            "to_excel": lambda: df.to_excel(path, sheet_name='Daily Positions', index=False),
+            "streaming": lambda: write_excel_streaming(path, {'Daily Positions': df}),
+            "csv": lambda: df.to_csv(os.path.join(tmp, "out.csv"), index=False),
+            "parquet": lambda: df.to_parquet(os.path.join(tmp, "out.parquet"), index=False),
+        }
+        for name, write in writers.items():
+            elapsed, peak = measure(write)
+            print(f"{label:<24}{len(df):>10,}  {name:<10}{elapsed:>10.1f}s{peak / 2**20:>12.1f} MB")
+
+        write_excel_streaming(path, {'Daily Positions': df})
+        pd.testing.assert_frame_equal(pd.read_excel(path).astype({'Position name': 'category', 'Theme': 'category'}), df)
+
+
+if __name__ == "__main__":
+    print(f"{'case':<24}{'rows':>10}  {'writer':<10}{'time':>11}{'peak mem':>15}")
+    run("20 positions, 5y", daily_details(20, 5))
+    run("25 positions, 10y", daily_details(25, 10))
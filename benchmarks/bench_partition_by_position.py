@@ -0,0 +1,68 @@
+# Benchmark for DataFormatting.partition_by_position against a boolean mask per position.
+#
+# Run from the repository root:
+#     python benchmarks/bench_partition_by_position.py
+#
+# Synthetic transaction and income ledgers of 100k+ rows are split per position both ways,
+# mirroring the three lookups the driver makes for each position (the transactions twice,
+# the income once). Every run also checks the two produce identical slices.
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import DataFormatting
+
+
+def synthetic_ledger(n_rows, n_positions, seed=0):
+    # Rows in date order with positions interleaved at random, as a real ledger is kept
+    rng = np.random.default_rng(seed)
+    names = np.array([f"Holding {i:04d}" for i in range(n_positions)], dtype=object)
+    return pd.DataFrame({
+        'Settle date': pd.Timestamp('2005-01-03') + pd.to_timedelta(np.sort(rng.integers(0, 365 * 20, n_rows)), unit='D'),
+        'Position Name': names[rng.integers(0, n_positions, n_rows)],
+        'Reference': np.where(rng.random(n_rows) < 0.1, 'L123', 'BUY'),
+        'Adj Qty': rng.integers(-100, 100, n_rows),
+        'Value (£)': rng.normal(0, 1000, n_rows).round(2),
+    })
+
+
+def masked(df, dfIncome):
+    for position in df['Position Name'].unique():
+        df[df['Position Name'] == position]
+        df[df['Position Name'] == position]
+        dfIncome[dfIncome['Position Name'] == position]
+
+
+def partitioned(df, dfIncome):
+    transactions = DataFormatting.partition_by_position(df)
+    income = DataFormatting.partition_by_position(dfIncome)
+    no_income = dfIncome.iloc[0:0]
+    for position in df['Position Name'].unique():
+        transactions[position]
+        transactions[position]
+        income.get(position, no_income)
+
+
+def run(label, n_rows, n_positions, repeat):
+    df = synthetic_ledger(n_rows, n_positions)
+    dfIncome = synthetic_ledger(n_rows // 4, n_positions, seed=1)
+
+    parts = DataFormatting.partition_by_position(df)
+    for position in df['Position Name'].unique():
+        pd.testing.assert_frame_equal(parts[position], df[df['Position Name'] == position])
+
+    legacy = min(timeit.repeat(lambda: masked(df, dfIncome), number=1, repeat=repeat))
+    new = min(timeit.repeat(lambda: partitioned(df, dfIncome), number=1, repeat=repeat))
+    print(f"{label:<28}{n_rows:>10,}{n_positions:>11,}{legacy * 1000:>12.1f}{new * 1000:>12.1f}{legacy / new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    print(f"{'case':<28}{'rows':>10}{'positions':>11}{'masked ms':>12}{'new ms':>12}{'speedup':>10}")
+    run("100k rows, 50 positions", 100_000, 50, repeat=5)
+    run("100k rows, 500 positions", 100_000, 500, repeat=3)
+    run("1m rows, 500 positions", 1_000_000, 500, repeat=1)
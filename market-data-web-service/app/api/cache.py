@@ -1,9 +1,10 @@
 import structlog
 from fastapi import APIRouter, Depends, Path
 
+from app.cache.memory import MemoryCache, get_memory_cache
 from app.cache.repository import CacheRepository
 from app.config import Settings, get_settings
-from app.models.pricing import CacheClearResponse, CacheDeleteResponse
+from app.models.pricing import CacheClearResponse, CacheDeleteResponse, CacheStatsResponse
 
 logger = structlog.get_logger(__name__)
 
@@ -12,12 +13,26 @@ router = APIRouter(prefix="/cache", tags=["Cache Management"])
 _TICKER_PATTERN = r"^[A-Za-z0-9.\-\^=]+$"
 
 
+@router.get("/stats", response_model=CacheStatsResponse)
+async def get_cache_stats(
+    memory: MemoryCache = Depends(get_memory_cache),
+) -> CacheStatsResponse:
+    return CacheStatsResponse(
+        entries=len(memory),
+        max_entries=memory.max_entries,
+        hits=memory.hits,
+        misses=memory.misses,
+        evictions=memory.evictions,
+    )
+
+
 @router.delete("/{ticker}", response_model=CacheDeleteResponse)
 async def delete_ticker_cache(
     ticker: str = Path(..., min_length=1, pattern=_TICKER_PATTERN),
     settings: Settings = Depends(get_settings),
+    memory: MemoryCache = Depends(get_memory_cache),
 ) -> CacheDeleteResponse:
-    repo = CacheRepository(settings.cache.directory)
+    repo = CacheRepository(settings.cache.directory, settings.cache.format, memory)
     deleted = repo.delete(ticker)
     logger.info("cache_delete_ticker", ticker=ticker, deleted=deleted)
     return CacheDeleteResponse(ticker=ticker, deleted=deleted)
@@ -26,8 +41,9 @@ async def delete_ticker_cache(
 @router.delete("", response_model=CacheClearResponse)
 async def clear_all_cache(
     settings: Settings = Depends(get_settings),
+    memory: MemoryCache = Depends(get_memory_cache),
 ) -> CacheClearResponse:
-    repo = CacheRepository(settings.cache.directory)
+    repo = CacheRepository(settings.cache.directory, settings.cache.format, memory)
     count = repo.delete_all()
     logger.info("cache_delete_all", deleted_count=count)
     return CacheClearResponse(deleted_count=count)
@@ -0,0 +1,19 @@
+import structlog
+from fastapi import APIRouter, Depends
+
+from app.config import Settings, get_settings
+from app.models.pricing import FallbackReloadResponse
+from app.repositories.fallback_config import get_fallback_config_repository
+
+logger = structlog.get_logger(__name__)
+
+router = APIRouter(prefix="/fallback", tags=["Fallback Configuration"])
+
+
+@router.post("/reload", response_model=FallbackReloadResponse)
+async def reload_fallback_config(
+    settings: Settings = Depends(get_settings),
+) -> FallbackReloadResponse:
+    entries = get_fallback_config_repository(settings.fallback.config_path).reload()
+    logger.info("fallback_config_reload", entries=entries)
+    return FallbackReloadResponse(entries=entries)
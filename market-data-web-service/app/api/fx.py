@@ -3,6 +3,7 @@ from datetime import UTC, date, datetime, timedelta
 import structlog
 from fastapi import APIRouter, Depends, Path, Query
 
+from app.cache.memory import MemoryCache, get_memory_cache
 from app.cache.repository import CacheRepository
 from app.config import Settings, get_settings
 from app.exceptions import InvalidCurrencyPairError, InvalidTickerError
@@ -20,8 +21,11 @@ _PAIR_PATTERN = r"^[A-Za-z]{6}$"
 logger = structlog.get_logger(__name__)
 
 
-def get_fx_provider(settings: Settings = Depends(get_settings)) -> CachedPricingProvider:
-    repo = CacheRepository(settings.cache.directory)
+def get_fx_provider(
+    settings: Settings = Depends(get_settings),
+    memory: MemoryCache = Depends(get_memory_cache),
+) -> CachedPricingProvider:
+    repo = CacheRepository(settings.cache.directory, settings.cache.format, memory)
     return CachedPricingProvider(FxInnerProvider(YFinanceProvider()), repo)
 
 
@@ -6,7 +6,7 @@ from app.providers.identifier_provider import (
     FallbackIdentifierProvider,
     YFinanceIdentifierProvider,
 )
-from app.repositories.fallback_config import FallbackConfigRepository
+from app.repositories.fallback_config import get_fallback_config_repository
 from app.services.identifier_service import IdentifierService
 
 router = APIRouter(prefix="/identifiers", tags=["Identifiers"])
@@ -15,7 +15,7 @@ router = APIRouter(prefix="/identifiers", tags=["Identifiers"])
 def get_identifier_service(
     settings: Settings = Depends(get_settings),
 ) -> IdentifierService:
-    fallback_repo = FallbackConfigRepository(settings.fallback.config_path)
+    fallback_repo = get_fallback_config_repository(settings.fallback.config_path)
     provider = FallbackIdentifierProvider(
         inner=YFinanceIdentifierProvider(), fallback_repo=fallback_repo
     )
@@ -1,15 +1,23 @@
 from datetime import date
 
 from fastapi import APIRouter, Depends, Path, Query
+from fastapi.concurrency import run_in_threadpool
 
+from app.cache.memory import MemoryCache, get_memory_cache
 from app.cache.repository import CacheRepository
 from app.config import Settings, get_settings
-from app.models.pricing import PriceHistoryResponse, PriceResponse
+from app.models.pricing import (
+    BatchHistoryRequest,
+    BatchHistoryResponse,
+    PriceHistoryResponse,
+    PriceResponse,
+)
 from app.providers.cached_provider import CachedPricingProvider
 from app.providers.fallback_provider import FallbackPricingProvider
 from app.providers.fx_provider import FxInnerProvider
 from app.providers.yfinance_provider import YFinanceProvider
-from app.repositories.fallback_config import FallbackConfigRepository
+from app.repositories.fallback_config import get_fallback_config_repository
+from app.services.batch_history_service import BatchHistoryService
 from app.services.currency_service import CurrencyService
 from app.services.fx_aligner import FxAligner
 from app.services.gap_fill import GapFillService
@@ -22,22 +30,35 @@ router = APIRouter(prefix="/securities", tags=["Securities"])
 _TICKER_PATTERN = r"^[A-Za-z0-9.\-\^=]+$"
 
 
-def get_pricing_service(settings: Settings = Depends(get_settings)) -> PricingService:
-    repo = CacheRepository(settings.cache.directory)
+def get_pricing_service(
+    settings: Settings = Depends(get_settings),
+    memory: MemoryCache = Depends(get_memory_cache),
+) -> PricingService:
+    repo = CacheRepository(settings.cache.directory, settings.cache.format, memory)
     yf_provider = CachedPricingProvider(YFinanceProvider(), repo)
-    fallback_repo = FallbackConfigRepository(settings.fallback.config_path)
+    fallback_repo = get_fallback_config_repository(settings.fallback.config_path)
     provider = FallbackPricingProvider(inner=yf_provider, fallback_repo=fallback_repo)
     return PricingService(
         provider=provider, gap_fill=GapFillService(), normaliser=SubUnitNormaliser()
     )
 
 
-def get_currency_service(settings: Settings = Depends(get_settings)) -> CurrencyService:
-    repo = CacheRepository(settings.cache.directory)
+def get_currency_service(
+    settings: Settings = Depends(get_settings),
+    memory: MemoryCache = Depends(get_memory_cache),
+) -> CurrencyService:
+    repo = CacheRepository(settings.cache.directory, settings.cache.format, memory)
     fx_provider = CachedPricingProvider(FxInnerProvider(YFinanceProvider()), repo)
     return CurrencyService(fx_provider=fx_provider, aligner=FxAligner(), gap_fill=GapFillService())
 
 
+def get_batch_history_service(
+    service: PricingService = Depends(get_pricing_service),
+    currency_svc: CurrencyService = Depends(get_currency_service),
+) -> BatchHistoryService:
+    return BatchHistoryService(pricing=service, currency=currency_svc)
+
+
 @router.get("/{ticker}/price", response_model=PriceResponse)
 async def get_current_price(
     ticker: str = Path(..., min_length=1, pattern=_TICKER_PATTERN),
@@ -75,3 +96,14 @@ async def get_price_history(
             ticker, response, currency, resolved_from, resolved_to
         )
     return response
+
+
+@router.post("/history:batch", response_model=BatchHistoryResponse)
+async def get_price_history_batch(
+    request: BatchHistoryRequest,
+    service: BatchHistoryService = Depends(get_batch_history_service),
+) -> BatchHistoryResponse:
+    if request.currency is not None:
+        validate_currency_code(request.currency)
+    # Run off the event loop, so other requests are served while the batch is fetched
+    return await run_in_threadpool(service.get_histories, request.items, request.currency)
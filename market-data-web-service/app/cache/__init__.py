@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import date
+
+
+class CacheBackend(ABC):
+    """Storage format for one cached (date, close) series per ticker."""
+
+    @abstractmethod
+    def read(self, ticker: str) -> list[tuple[date, float]] | None:
+        ...
+
+    @abstractmethod
+    def write(self, ticker: str, records: Sequence[tuple[date, float]]) -> None:
+        ...
+
+    @abstractmethod
+    def append(self, ticker: str, records: Sequence[tuple[date, float]]) -> bool:
+        """Append records dated after the cached series without rewriting it.
+
+        Returns False, leaving the entry untouched, when the records do not all
+        fall after the last cached date or there is no entry to append to.
+        """
+        ...
+
+    @abstractmethod
+    def delete(self, ticker: str) -> bool:
+        ...
+
+    @abstractmethod
+    def delete_all(self) -> int:
+        ...
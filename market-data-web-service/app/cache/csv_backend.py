@@ -0,0 +1,105 @@
+import csv
+import os
+from collections.abc import Sequence
+from datetime import date
+from pathlib import Path
+
+import structlog
+
+from app.cache import CacheBackend
+from app.cache.paths import cache_path
+
+logger = structlog.get_logger(__name__)
+
+
+class CsvCacheBackend(CacheBackend):
+    """Reads and writes one ``{ticker}.csv`` file per ticker in the cache directory."""
+
+    suffix = ".csv"
+
+    def __init__(self, cache_dir: Path) -> None:
+        self._dir = cache_dir
+
+    def read(self, ticker: str) -> list[tuple[date, float]] | None:
+        """Return sorted (date, close) rows or None if no file / unreadable."""
+        path = cache_path(self._dir, ticker, self.suffix)
+        if not path.exists():
+            return None
+
+        try:
+            with path.open(newline="", encoding="utf-8") as f:
+                records = [
+                    (date.fromisoformat(row["date"]), float(row["close"]))
+                    for row in csv.DictReader(f)
+                ]
+        except (OSError, KeyError, ValueError) as exc:
+            logger.warning("cache_read_error", ticker=ticker, path=str(path), error=str(exc))
+            return None
+
+        if not records:
+            return None
+        return sorted(records, key=lambda x: x[0])
+
+    def write(self, ticker: str, records: Sequence[tuple[date, float]]) -> None:
+        """Atomically write sorted records to {ticker}.csv."""
+        self._dir.mkdir(parents=True, exist_ok=True)
+        path = cache_path(self._dir, ticker, self.suffix)
+        tmp_path = path.with_suffix(".csv.tmp")
+
+        with tmp_path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["date", "close"])
+            for d, close in sorted(records, key=lambda x: x[0]):
+                writer.writerow([d.isoformat(), close])
+
+        os.replace(tmp_path, path)
+
+    def append(self, ticker: str, records: Sequence[tuple[date, float]]) -> bool:
+        """Append rows to {ticker}.csv when they all follow its last row."""
+        path = cache_path(self._dir, ticker, self.suffix)
+        last = self._last_date(path)
+        ordered = sorted(records, key=lambda x: x[0])
+        if last is None or not ordered or ordered[0][0] <= last:
+            return False
+
+        with path.open("a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            for d, close in ordered:
+                writer.writerow([d.isoformat(), close])
+        return True
+
+    def delete(self, ticker: str) -> bool:
+        """Remove {ticker}.csv. Returns True if deleted, False if not found."""
+        path = cache_path(self._dir, ticker, self.suffix)
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+    def delete_all(self) -> int:
+        """Remove all *.csv files. Returns count deleted."""
+        if not self._dir.exists():
+            return 0
+        count = 0
+        for path in self._dir.glob("*.csv"):
+            path.unlink()
+            count += 1
+        return count
+
+    @staticmethod
+    def _last_date(path: Path) -> date | None:
+        # Rows are written in date order, so only the tail of the file needs reading.
+        try:
+            with path.open("rb") as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - 256))
+                tail = f.read().decode("utf-8").splitlines()
+        except OSError:
+            return None
+        if not tail:
+            return None
+        try:
+            return date.fromisoformat(tail[-1].split(",", 1)[0])
+        except ValueError:
+            return None
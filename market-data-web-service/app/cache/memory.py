@@ -0,0 +1,81 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from datetime import date
+from pathlib import Path
+
+import structlog
+
+from app.config import get_settings
+
+logger = structlog.get_logger(__name__)
+
+_Key = tuple[Path, str]
+
+
+class MemoryCache:
+    """Process-wide LRU of parsed price series, keyed by cache directory and ticker.
+
+    Holds at most ``max_entries`` series; the least recently used is evicted first.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[_Key, tuple[tuple[date, float], ...]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, cache_dir: Path, ticker: str) -> list[tuple[date, float]] | None:
+        key = (cache_dir, ticker)
+        with self._lock:
+            records = self._entries.get(key)
+            if records is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return list(records)
+
+    def put(self, cache_dir: Path, ticker: str, records: Sequence[tuple[date, float]]) -> None:
+        if self.max_entries <= 0:
+            return
+        key = (cache_dir, ticker)
+        with self._lock:
+            self._entries[key] = tuple(records)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self.evictions += 1
+                logger.debug("memory_cache_evict", ticker=evicted[1])
+
+    def extend(self, cache_dir: Path, ticker: str, records: Sequence[tuple[date, float]]) -> None:
+        """Add records to the end of a held series; does nothing if it is not held."""
+        key = (cache_dir, ticker)
+        with self._lock:
+            held = self._entries.get(key)
+            if held is not None:
+                self._entries[key] = held + tuple(sorted(records, key=lambda x: x[0]))
+
+    def invalidate(self, cache_dir: Path, ticker: str) -> None:
+        with self._lock:
+            self._entries.pop((cache_dir, ticker), None)
+
+    def invalidate_dir(self, cache_dir: Path) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == cache_dir]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_memory_cache: MemoryCache | None = None
+
+
+def get_memory_cache() -> MemoryCache:
+    global _memory_cache
+    if _memory_cache is None:
+        _memory_cache = MemoryCache(get_settings().cache.memory_entries)
+    return _memory_cache
@@ -0,0 +1,137 @@
+import os
+from collections.abc import Sequence
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+import structlog
+
+from app.cache import CacheBackend
+from app.cache.paths import cache_path
+from app.models.series import PriceSeries
+
+logger = structlog.get_logger(__name__)
+
+# One fixed-width record per trading day: days since 1970-01-01, then the close.
+RECORD_DTYPE = np.dtype([("date", "<M8[D]"), ("close", "<f8")])
+
+
+def to_records(records: Sequence[tuple[date, float]]) -> npt.NDArray[np.void]:
+    """Pack (date, close) tuples into a date-sorted structured array."""
+    if isinstance(records, PriceSeries):
+        packed = np.empty(len(records), dtype=RECORD_DTYPE)
+        packed["date"], packed["close"] = records.dates, records.closes
+        return packed
+    packed = np.array(records, dtype=RECORD_DTYPE)
+    return packed[np.argsort(packed["date"], kind="stable")]
+
+
+def from_records(packed: npt.NDArray[np.void]) -> list[tuple[date, float]]:
+    return list(zip(packed["date"].tolist(), packed["close"].tolist(), strict=True))
+
+
+class PackedCacheBackend(CacheBackend):
+    """Stores each ticker as a packed binary array in ``{ticker}.bin``.
+
+    Reading is a single ``np.fromfile`` with no per-row parsing, and extending a
+    series forward appends its new records to the end of the file.
+    """
+
+    suffix = ".bin"
+
+    def __init__(self, cache_dir: Path) -> None:
+        self._dir = cache_dir
+
+    def read(self, ticker: str) -> list[tuple[date, float]] | None:
+        """Return sorted (date, close) rows or None if no file / unreadable."""
+        packed = self.read_array(ticker)
+        if packed is None:
+            return None
+        return from_records(packed)
+
+    def read_array(self, ticker: str) -> npt.NDArray[np.void] | None:
+        path = cache_path(self._dir, ticker, self.suffix)
+        try:
+            raw = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as exc:
+            logger.warning("cache_read_error", ticker=ticker, path=str(path), error=str(exc))
+            return None
+
+        whole = len(raw) - len(raw) % RECORD_DTYPE.itemsize
+        if whole != len(raw):
+            # An interrupted append leaves a partial trailing record; the complete ones are sound.
+            logger.warning(
+                "cache_read_error",
+                ticker=ticker,
+                path=str(path),
+                error=f"ignoring {len(raw) - whole} trailing byte(s)",
+            )
+        if whole == 0:
+            return None
+        return np.frombuffer(raw[:whole], dtype=RECORD_DTYPE)
+
+    def write(self, ticker: str, records: Sequence[tuple[date, float]]) -> None:
+        """Atomically write sorted records to {ticker}.bin."""
+        self._dir.mkdir(parents=True, exist_ok=True)
+        path = cache_path(self._dir, ticker, self.suffix)
+        tmp_path = path.with_suffix(".bin.tmp")
+
+        to_records(records).tofile(tmp_path)
+        os.replace(tmp_path, path)
+
+    def append(self, ticker: str, records: Sequence[tuple[date, float]]) -> bool:
+        """Append records to {ticker}.bin when they all follow its last record."""
+        path = cache_path(self._dir, ticker, self.suffix)
+        last = self._last_date(path)
+        if last is None or not records:
+            return False
+
+        packed = to_records(records)
+        if packed["date"][0] <= last:
+            return False
+
+        with path.open("r+b") as f:
+            # Drop any partial record left by an interrupted append before adding more.
+            size = f.seek(0, os.SEEK_END)
+            f.truncate(size - size % RECORD_DTYPE.itemsize)
+            f.seek(0, os.SEEK_END)
+            f.write(packed.tobytes())
+        return True
+
+    def delete(self, ticker: str) -> bool:
+        """Remove {ticker}.bin. Returns True if deleted, False if not found."""
+        path = cache_path(self._dir, ticker, self.suffix)
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+    def delete_all(self) -> int:
+        """Remove all *.bin files. Returns count deleted."""
+        if not self._dir.exists():
+            return 0
+        count = 0
+        for path in self._dir.glob("*.bin"):
+            path.unlink()
+            count += 1
+        return count
+
+    @staticmethod
+    def _last_date(path: Path) -> np.datetime64 | None:
+        itemsize = RECORD_DTYPE.itemsize
+        try:
+            with path.open("rb") as f:
+                size = f.seek(0, os.SEEK_END)
+                whole = size - size % itemsize
+                if whole == 0:
+                    return None
+                f.seek(whole - itemsize)
+                last = np.frombuffer(f.read(itemsize), dtype=RECORD_DTYPE)
+        except OSError:
+            return None
+        last_date: np.datetime64 = last["date"][0]
+        return last_date
@@ -0,0 +1,10 @@
+import re
+from pathlib import Path
+
+_UNSAFE_CHARS = re.compile(r'[\\/:*?"<>|^]')
+
+
+def cache_path(cache_dir: Path, ticker: str, suffix: str) -> Path:
+    """Return the cache file for ticker, with filesystem-unsafe characters replaced."""
+    safe = _UNSAFE_CHARS.sub("_", ticker)
+    return cache_dir / f"{safe}{suffix}"
@@ -0,0 +1,102 @@
+from collections.abc import Sequence
+from datetime import date
+from pathlib import Path
+
+import structlog
+
+from app.cache import CacheBackend
+from app.cache.csv_backend import CsvCacheBackend
+from app.cache.memory import MemoryCache
+from app.cache.packed_backend import PackedCacheBackend
+
+logger = structlog.get_logger(__name__)
+
+_BACKENDS: dict[str, type[CsvCacheBackend] | type[PackedCacheBackend]] = {
+    "csv": CsvCacheBackend,
+    "packed": PackedCacheBackend,
+}
+
+
+class CacheRepository:
+    """Per-ticker price history cache, stored in the configured format.
+
+    ``csv`` keeps one human-readable ``{ticker}.csv`` per ticker. ``packed`` keeps
+    one binary ``{ticker}.bin`` of fixed-width (date, close) records. When a
+    ``MemoryCache`` is given, parsed series are served from it ahead of the files
+    and every change through this repository invalidates or refreshes it.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        cache_format: str = "csv",
+        memory: MemoryCache | None = None,
+    ) -> None:
+        self._dir = cache_dir
+        self._backend: CacheBackend = _BACKENDS[cache_format](cache_dir)
+        self._memory = memory
+
+    def read(self, ticker: str) -> list[tuple[date, float]] | None:
+        """Return sorted (date, close) rows or None if no entry / unreadable."""
+        if self._memory is not None:
+            records = self._memory.get(self._dir, ticker)
+            if records is not None:
+                return records
+
+        records = self._backend.read(ticker)
+        if records is not None and self._memory is not None:
+            self._memory.put(self._dir, ticker, records)
+        return records
+
+    def write(self, ticker: str, records: Sequence[tuple[date, float]]) -> None:
+        """Atomically replace the entry for ticker with records."""
+        self._backend.write(ticker, records)
+        if self._memory is not None:
+            self._memory.put(self._dir, ticker, sorted(records, key=lambda x: x[0]))
+
+    def append(self, ticker: str, records: Sequence[tuple[date, float]]) -> bool:
+        """Extend the entry for ticker with records dated after its last row.
+
+        Returns False without changing the entry when the records cannot simply be
+        appended; the caller should write the merged series instead.
+        """
+        appended = self._backend.append(ticker, records)
+        if appended and self._memory is not None:
+            self._memory.extend(self._dir, ticker, records)
+        return appended
+
+    def delete(self, ticker: str) -> bool:
+        """Remove the entry for ticker. Returns True if deleted, False if not found."""
+        if self._memory is not None:
+            self._memory.invalidate(self._dir, ticker)
+        return self._backend.delete(ticker)
+
+    def delete_all(self) -> int:
+        """Remove every entry. Returns count deleted."""
+        if self._memory is not None:
+            self._memory.invalidate_dir(self._dir)
+        return self._backend.delete_all()
+
+
+def migrate_csv_cache(cache_dir: Path) -> int:
+    """Convert every ``{ticker}.csv`` in cache_dir to the packed format.
+
+    Each CSV is removed once its packed copy is written, so running this again is
+    a no-op. Unreadable CSVs are left in place. Returns the number migrated.
+    """
+    csv_backend = CsvCacheBackend(cache_dir)
+    packed_backend = PackedCacheBackend(cache_dir)
+    migrated = 0
+    for path in sorted(cache_dir.glob("*.csv")):
+        # The file stem is the sanitised ticker, which maps back to the same file names.
+        records = csv_backend.read(path.stem)
+        if records is None:
+            logger.warning("cache_migrate_skipped", path=str(path))
+            continue
+        packed_backend.write(path.stem, records)
+        path.unlink()
+        migrated += 1
+
+    if migrated:
+        logger.info("cache_migrated", from_format="csv", to_format="packed", tickers=migrated)
+    return migrated
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 
 import yaml
 from pydantic import BaseModel
@@ -6,6 +7,8 @@ from pydantic import BaseModel
 
 class CacheSettings(BaseModel):
     directory: Path = Path("./cache")
+    format: Literal["csv", "packed"] = "csv"
+    memory_entries: int = 256
 
 
 class FallbackSettings(BaseModel):
@@ -6,7 +6,8 @@ import structlog
 from fastapi import FastAPI, Request, Response
 from fastapi.responses import JSONResponse
 
-from app.api import cache, fx, identifiers, securities
+from app.api import cache, fallback, fx, identifiers, securities
+from app.cache.repository import migrate_csv_cache
 from app.config import load_settings
 from app.exceptions import (
     CurrencyUnavailableError,
@@ -31,6 +32,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     settings = load_settings()
     settings.cache.directory.mkdir(parents=True, exist_ok=True)
     logger.info("cache_dir_ready", path=str(settings.cache.directory))
+    if settings.cache.format == "packed":
+        migrate_csv_cache(settings.cache.directory)
     yield
 
 
@@ -45,6 +48,7 @@ app.include_router(securities.router)
 app.include_router(cache.router)
 app.include_router(fx.router)
 app.include_router(identifiers.router)
+app.include_router(fallback.router)
 
 
 @app.middleware("http")
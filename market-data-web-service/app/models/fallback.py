@@ -11,6 +11,9 @@ class FallbackEntry(BaseModel):
     date_column: str
     price_column: str
     use_local_only: bool = False
+    # strptime format of the date column, e.g. "%d/%m/%Y". Dates that do not match it are
+    # parsed by dateutil, as is every date other than YYYY-MM-DD when it is not set.
+    date_format: str | None = None
 
     @field_validator("currency")
     @classmethod
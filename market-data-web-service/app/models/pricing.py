@@ -1,7 +1,7 @@
 from datetime import date, datetime
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PricePoint(BaseModel):
@@ -38,6 +38,36 @@ class PriceHistoryResponse(BaseModel):
     prices: list[PricePoint]
 
 
+class ErrorResponse(BaseModel):
+    detail: str
+    code: str | None = None
+
+
+class BatchHistoryItem(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    # The ticker format is checked per item, so one bad ticker does not fail the whole batch.
+    ticker: str = Field(min_length=1)
+    from_date: date | None = Field(default=None, alias="from")
+    to_date: date | None = Field(default=None, alias="to")
+
+
+class BatchHistoryRequest(BaseModel):
+    items: list[BatchHistoryItem] = Field(min_length=1)
+    currency: str | None = None
+
+
+class BatchHistoryEntry(BaseModel):
+    ticker: str
+    status_code: int
+    history: PriceHistoryResponse | None = None
+    error: ErrorResponse | None = None
+
+
+class BatchHistoryResponse(BaseModel):
+    entries: list[BatchHistoryEntry]
+
+
 class TickerResolutionResponse(BaseModel):
     identifier: str
     identifier_type: str
@@ -46,11 +76,6 @@ class TickerResolutionResponse(BaseModel):
     exchange: str
 
 
-class ErrorResponse(BaseModel):
-    detail: str
-    code: str | None = None
-
-
 class CacheDeleteResponse(BaseModel):
     ticker: str
     deleted: bool
@@ -58,3 +83,15 @@ class CacheDeleteResponse(BaseModel):
 
 class CacheClearResponse(BaseModel):
     deleted_count: int
+
+
+class CacheStatsResponse(BaseModel):
+    entries: int
+    max_entries: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class FallbackReloadResponse(BaseModel):
+    entries: int
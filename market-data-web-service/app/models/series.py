@@ -0,0 +1,81 @@
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import date
+from typing import overload
+
+import numpy as np
+import numpy.typing as npt
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def to_day_array(dates: Iterable[date], count: int = -1) -> npt.NDArray[np.datetime64]:
+    """Convert dates to a datetime64[D] array.
+
+    Goes via each date's ordinal, which is far faster than numpy parsing date objects.
+    """
+    ordinals = np.fromiter((d.toordinal() for d in dates), np.int64, count)
+    return (ordinals - _EPOCH_ORDINAL).astype("datetime64[D]")
+
+
+class PriceSeries(Sequence[tuple[date, float]]):
+    """A date-sorted price or rate series held as two arrays.
+
+    Reads as a sequence of ``(date, close)`` tuples, so it can be passed anywhere a
+    list of them is expected, while array-based code can use ``dates`` (datetime64[D])
+    and ``closes`` (float64) directly without converting each row.
+    """
+
+    __slots__ = ("closes", "dates")
+
+    def __init__(
+        self, dates: npt.NDArray[np.datetime64], closes: npt.NDArray[np.float64]
+    ) -> None:
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        closes = np.asarray(closes, dtype=np.float64)
+        if dates.shape != closes.shape:
+            raise ValueError("dates and closes must be the same length")
+        order = np.argsort(dates, kind="stable")
+        self.dates = dates[order]
+        self.closes = closes[order]
+
+    @classmethod
+    def from_records(cls, records: Iterable[tuple[date, float]]) -> "PriceSeries":
+        if isinstance(records, PriceSeries):
+            return records
+        records = list(records)
+        return cls(
+            to_day_array((d for d, _ in records), len(records)),
+            np.fromiter((c for _, c in records), np.float64, len(records)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @overload
+    def __getitem__(self, index: int) -> tuple[date, float]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "PriceSeries": ...
+
+    def __getitem__(self, index: int | slice) -> "tuple[date, float] | PriceSeries":
+        if isinstance(index, slice):
+            return PriceSeries(self.dates[index], self.closes[index])
+        return self.dates[index].item(), float(self.closes[index])
+
+    def __iter__(self) -> Iterator[tuple[date, float]]:
+        return zip(self.dates.tolist(), self.closes.tolist(), strict=True)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PriceSeries):
+            return bool(
+                np.array_equal(self.dates, other.dates)
+                and np.array_equal(self.closes, other.closes)
+            )
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"PriceSeries({len(self)} rows)"
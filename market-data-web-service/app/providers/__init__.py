@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from datetime import date
 
 
@@ -10,5 +11,5 @@ class PricingProvider(ABC):
     @abstractmethod
     def get_price_history(
         self, ticker: str, from_date: date, to_date: date
-    ) -> list[tuple[date, float]]:
+    ) -> Sequence[tuple[date, float]]:
         ...
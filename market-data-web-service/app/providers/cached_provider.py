@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from datetime import date, timedelta
 
 import structlog
@@ -19,7 +20,7 @@ class CachedPricingProvider(PricingProvider):
 
     def get_price_history(
         self, ticker: str, from_date: date, to_date: date
-    ) -> list[tuple[date, float]]:
+    ) -> Sequence[tuple[date, float]]:
         cached = self._repo.read(ticker)
 
         if cached is None:
@@ -28,8 +29,8 @@ class CachedPricingProvider(PricingProvider):
         cached_min = cached[0][0]
         cached_max = cached[-1][0]
 
-        before: list[tuple[date, float]] = []
-        after: list[tuple[date, float]] = []
+        before: Sequence[tuple[date, float]] = []
+        after: Sequence[tuple[date, float]] = []
 
         if from_date < cached_min:
             before = self._fetch_segment(ticker, from_date, cached_min - timedelta(days=1))
@@ -48,19 +49,23 @@ class CachedPricingProvider(PricingProvider):
             return [(d, c) for d, c in cached if from_date <= d <= to_date]
 
         merged = self._merge(cached, before, after)
-        self._repo.write(ticker, merged)
         logger.info(
             "cache_partial_hit",
             ticker=ticker,
             segments_fetched=int(bool(before)) + int(bool(after)),
             records_added=len(before) + len(after),
         )
-        logger.info("cache_write", ticker=ticker, total_records=len(merged))
+        # Extending forward is the common case and only needs the new rows appended.
+        if not before and self._repo.append(ticker, after):
+            logger.info("cache_append", ticker=ticker, records_appended=len(after))
+        else:
+            self._repo.write(ticker, merged)
+            logger.info("cache_write", ticker=ticker, total_records=len(merged))
         return [(d, c) for d, c in sorted(merged, key=lambda x: x[0]) if from_date <= d <= to_date]
 
     def _fetch_and_cache(
         self, ticker: str, from_date: date, to_date: date
-    ) -> list[tuple[date, float]]:
+    ) -> Sequence[tuple[date, float]]:
         logger.info(
             "cache_miss",
             ticker=ticker,
@@ -74,7 +79,7 @@ class CachedPricingProvider(PricingProvider):
 
     def _fetch_segment(
         self, ticker: str, from_date: date, to_date: date
-    ) -> list[tuple[date, float]]:
+    ) -> Sequence[tuple[date, float]]:
         try:
             return self._inner.get_price_history(ticker, from_date, to_date)
         except DataNotFoundError:
@@ -96,9 +101,9 @@ class CachedPricingProvider(PricingProvider):
 
     @staticmethod
     def _merge(
-        cached: list[tuple[date, float]],
-        before: list[tuple[date, float]],
-        after: list[tuple[date, float]],
+        cached: Sequence[tuple[date, float]],
+        before: Sequence[tuple[date, float]],
+        after: Sequence[tuple[date, float]],
     ) -> list[tuple[date, float]]:
         combined: dict[date, float] = {}
         for d, c in cached:
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from datetime import date
 
 import structlog
@@ -24,7 +25,7 @@ class FallbackPricingProvider(PricingProvider):
 
     def get_price_history(
         self, ticker: str, from_date: date, to_date: date
-    ) -> list[tuple[date, float]]:
+    ) -> Sequence[tuple[date, float]]:
         entry = self._fallback_repo.lookup(ticker)
 
         if entry is None:
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from datetime import date
 
 from app.providers import PricingProvider
@@ -14,6 +15,6 @@ class FxInnerProvider(PricingProvider):
 
     def get_price_history(
         self, pair: str, from_date: date, to_date: date
-    ) -> list[tuple[date, float]]:
+    ) -> Sequence[tuple[date, float]]:
         fx_ticker = f"{pair}=X"
         return self._inner.get_price_history(fx_ticker, from_date, to_date)
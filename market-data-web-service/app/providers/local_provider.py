@@ -1,23 +1,115 @@
+import os
+import threading
 from datetime import date
+from pathlib import Path
+from typing import TYPE_CHECKING
 
+import numpy as np
+import numpy.typing as npt
 import structlog
 
 from app.exceptions import DataNotFoundError, ProviderUnavailableError
 from app.models.fallback import FallbackEntry
+from app.models.series import PriceSeries
 from app.providers import PricingProvider
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = structlog.get_logger(__name__)
 
 
+# The file and the entry settings that determine how it is parsed.
+_CsvKey = tuple[Path, str, str, str | None]
+# (mtime in ns, size) of the file when it was parsed.
+_Stamp = tuple[int, int]
+
+
+class ParsedCsvCache:
+    """Process-wide cache of parsed fallback CSV series.
+
+    Each series is held with the mtime and size its file had when it was read, and is
+    read again once either changes, so an edited CSV is picked up by the next request.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[_CsvKey, tuple[_Stamp, PriceSeries]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: _CsvKey, stamp: _Stamp) -> PriceSeries | None:
+        with self._lock:
+            held = self._entries.get(key)
+            if held is None or held[0] != stamp:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return held[1]
+
+    def put(self, key: _CsvKey, stamp: _Stamp, series: PriceSeries) -> None:
+        with self._lock:
+            self._entries[key] = (stamp, series)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_parsed_csv_cache: ParsedCsvCache | None = None
+
+
+def get_parsed_csv_cache() -> ParsedCsvCache:
+    global _parsed_csv_cache
+    if _parsed_csv_cache is None:
+        _parsed_csv_cache = ParsedCsvCache()
+    return _parsed_csv_cache
+
+
 class LocalPricingProvider(PricingProvider):
-    def __init__(self, entry: FallbackEntry) -> None:
+    def __init__(self, entry: FallbackEntry, cache: ParsedCsvCache | None = None) -> None:
         self._entry = entry
+        self._cache = cache if cache is not None else get_parsed_csv_cache()
 
     def get_price_history(
         self, ticker: str, from_date: date, to_date: date
-    ) -> list[tuple[date, float]]:
+    ) -> PriceSeries:
+        path = self._entry.csv_path
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError as exc:
+            raise self._not_found(ticker) from exc
+
+        key = (path, self._entry.date_column, self._entry.price_column, self._entry.date_format)
+        # Stamped before reading: a file changed mid-read is simply read again next time.
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        results = self._cache.get(key, stamp)
+        if results is None:
+            results = self._read_csv(ticker)
+            self._cache.put(key, stamp, results)
+        else:
+            logger.debug("local_csv_cache_hit", ticker=ticker, path=str(path))
+
+        if not results:
+            logger.warning(
+                "local_csv_empty", ticker=ticker, path=str(self._entry.csv_path)
+            )
+            raise DataNotFoundError(ticker)
+        return results
+
+    def _not_found(self, ticker: str) -> ProviderUnavailableError:
+        logger.error(
+            "local_csv_not_found", ticker=ticker, path=str(self._entry.csv_path)
+        )
+        return ProviderUnavailableError(
+            f"Fallback CSV file not found: {self._entry.csv_path}"
+        )
+
+    def _read_csv(self, ticker: str) -> PriceSeries:
         import pandas as pd
-        from dateutil import parser as dateutil_parser
 
         logger.debug(
             "local_csv_read_start", ticker=ticker, path=str(self._entry.csv_path)
@@ -26,12 +118,7 @@ class LocalPricingProvider(PricingProvider):
         try:
             df = pd.read_csv(self._entry.csv_path, dtype=str)
         except FileNotFoundError as exc:
-            logger.error(
-                "local_csv_not_found", ticker=ticker, path=str(self._entry.csv_path)
-            )
-            raise ProviderUnavailableError(
-                f"Fallback CSV file not found: {self._entry.csv_path}"
-            ) from exc
+            raise self._not_found(ticker) from exc
 
         if self._entry.date_column not in df.columns:
             raise ProviderUnavailableError(
@@ -44,24 +131,12 @@ class LocalPricingProvider(PricingProvider):
                 f"{self._entry.csv_path}"
             )
 
-        results: list[tuple[date, float]] = []
-        for _, row in df.iterrows():
-            try:
-                parsed_date = dateutil_parser.parse(str(row[self._entry.date_column])).date()
-                price = float(row[self._entry.price_column])
-            except (ValueError, TypeError):
-                continue
-            if price <= 0:
-                continue
-            results.append((parsed_date, price))
-
-        if not results:
-            logger.warning(
-                "local_csv_empty", ticker=ticker, path=str(self._entry.csv_path)
-            )
-            raise DataNotFoundError(ticker)
+        dates = self._parse_dates(df[self._entry.date_column])
+        # Rows whose date or price cannot be read, or whose price is not positive, are skipped.
+        closes = pd.to_numeric(df[self._entry.price_column], errors="coerce").to_numpy(np.float64)
+        keep = ~np.isnat(dates) & (closes > 0)
+        results = PriceSeries(dates[keep], closes[keep])
 
-        results.sort(key=lambda x: x[0])
         logger.debug(
             "local_csv_read_ok",
             ticker=ticker,
@@ -70,6 +145,42 @@ class LocalPricingProvider(PricingProvider):
         )
         return results
 
+    def _parse_dates(self, column: "pd.Series[str]") -> npt.NDArray[np.datetime64]:
+        """Parse the date column to datetime64[D], with NaT where a date cannot be read.
+
+        Dates in the entry's date_format (or, without one, ISO YYYY-MM-DD) are parsed in one
+        vectorised pass; dateutil is only used for the rest, once per distinct value.
+        """
+        import pandas as pd
+        from dateutil import parser as dateutil_parser
+
+        fmt = self._entry.date_format
+        if fmt is None:
+            # restricted to the exact shape dateutil reads the same way
+            iso = column.str.fullmatch(r"\d{4}-\d{2}-\d{2}").to_numpy(dtype=bool, na_value=False)
+            parsed = pd.to_datetime(column.where(iso), format="%Y-%m-%d", errors="coerce")
+        else:
+            parsed = pd.to_datetime(column, format=fmt, errors="coerce")
+        dates: npt.NDArray[np.datetime64] = parsed.to_numpy().astype("datetime64[D]")
+
+        unparsed = np.isnat(dates)
+        if unparsed.any():
+            values = [str(value) for value in column[unparsed]]
+            fallback: dict[str, np.datetime64] = {}
+            for value in set(values):
+                try:
+                    fallback[value] = np.datetime64(dateutil_parser.parse(value).date(), "D")
+                except (ValueError, TypeError):
+                    fallback[value] = np.datetime64("NaT", "D")
+            dates[unparsed] = [fallback[value] for value in values]
+            logger.debug(
+                "local_csv_dateutil_fallback",
+                path=str(self._entry.csv_path),
+                rows=int(unparsed.sum()),
+                distinct=len(fallback),
+            )
+        return dates
+
     def get_current_price(self, ticker: str) -> dict[str, object]:
         from datetime import date as _date
 
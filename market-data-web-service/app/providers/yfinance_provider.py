@@ -1,9 +1,11 @@
 from datetime import date
 
+import numpy as np
 import requests
 import yfinance as yf
 
 from app.exceptions import DataNotFoundError, ProviderUnavailableError
+from app.models.series import PriceSeries
 from app.providers import PricingProvider
 
 _NETWORK_ERRORS = (
@@ -50,7 +52,7 @@ class YFinanceProvider(PricingProvider):
 
     def get_price_history(
         self, ticker: str, from_date: date, to_date: date
-    ) -> list[tuple[date, float]]:
+    ) -> PriceSeries:
         try:
             t = yf.Ticker(ticker)
             df = t.history(start=from_date.isoformat(), end=to_date.isoformat())
@@ -62,14 +64,13 @@ class YFinanceProvider(PricingProvider):
         if df is None or df.empty:
             raise DataNotFoundError(ticker)
 
-        results: list[tuple[date, float]] = []
-        for ts, row in df.iterrows():
-            close = float(row["Close"])
-            if close <= 0:
-                continue
-            results.append((ts.date(), close))
+        # The index is in the exchange's timezone; dropping it keeps each row's local date.
+        dates = df.index.tz_localize(None).to_numpy().astype("datetime64[D]")
+        closes = df["Close"].to_numpy(np.float64)
+        keep = closes > 0
+        results = PriceSeries(dates[keep], closes[keep])
 
         if not results:
             raise DataNotFoundError(ticker)
 
-        return sorted(results, key=lambda x: x[0])
+        return results
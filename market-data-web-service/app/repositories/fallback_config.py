@@ -1,36 +1,45 @@
 import json
+import os
+import threading
 from pathlib import Path
 
 import structlog
+from pydantic import ValidationError
 
 from app.exceptions import ProviderUnavailableError
 from app.models.fallback import FallbackEntry
 
 logger = structlog.get_logger(__name__)
 
+# (mtime in ns, size) of the config file when it was loaded.
+_Stamp = tuple[int, int]
+
 
 class FallbackConfigRepository:
+    """Fallback entries from a JSON config file, keyed by upper-cased identifier.
+
+    The file is parsed and every entry validated once, then loaded again only when its
+    mtime or size changes, so edits are picked up without a restart. An edit that leaves
+    the file unreadable or not valid JSON is logged and the entries loaded before it are
+    kept. An entry that fails validation is logged and left out.
+    """
+
     def __init__(self, config_path: Path | None) -> None:
         self._config_path = config_path
+        self._entries: dict[str, FallbackEntry] | None = None
+        self._stamp: _Stamp | None = None
+        self._lock = threading.Lock()
 
     def lookup(self, identifier: str) -> FallbackEntry | None:
         if self._config_path is None:
             return None
 
-        try:
-            raw = json.loads(self._config_path.read_text(encoding="utf-8"))
-        except FileNotFoundError as exc:
-            raise ProviderUnavailableError(
-                f"Fallback config file not found: {self._config_path}"
-            ) from exc
-
         normalised = identifier.upper()
-        raw_entry = {k.upper(): v for k, v in raw.items()}.get(normalised)
-        if raw_entry is None:
+        entry = self._current().get(normalised)
+        if entry is None:
             logger.debug("fallback_config_miss", identifier=normalised)
             return None
 
-        entry = FallbackEntry.model_validate(raw_entry)
         logger.debug(
             "fallback_config_hit",
             identifier=normalised,
@@ -38,3 +47,87 @@ class FallbackConfigRepository:
             use_local_only=entry.use_local_only,
         )
         return entry
+
+    def reload(self) -> int:
+        """Load the config file now, whether or not it has changed. Returns the entry count.
+
+        Unlike a reload on lookup, a file that is unreadable or not valid JSON raises here
+        rather than leaving the previous entries in place.
+        """
+        if self._config_path is None:
+            return 0
+        with self._lock:
+            self._stamp = _stat(self._config_path)
+            self._entries = _load(self._config_path)
+            return len(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._current()) if self._config_path is not None else 0
+
+    def _current(self) -> dict[str, FallbackEntry]:
+        path = self._config_path
+        if path is None:
+            return {}
+        with self._lock:
+            try:
+                stamp = _stat(path)
+                if self._entries is None or stamp != self._stamp:
+                    # Recorded before loading, so a broken file is not re-read on every lookup.
+                    self._stamp = stamp
+                    self._entries = _load(path)
+            except ProviderUnavailableError as exc:
+                if self._entries is None:
+                    raise
+                logger.error("fallback_config_reload_failed", path=str(path), error=exc.message)
+            return self._entries
+
+
+def _stat(path: Path) -> _Stamp:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError as exc:
+        raise ProviderUnavailableError(f"Fallback config file not found: {path}") from exc
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load(path: Path) -> dict[str, FallbackEntry]:
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError as exc:
+        raise ProviderUnavailableError(f"Fallback config file not found: {path}") from exc
+    except ValueError as exc:
+        raise ProviderUnavailableError(
+            f"Fallback config file is not valid JSON: {path}"
+        ) from exc
+
+    if not isinstance(raw, dict):
+        raise ProviderUnavailableError(f"Fallback config file is not a JSON object: {path}")
+
+    # An invalid entry is skipped on its own, so a typo in one does not stop the others loading.
+    entries: dict[str, FallbackEntry] = {}
+    for key, value in raw.items():
+        try:
+            entries[key.upper()] = FallbackEntry.model_validate(value)
+        except ValidationError as exc:
+            logger.error(
+                "fallback_config_entry_invalid",
+                path=str(path),
+                identifier=key,
+                errors=[error["msg"] for error in exc.errors()],
+            )
+
+    logger.info("fallback_config_loaded", path=str(path), entries=len(entries))
+    return entries
+
+
+_repositories: dict[Path | None, FallbackConfigRepository] = {}
+_repositories_lock = threading.Lock()
+
+
+def get_fallback_config_repository(config_path: Path | None) -> FallbackConfigRepository:
+    """The process-wide repository for config_path, so its entries are loaded only once."""
+    with _repositories_lock:
+        repo = _repositories.get(config_path)
+        if repo is None:
+            repo = _repositories[config_path] = FallbackConfigRepository(config_path)
+        return repo
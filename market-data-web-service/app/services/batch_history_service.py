@@ -0,0 +1,147 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, date, datetime, timedelta
+
+import structlog
+
+from app.exceptions import (
+    CurrencyUnavailableError,
+    DataNotFoundError,
+    FxAlignmentError,
+    InvalidTickerError,
+    ProviderUnavailableError,
+)
+from app.models.pricing import (
+    BatchHistoryEntry,
+    BatchHistoryItem,
+    BatchHistoryResponse,
+    ErrorResponse,
+    PriceHistoryResponse,
+)
+from app.services.currency_service import CurrencyService
+from app.services.pricing_service import PricingService
+
+logger = structlog.get_logger(__name__)
+
+# Mirrors the status codes and error codes of the single-ticker exception handlers in main.py
+_ERROR_STATUS: dict[type[Exception], tuple[int, str]] = {
+    DataNotFoundError: (404, "TICKER_NOT_FOUND"),
+    ProviderUnavailableError: (503, "PROVIDER_UNAVAILABLE"),
+    InvalidTickerError: (422, "INVALID_TICKER"),
+    FxAlignmentError: (404, "FX_ALIGNMENT_ERROR"),
+    CurrencyUnavailableError: (404, "CURRENCY_UNAVAILABLE"),
+}
+
+# Same format as the ticker path parameter of the single-ticker endpoints
+_TICKER_PATTERN = re.compile(r"[A-Za-z0-9.\-\^=]+")
+
+# Upper bound on the tickers of one batch fetched from the providers at the same time
+_MAX_WORKERS = 8
+
+
+class BatchHistoryService:
+    """Serves price histories for many tickers in one call.
+
+    The tickers are fetched concurrently, up to _MAX_WORKERS at a time. Each FX
+    pair needed by the batch is fetched and gap-filled once over the union of
+    the date ranges that use it. A failure for one ticker is reported
+    in its own entry and does not fail the rest of the batch.
+    """
+
+    def __init__(self, pricing: PricingService, currency: CurrencyService) -> None:
+        self._pricing = pricing
+        self._currency = currency
+
+    def get_histories(
+        self, items: list[BatchHistoryItem], target_currency: str | None
+    ) -> BatchHistoryResponse:
+        today = datetime.now(tz=UTC).date()
+        entries: list[BatchHistoryEntry] = []
+        # pair -> indices of entries whose history needs translating with that pair
+        by_pair: dict[str, list[int]] = {}
+        pending: dict[int, tuple[PriceHistoryResponse, date, date]] = {}
+
+        with ThreadPoolExecutor(max_workers=max(1, min(_MAX_WORKERS, len(items)))) as executor:
+            results = list(executor.map(self._fetch, items))
+
+        for item, history in zip(items, results, strict=True):
+            if isinstance(history, Exception):
+                entries.append(self._error_entry(item.ticker, history))
+                continue
+
+            index = len(entries)
+            entries.append(BatchHistoryEntry(ticker=item.ticker, status_code=200, history=history))
+
+            if target_currency is not None and target_currency != history.currency:
+                resolved_to = item.to_date or today
+                resolved_from = item.from_date or (today - timedelta(days=30))
+                pending[index] = (history, resolved_from, resolved_to)
+                by_pair.setdefault(f"{history.currency}{target_currency}", []).append(index)
+
+        for pair, indices in by_pair.items():
+            self._translate_group(entries, pair, [(i, *pending[i]) for i in indices])
+
+        logger.info(
+            "batch_history",
+            tickers=len(items),
+            succeeded=sum(1 for e in entries if e.error is None),
+            fx_pairs=len(by_pair),
+        )
+        return BatchHistoryResponse(entries=entries)
+
+    def _fetch(self, item: BatchHistoryItem) -> PriceHistoryResponse | Exception:
+        try:
+            if not _TICKER_PATTERN.fullmatch(item.ticker):
+                raise InvalidTickerError(item.ticker)
+            return self._pricing.get_price_history(item.ticker, item.from_date, item.to_date)
+        except Exception as exc:
+            return exc
+
+    def _translate_group(
+        self,
+        entries: list[BatchHistoryEntry],
+        pair: str,
+        group: list[tuple[int, PriceHistoryResponse, date, date]],
+    ) -> None:
+        from_date = min(from_d for _, _, from_d, _ in group)
+        to_date = max(to_d for _, _, _, to_d in group)
+        target_currency = pair[3:]
+
+        try:
+            fx_series = self._currency.fetch_fx_series(pair, from_date, to_date)
+        except Exception as exc:
+            for i, history, _, _ in group:
+                entries[i] = self._error_entry(history.ticker, exc)
+            return
+
+        for i, history, _, _ in group:
+            try:
+                prices = self._currency.translate_with_fx_series(
+                    history.ticker, history.prices, pair, fx_series
+                )
+            except Exception as exc:
+                entries[i] = self._error_entry(history.ticker, exc)
+                continue
+            entries[i].history = PriceHistoryResponse(
+                ticker=history.ticker, currency=target_currency, prices=prices
+            )
+
+    @staticmethod
+    def _error_entry(ticker: str, exc: Exception) -> BatchHistoryEntry:
+        known = next(
+            (status for error, status in _ERROR_STATUS.items() if isinstance(exc, error)), None
+        )
+        if known is None:
+            # Anything unexpected fails only this entry, with the 500 a single request would get.
+            logger.error("batch_history_item_error", ticker=ticker, exc_info=exc)
+            status_code, code = 500, "INTERNAL_ERROR"
+            detail = "Internal error while fetching price history"
+        else:
+            status_code, code = known
+            detail = str(getattr(exc, "message", exc))
+        logger.warning("batch_history_item_failed", ticker=ticker, code=code, detail=detail)
+        return BatchHistoryEntry(
+            ticker=ticker,
+            status_code=status_code,
+            error=ErrorResponse(detail=detail, code=code),
+        )
@@ -1,15 +1,22 @@
 from datetime import date, timedelta
 
+import numpy as np
+import numpy.typing as npt
 import structlog
+from pydantic import TypeAdapter
 
 from app.exceptions import CurrencyUnavailableError, FxAlignmentError
 from app.models.pricing import PriceHistoryResponse, PricePoint, PriceResponse
+from app.models.series import to_day_array
 from app.providers import PricingProvider
-from app.services.fx_aligner import FxAligner
+from app.services.fx_aligner import FILL_BACKWARD, FILL_DIRECTIONS, FILL_FORWARD, FxAligner
 from app.services.gap_fill import GapFillService
 
 logger = structlog.get_logger(__name__)
 
+# Validating the translated points as one list is cheaper than building each model, even
+# unvalidated with model_construct.
+_PRICE_POINTS = TypeAdapter(list[PricePoint])
 
 class CurrencyService:
     def __init__(
@@ -89,7 +96,13 @@ class CurrencyService:
     ) -> list[PricePoint]:
         """Translate each price record to target_currency using aligned FX rates."""
         pair = f"{native_currency}{target_currency}"
+        fx_series = self.fetch_fx_series(pair, from_date, to_date)
+        return self.translate_with_fx_series(ticker, records, pair, fx_series)
 
+    def fetch_fx_series(
+        self, pair: str, from_date: date, to_date: date
+    ) -> list[tuple[date, float]]:
+        """Fetch and gap-fill the FX series for pair over [from_date, to_date]."""
         logger.info(
             "fx_fetch",
             pair=pair,
@@ -98,12 +111,27 @@ class CurrencyService:
         )
 
         fx_series = self._fx_provider.get_price_history(pair, from_date, to_date)
-        fx_series = self._gap_fill.fill(fx_series, from_date, to_date)
+        return self._gap_fill.fill(fx_series, from_date, to_date)
 
-        security_dates = [p.date for p in records]
+    def translate_with_fx_series(
+        self,
+        ticker: str,
+        records: list[PricePoint],
+        pair: str,
+        fx_series: list[tuple[date, float]],
+    ) -> list[PricePoint]:
+        """Translate price records using an FX series that has already been fetched."""
+        count = len(records)
+        security_dates = to_day_array((p.date for p in records), count)
+        closes = np.fromiter((p.close for p in records), np.float64, count)
 
         try:
-            aligned = self._aligner.align_rates(pair, security_dates, fx_series)
+            aligned = self._aligner.align_arrays(
+                pair,
+                security_dates,
+                to_day_array((fx_date for fx_date, _ in fx_series), len(fx_series)),
+                np.fromiter((rate for _, rate in fx_series), np.float64, len(fx_series)),
+            )
         except FxAlignmentError as exc:
             logger.error(
                 "fx_align_error",
@@ -113,29 +141,22 @@ class CurrencyService:
             )
             raise
 
-        translated: list[PricePoint] = []
-        for price_point in records:
-            aligned_rate = aligned[price_point.date]
-
-            if aligned_rate.fill_direction != "exact":
-                logger.info(
-                    "fx_align_fill",
-                    pair=pair,
-                    security_date=str(price_point.date),
-                    fx_date_used=str(aligned_rate.fx_date),
-                    fill_direction=aligned_rate.fill_direction,
-                )
-
-            rate = aligned_rate.rate
-            translated.append(
-                PricePoint(
-                    date=price_point.date,
-                    close=round(price_point.close * rate, 6),
-                    fx_rate=rate,
-                )
+        counts = np.bincount(aligned.fill_directions, minlength=len(FILL_DIRECTIONS))
+        if counts[FILL_FORWARD] or counts[FILL_BACKWARD]:
+            logger.info(
+                "fx_align_fill",
+                pair=pair,
+                ticker=ticker,
+                **{direction: int(n) for direction, n in zip(FILL_DIRECTIONS, counts, strict=True)},
             )
 
-        return translated
+        translated = _round(closes * aligned.rates, 6)
+        return _PRICE_POINTS.validate_python(
+            [
+                {"date": p.date, "close": close, "fx_rate": rate}
+                for p, close, rate in zip(records, translated, aligned.rates.tolist(), strict=True)
+            ]
+        )
 
     def build_translated_history(
         self,
@@ -168,3 +189,17 @@ class CurrencyService:
             currency=target_currency,
             prices=translated_prices,
         )
+
+
+def _round(values: npt.NDArray[np.float64], ndigits: int) -> list[float]:
+    """round(value, ndigits) of each value, without calling round() on every one.
+
+    np.round scales each value by 10**ndigits first, which can tip one lying within an ulp
+    of a half the other way, so those few are rounded by round() itself.
+    """
+    scaled = values * 10.0**ndigits
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) <= 4 * np.spacing(np.abs(scaled))
+    rounded: list[float] = np.round(values, ndigits).tolist()
+    for i in np.flatnonzero(near_half).tolist():
+        rounded[i] = round(float(values[i]), ndigits)
+    return rounded
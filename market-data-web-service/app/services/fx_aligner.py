@@ -1,18 +1,21 @@
-from bisect import bisect_left, bisect_right
-from datetime import date
+from typing import NamedTuple
+
+import numpy as np
+import numpy.typing as npt
 
 from app.exceptions import FxAlignmentError
 
+# Fill-direction codes of AlignedRates.fill_directions; FILL_DIRECTIONS[code] is the name logged.
+FILL_EXACT, FILL_FORWARD, FILL_BACKWARD = 0, 1, 2
+FILL_DIRECTIONS = ("exact", "forward", "backward")
 
-class AlignedRate:
-    """Result of aligning a single security date to an FX rate."""
 
-    __slots__ = ("fill_direction", "fx_date", "rate")
+class AlignedRates(NamedTuple):
+    """Result of aligning an array of security dates, element for element."""
 
-    def __init__(self, rate: float, fx_date: date, fill_direction: str) -> None:
-        self.rate = rate
-        self.fx_date = fx_date
-        self.fill_direction = fill_direction  # "exact", "forward", or "backward"
+    rates: npt.NDArray[np.float64]
+    fx_dates: npt.NDArray[np.datetime64]
+    fill_directions: npt.NDArray[np.int8]  # FILL_EXACT, FILL_FORWARD or FILL_BACKWARD
 
 
 class FxAligner:
@@ -22,33 +25,41 @@ class FxAligner:
     (nearest subsequent rate). Raises FxAlignmentError if neither is possible.
     """
 
-    def align_rates(
+    def align_arrays(
         self,
         pair: str,
-        security_dates: list[date],
-        fx_series: list[tuple[date, float]],
-    ) -> dict[date, AlignedRate]:
-        fx_map = dict(fx_series)
-        sorted_fx_dates = sorted(fx_map.keys())
-        result: dict[date, AlignedRate] = {}
-
-        for sec_date in security_dates:
-            if sec_date in fx_map:
-                result[sec_date] = AlignedRate(fx_map[sec_date], sec_date, "exact")
-                continue
-
-            idx = bisect_right(sorted_fx_dates, sec_date) - 1
-            if idx >= 0:
-                fx_date = sorted_fx_dates[idx]
-                result[sec_date] = AlignedRate(fx_map[fx_date], fx_date, "forward")
-                continue
-
-            idx = bisect_left(sorted_fx_dates, sec_date)
-            if idx < len(sorted_fx_dates):
-                fx_date = sorted_fx_dates[idx]
-                result[sec_date] = AlignedRate(fx_map[fx_date], fx_date, "backward")
-                continue
-
-            raise FxAlignmentError(pair=pair, security_date=sec_date)
-
-        return result
+        security_dates: npt.NDArray[np.datetime64],
+        fx_dates: npt.NDArray[np.datetime64],
+        fx_rates: npt.NDArray[np.float64],
+    ) -> AlignedRates:
+        """Align datetime64[D] security dates to FX rates, one aligned rate per date out.
+
+        The FX dates need not be sorted; where one is repeated its last rate wins.
+        """
+        security_dates = np.asarray(security_dates, dtype="datetime64[D]")
+        fx_dates = np.asarray(fx_dates, dtype="datetime64[D]")
+        fx_rates = np.asarray(fx_rates, dtype=np.float64)
+
+        if not len(fx_dates):
+            if len(security_dates):
+                raise FxAlignmentError(pair=pair, security_date=security_dates[0].item())
+            return AlignedRates(
+                np.empty(0, np.float64), np.empty(0, "datetime64[D]"), np.empty(0, np.int8)
+            )
+
+        order = np.argsort(fx_dates, kind="stable")
+        fx_dates, fx_rates = fx_dates[order], fx_rates[order]
+        last_of_date = np.append(fx_dates[1:] != fx_dates[:-1], True)
+        fx_dates, fx_rates = fx_dates[last_of_date], fx_rates[last_of_date]
+
+        # Most recent FX date on or before each security date; -1 where there is none,
+        # in which case the first FX date (the nearest after it) is used instead.
+        prior = np.searchsorted(fx_dates, security_dates, side="right") - 1
+        used = np.maximum(prior, 0)
+        directions = np.where(
+            prior < 0,
+            FILL_BACKWARD,
+            np.where(fx_dates[used] == security_dates, FILL_EXACT, FILL_FORWARD),
+        ).astype(np.int8)
+        return AlignedRates(fx_rates[used], fx_dates[used], directions)
+
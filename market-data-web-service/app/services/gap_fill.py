@@ -1,7 +1,11 @@
-from datetime import date, timedelta
+from collections.abc import Sequence
+from datetime import date
 
+import numpy as np
 import structlog
 
+from app.models.series import PriceSeries
+
 logger = structlog.get_logger(__name__)
 
 
@@ -10,7 +14,7 @@ class GapFillService:
 
     def fill(
         self,
-        observations: list[tuple[date, float]],
+        observations: Sequence[tuple[date, float]],
         from_date: date,
         to_date: date,
     ) -> list[tuple[date, float]]:
@@ -24,25 +28,28 @@ class GapFillService:
         if not observations:
             return []
 
-        obs_map: dict[date, float] = dict(observations)
-        first_obs_price = min(observations, key=lambda x: x[0])[1]
-
-        result: list[tuple[date, float]] = []
-        last_price: float | None = None
-        current = from_date
-
-        while current <= to_date:
-            if current.weekday() < 5:
-                if current in obs_map:
-                    last_price = obs_map[current]
-                    result.append((current, last_price))
-                elif last_price is None:
-                    result.append((current, first_obs_price))
-                else:
-                    result.append((current, last_price))
-            current += timedelta(days=1)
-
-        gaps_filled = len(result) - len([o for o in observations if from_date <= o[0] <= to_date])
+        series = PriceSeries.from_records(observations)
+        obs_dates, closes = series.dates, series.closes
+        first_obs_price = closes[0]
+
+        # Only weekday observations inside the range carry forward; where a date is
+        # repeated the last occurrence wins.
+        last_of_date = np.append(obs_dates[1:] != obs_dates[:-1], True)
+        start, end = np.datetime64(from_date, "D"), np.datetime64(to_date, "D")
+        usable = last_of_date & np.is_busday(obs_dates) & (obs_dates >= start) & (obs_dates <= end)
+        usable_dates = obs_dates[usable]
+        usable_prices = closes[usable]
+
+        days = np.arange(start, end + np.timedelta64(1, "D"), dtype="datetime64[D]")
+        days = days[np.is_busday(days)]
+        # Position 0 holds the back-fill price, for days before any usable observation.
+        fill_prices = np.concatenate(([first_obs_price], usable_prices))
+        prices = fill_prices[np.searchsorted(usable_dates, days, side="right")]
+
+        result = list(zip(days.tolist(), prices.tolist(), strict=True))
+
+        in_range = np.count_nonzero((obs_dates >= start) & (obs_dates <= end))
+        gaps_filled = len(result) - in_range
         logger.info(
             "gap_fill_applied",
             from_date=str(from_date),
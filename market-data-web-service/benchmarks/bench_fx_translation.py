@@ -0,0 +1,96 @@
+# Benchmark for CurrencyService.translate_with_fx_series against the per-date alignment and
+# translation loop it replaced.
+#
+# Run from the market-data-web-service directory:
+#     python benchmarks/bench_fx_translation.py
+#
+# A daily price history is translated with an FX series that is missing some dates and starts
+# after the history does, so every fill direction is exercised. The old loop logged each filled
+# date, which is included here. Both implementations are checked to return the same points.
+import os
+import random
+import sys
+import time
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
+from datetime import date, timedelta
+from functools import partial
+
+import structlog
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.pricing import PricePoint
+from app.services.currency_service import CurrencyService
+from app.services.fx_aligner import FxAligner
+from app.services.gap_fill import GapFillService
+
+logger = structlog.get_logger(__name__)
+
+
+def legacy_translate(
+    records: list[PricePoint], fx_series: list[tuple[date, float]]
+) -> list[PricePoint]:
+    fx_map = dict(fx_series)
+    sorted_fx_dates = sorted(fx_map.keys())
+    translated: list[PricePoint] = []
+    for price_point in records:
+        if price_point.date in fx_map:
+            rate = fx_map[price_point.date]
+        else:
+            idx = bisect_right(sorted_fx_dates, price_point.date) - 1
+            direction = "forward"
+            if idx < 0:
+                idx = bisect_left(sorted_fx_dates, price_point.date)
+                direction = "backward"
+            rate = fx_map[sorted_fx_dates[idx]]
+            logger.info(
+                "fx_align_fill",
+                pair="USDGBP",
+                security_date=str(price_point.date),
+                fx_date_used=str(sorted_fx_dates[idx]),
+                fill_direction=direction,
+            )
+        close = round(price_point.close * rate, 6)
+        translated.append(PricePoint(date=price_point.date, close=close, fx_rate=rate))
+    return translated
+
+
+def history(
+    years: int, seed: int = 0
+) -> tuple[list[PricePoint], list[tuple[date, float]]]:
+    rng = random.Random(seed)
+    start = date(2000, 1, 3)
+    days = [start + timedelta(days=i) for i in range(int(365.25 * years))]
+    days = [d for d in days if d.weekday() < 5]
+    records = [PricePoint(date=d, close=round(100 + rng.gauss(0, 5), 4)) for d in days]
+    fx_series = [(d, round(1.25 + rng.gauss(0, 0.01), 6)) for d in days[5:] if rng.random() > 0.03]
+    return records, fx_series
+
+
+def timed(
+    translate: Callable[[], list[PricePoint]], repeat: int = 5
+) -> tuple[float, list[PricePoint]]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = translate()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+if __name__ == "__main__":
+    # keep the service's log lines out of the timings and the table
+    structlog.configure(logger_factory=structlog.ReturnLoggerFactory())
+    service = CurrencyService(fx_provider=None, aligner=FxAligner(), gap_fill=GapFillService())
+
+    print(f"{'case':<12}{'points':>8}{'legacy':>13}{'new':>12}{'speedup':>10}")
+    for years in (1, 5, 20):
+        records, fx_series = history(years)
+        legacy_time, expected = timed(partial(legacy_translate, records, fx_series))
+        new_time, actual = timed(
+            partial(service.translate_with_fx_series, "TEST", records, "USDGBP", fx_series)
+        )
+        assert [p.model_dump() for p in actual] == [p.model_dump() for p in expected]
+        print(f"{f'{years}y':<12}{len(records):>8,}{legacy_time * 1000:>11.1f}ms"
+              f"{new_time * 1000:>10.1f}ms{legacy_time / new_time:>9.1f}x")
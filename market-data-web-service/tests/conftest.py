@@ -5,6 +5,7 @@ from unittest.mock import MagicMock
 import pytest
 from fastapi.testclient import TestClient
 
+from app.cache.memory import MemoryCache
 from app.main import app
 from app.providers import PricingProvider
 from app.providers.identifier_provider import IdentifierProvider
@@ -71,6 +72,76 @@ def client_with_cache(
     app.dependency_overrides.clear()
 
 
+@pytest.fixture()
+def client_with_packed_cache(
+    tmp_cache_dir: Path,
+    mock_inner_provider: MagicMock,
+) -> Generator[TestClient, None, None]:
+    from app.api.securities import get_pricing_service
+    from app.cache.repository import CacheRepository
+    from app.config import CacheSettings, Settings, get_settings
+    from app.providers.cached_provider import CachedPricingProvider
+    from app.services.gap_fill import GapFillService
+    from app.services.pricing_service import PricingService
+
+    def override_settings() -> Settings:
+        return Settings(cache=CacheSettings(directory=tmp_cache_dir, format="packed"))
+
+    def override_service() -> PricingService:
+        repo = CacheRepository(tmp_cache_dir, "packed")
+        provider = CachedPricingProvider(mock_inner_provider, repo)
+        return PricingService(
+            provider=provider,
+            gap_fill=GapFillService(),
+            normaliser=SubUnitNormaliser(),
+        )
+
+    app.dependency_overrides[get_settings] = override_settings
+    app.dependency_overrides[get_pricing_service] = override_service
+    with TestClient(app) as c:
+        yield c
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture()
+def memory_cache() -> MemoryCache:
+    return MemoryCache(max_entries=2)
+
+
+@pytest.fixture()
+def client_with_memory_cache(
+    tmp_cache_dir: Path,
+    mock_inner_provider: MagicMock,
+    memory_cache: MemoryCache,
+) -> Generator[TestClient, None, None]:
+    from app.api.securities import get_pricing_service
+    from app.cache.memory import get_memory_cache
+    from app.cache.repository import CacheRepository
+    from app.config import CacheSettings, Settings, get_settings
+    from app.providers.cached_provider import CachedPricingProvider
+    from app.services.gap_fill import GapFillService
+    from app.services.pricing_service import PricingService
+
+    def override_settings() -> Settings:
+        return Settings(cache=CacheSettings(directory=tmp_cache_dir))
+
+    def override_service() -> PricingService:
+        repo = CacheRepository(tmp_cache_dir, memory=memory_cache)
+        provider = CachedPricingProvider(mock_inner_provider, repo)
+        return PricingService(
+            provider=provider,
+            gap_fill=GapFillService(),
+            normaliser=SubUnitNormaliser(),
+        )
+
+    app.dependency_overrides[get_settings] = override_settings
+    app.dependency_overrides[get_memory_cache] = lambda: memory_cache
+    app.dependency_overrides[get_pricing_service] = override_service
+    with TestClient(app) as c:
+        yield c
+    app.dependency_overrides.clear()
+
+
 @pytest.fixture()
 def client_with_fx(
     tmp_cache_dir: Path,
@@ -0,0 +1,48 @@
+Feature: Batch historical prices for many tickers in one request
+
+  Scenario: Histories for several tickers are returned in request order
+    Given AAPL and MSFT have USD price history for 2025-01-02 and 2025-01-03
+    When a client requests a batch of AAPL and MSFT history from 2025-01-02 to 2025-01-03
+    Then the response status code is 200
+    And the batch contains 2 entries in the order AAPL, MSFT
+    And every batch entry has status code 200 and currency "USD"
+
+  Scenario: An FX pair shared by several tickers is fetched once
+    Given AAPL and MSFT have USD price history for 2025-01-02 and 2025-01-03
+    And the USDGBP FX series has rate 0.7884 on 2025-01-02 and 0.7902 on 2025-01-03
+    When a client requests a batch of AAPL and MSFT history from 2025-01-02 to 2025-01-03 with currency "GBP"
+    Then the response status code is 200
+    And every batch entry has status code 200 and currency "GBP"
+    And the AAPL entry for 2025-01-02 has fx_rate 0.7884
+    And the USDGBP FX series was fetched once
+
+  Scenario: An unknown ticker fails on its own without failing the batch
+    Given AAPL has USD price history for 2025-01-02 and 2025-01-03 and UNKNOWN has none
+    When a client requests a batch of AAPL and UNKNOWN history from 2025-01-02 to 2025-01-03
+    Then the response status code is 200
+    And the AAPL batch entry has status code 200
+    And the UNKNOWN batch entry has status code 404 and error code "TICKER_NOT_FOUND"
+
+  Scenario: A malformed ticker fails on its own without failing the batch
+    Given AAPL and MSFT have USD price history for 2025-01-02 and 2025-01-03
+    When a client requests a batch of AAPL and N/A history from 2025-01-02 to 2025-01-03
+    Then the response status code is 200
+    And the AAPL batch entry has status code 200
+    And the N/A batch entry has status code 422 and error code "INVALID_TICKER"
+
+  Scenario: An unexpected provider error fails only its own ticker
+    Given AAPL has USD price history for 2025-01-02 and 2025-01-03 and BROKEN raises an unexpected error
+    When a client requests a batch of AAPL and BROKEN history from 2025-01-02 to 2025-01-03
+    Then the response status code is 200
+    And the AAPL batch entry has status code 200
+    And the BROKEN batch entry has status code 500 and error code "INTERNAL_ERROR"
+
+  Scenario: Tickers in a batch are fetched concurrently
+    Given AAPL and MSFT price history can only be fetched at the same time
+    When a client requests a batch of AAPL and MSFT history from 2025-01-02 to 2025-01-03
+    Then the response status code is 200
+    And every batch entry has status code 200 and currency "USD"
+
+  Scenario: Invalid target currency rejects the whole batch
+    When a client requests a batch of AAPL history with currency "XYZ"
+    Then the response status code is 422
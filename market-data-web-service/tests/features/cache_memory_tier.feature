@@ -0,0 +1,27 @@
+Feature: In-memory cache tier ahead of the on-disk cache
+
+  Scenario: A repeated request is served from memory
+    Given a cache file exists for ticker "AAPL" with closes of 185.0
+    When a consumer requests memory-cached price history for "AAPL" twice
+    Then YFinance was not called for the memory-cached ticker
+    And the cache stats report 1 hit, 1 miss and 0 evictions
+
+  Scenario: Deleting a ticker's cache also drops it from memory
+    Given a cache file exists for ticker "AAPL" with closes of 185.0
+    And YFinance returns closes of 190.0 for "AAPL"
+    When a consumer requests memory-cached price history for "AAPL"
+    And an operator deletes the cache for "AAPL"
+    And a consumer requests memory-cached price history for "AAPL"
+    Then the latest response has closes of 190.0
+
+  Scenario: Clearing the cache also empties memory
+    Given a cache file exists for ticker "AAPL" with closes of 185.0
+    When a consumer requests memory-cached price history for "AAPL"
+    And an operator clears the whole cache
+    Then the cache stats report 0 entries held in memory
+
+  Scenario: The least recently used series is evicted beyond capacity
+    Given cache files exist for tickers "AAPL", "MSFT" and "TSLA" with closes of 185.0
+    When a consumer requests memory-cached price history for "AAPL", "MSFT" and "TSLA"
+    Then the cache stats report 3 misses and 1 eviction
+    And the cache stats report 2 entries held in memory
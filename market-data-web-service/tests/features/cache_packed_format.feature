@@ -0,0 +1,30 @@
+Feature: Packed binary cache format
+
+  Scenario: Full cache hit is served from the packed cache file
+    Given a packed cache file exists for ticker "AAPL" covering dates "2025-01-02" to "2025-06-30"
+    When a consumer requests packed-cached price history for "AAPL" from "2025-01-02" to "2025-06-30"
+    Then the response status code is 200
+    And YFinance was not called for the packed cache
+    And the response close on "2025-06-30" is 200.0
+
+  Scenario: Extending a series forward appends to the packed cache file
+    Given a packed cache file exists for ticker "AAPL" covering dates "2025-01-02" to "2025-06-30"
+    And YFinance returns packed-cache data for "AAPL" from "2025-07-01" to "2025-09-30"
+    When a consumer requests packed-cached price history for "AAPL" from "2025-01-02" to "2025-09-30"
+    Then the response status code is 200
+    And the packed cache file for "AAPL" starts with its original bytes
+    And the packed cache for "AAPL" covers dates "2025-01-02" to "2025-09-30"
+
+  Scenario: Extending a series backward rewrites the packed cache file in date order
+    Given a packed cache file exists for ticker "AAPL" covering dates "2025-01-02" to "2025-06-30"
+    And YFinance returns packed-cache data for "AAPL" from "2024-10-01" to "2024-12-31"
+    When a consumer requests packed-cached price history for "AAPL" from "2024-10-01" to "2025-06-30"
+    Then the response status code is 200
+    And the packed cache for "AAPL" covers dates "2024-10-01" to "2025-06-30"
+
+  Scenario: Existing CSV cache files are migrated to the packed format
+    Given a cache file exists for ticker "MSFT" in the CSV format
+    When the cache directory is migrated to the packed format
+    Then 1 cache file is migrated
+    And no CSV cache files remain
+    And the packed cache for "MSFT" holds the same records as the CSV file
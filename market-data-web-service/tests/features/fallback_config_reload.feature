@@ -0,0 +1,52 @@
+Feature: Fallback configuration loaded once and reloaded when it changes
+
+  Scenario: The fallback configuration is parsed once across requests
+    Given a fallback configuration file maps "PRIV01" to a local CSV file
+    When a consumer requests fallback price history for "PRIV01" 3 times
+    Then the latest fallback response status is 200
+    And the fallback configuration file has been parsed 1 time
+
+  Scenario: An edited fallback configuration is picked up without a restart
+    Given a fallback configuration file maps "PRIV01" to a local CSV file
+    When a consumer requests fallback price history for "PRIV01" 1 time
+    And the fallback configuration file is edited to also map "PRIV02"
+    And a consumer requests fallback price history for "PRIV02" 1 time
+    Then the latest fallback response status is 200
+    And the fallback configuration file has been parsed 2 times
+
+  Scenario: An invalid edit keeps the previously loaded entries
+    Given a fallback configuration file maps "PRIV01" to a local CSV file
+    When a consumer requests fallback price history for "PRIV01" 1 time
+    And the fallback configuration file is overwritten with invalid JSON
+    And a consumer requests fallback price history for "PRIV01" 2 times
+    Then the latest fallback response status is 200
+    And the fallback configuration file has been parsed 2 times
+
+  Scenario: A deleted configuration keeps the previously loaded entries
+    Given a fallback configuration file maps "PRIV01" to a local CSV file
+    When a consumer requests fallback price history for "PRIV01" 1 time
+    And the fallback configuration file is deleted
+    And a consumer requests fallback price history for "PRIV01" 2 times
+    Then the latest fallback response status is 200
+    And the fallback configuration file has been parsed 1 time
+
+  Scenario: An invalid entry is skipped without failing the other entries
+    Given a fallback configuration file maps "PRIV01" to a local CSV file and "BAD01" to an invalid entry
+    When a consumer requests fallback price history for "PRIV01" 1 time
+    Then the latest fallback response status is 200
+    And the fallback configuration has no entry for "BAD01"
+    And the fallback configuration has no entry for "AAPL"
+
+  Scenario: The reload endpoint reloads the configuration and reports its size
+    Given a fallback configuration file maps "PRIV01" to a local CSV file
+    When the fallback configuration file is edited to also map "PRIV02"
+    And an operator reloads the fallback configuration
+    Then the latest fallback response status is 200
+    And the reload response reports 2 entries
+
+  Scenario: Reloading an invalid configuration reports the provider as unavailable
+    Given a fallback configuration file maps "PRIV01" to a local CSV file
+    When a consumer requests fallback price history for "PRIV01" 1 time
+    And the fallback configuration file is overwritten with invalid JSON
+    And an operator reloads the fallback configuration
+    Then the latest fallback response status is 503
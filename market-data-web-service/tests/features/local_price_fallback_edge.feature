@@ -10,3 +10,12 @@ Feature: Local price file fallback — edge cases
     Given a fallback configuration maps "PRIV01" to an empty CSV file
     When a consumer requests price history for "PRIV01"
     Then the response status is 404
+
+  Scenario: Fallback CSV is parsed once and re-read after it changes on disk
+    Given a fallback configuration maps "PRIV01" to a local CSV file in a working directory
+    When a consumer requests price history for "PRIV01" twice
+    Then the local CSV file has been parsed 1 time
+    When the local CSV file is rewritten with a close of 120.00 on "2025-01-06"
+    And a consumer requests price history for "PRIV01" again
+    Then the local CSV file has been parsed 2 times
+    And the latest response has a close of 120.00 on "2025-01-06"
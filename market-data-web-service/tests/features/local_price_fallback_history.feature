@@ -39,6 +39,12 @@ Feature: Local price file fallback — price history
     And the response currency is "GBP"
     And the pence prices are divided by 100
 
+  Scenario: Fallback file with day-first dates is read using its configured date format
+    Given a fallback configuration maps "PRIV01" to a local CSV file with date format "%d/%m/%Y"
+    When a consumer requests price history for "PRIV01" from "2025-01-02" to "2025-01-06"
+    Then the response status is 200
+    And the day-first dates are read as day, month, year
+
   Scenario: use_local_only flag bypasses primary source entirely
     Given a fallback configuration maps "PRIV01" to a local CSV file with use_local_only set
     When a consumer requests price history for "PRIV01"
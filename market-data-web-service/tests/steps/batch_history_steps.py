@@ -0,0 +1,173 @@
+import threading
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from pytest_bdd import given, parsers, scenarios, then, when
+
+from app.exceptions import DataNotFoundError
+
+scenarios("batch_history.feature")
+
+_USD_HISTORY: list[tuple[date, float]] = [
+    (date(2025, 1, 2), 185.50),
+    (date(2025, 1, 3), 186.20),
+]
+
+
+def _usd_quote(ticker: str) -> dict[str, object]:
+    return {
+        "price": 186.20,
+        "currency": "USD",
+        "market_state": "closed",
+        "as_of_date": date(2025, 1, 3),
+    }
+
+
+@given("AAPL and MSFT have USD price history for 2025-01-02 and 2025-01-03")
+def aapl_msft_usd_history(mock_inner_provider: MagicMock) -> None:
+    mock_inner_provider.get_price_history.return_value = _USD_HISTORY
+    mock_inner_provider.get_current_price.side_effect = _usd_quote
+
+
+@given("AAPL has USD price history for 2025-01-02 and 2025-01-03 and UNKNOWN has none")
+def aapl_history_unknown_missing(mock_inner_provider: MagicMock) -> None:
+    def history(ticker: str, from_date: date, to_date: date) -> list[tuple[date, float]]:
+        if ticker == "UNKNOWN":
+            raise DataNotFoundError(ticker)
+        return _USD_HISTORY
+
+    mock_inner_provider.get_price_history.side_effect = history
+    mock_inner_provider.get_current_price.side_effect = _usd_quote
+
+
+@given(
+    "AAPL has USD price history for 2025-01-02 and 2025-01-03 "
+    "and BROKEN raises an unexpected error"
+)
+def aapl_history_broken_error(mock_inner_provider: MagicMock) -> None:
+    def history(ticker: str, from_date: date, to_date: date) -> list[tuple[date, float]]:
+        if ticker == "BROKEN":
+            raise RuntimeError("provider bug")
+        return _USD_HISTORY
+
+    mock_inner_provider.get_price_history.side_effect = history
+    mock_inner_provider.get_current_price.side_effect = _usd_quote
+
+
+@given("AAPL and MSFT price history can only be fetched at the same time")
+def aapl_msft_concurrent_history(mock_inner_provider: MagicMock) -> None:
+    # Each fetch waits for the other, so fetching them one after another times out
+    both_fetching = threading.Barrier(2, timeout=5)
+
+    def history(ticker: str, from_date: date, to_date: date) -> list[tuple[date, float]]:
+        both_fetching.wait()
+        return _USD_HISTORY
+
+    mock_inner_provider.get_price_history.side_effect = history
+    mock_inner_provider.get_current_price.side_effect = _usd_quote
+
+
+@given("the USDGBP FX series has rate 0.7884 on 2025-01-02 and 0.7902 on 2025-01-03")
+def usdgbp_series(mock_fx_provider: MagicMock) -> None:
+    mock_fx_provider.get_price_history.return_value = [
+        (date(2025, 1, 2), 0.7884),
+        (date(2025, 1, 3), 0.7902),
+    ]
+
+
+def _post_batch(
+    client: TestClient, tickers: list[str], currency: str | None = None
+) -> object:
+    body: dict[str, object] = {
+        "items": [{"ticker": t, "from": "2025-01-02", "to": "2025-01-03"} for t in tickers],
+    }
+    if currency is not None:
+        body["currency"] = currency
+    return client.post("/securities/history:batch", json=body)
+
+
+@when(
+    "a client requests a batch of AAPL and MSFT history from 2025-01-02 to 2025-01-03",
+    target_fixture="response",
+)
+def batch_aapl_msft(client_with_fx: TestClient) -> object:
+    return _post_batch(client_with_fx, ["AAPL", "MSFT"])
+
+
+@when(
+    'a client requests a batch of AAPL and MSFT history from 2025-01-02 to 2025-01-03 '
+    'with currency "GBP"',
+    target_fixture="response",
+)
+def batch_aapl_msft_gbp(client_with_fx: TestClient) -> object:
+    return _post_batch(client_with_fx, ["AAPL", "MSFT"], "GBP")
+
+
+@when(
+    parsers.parse(
+        "a client requests a batch of AAPL and {other} history from 2025-01-02 to 2025-01-03"
+    ),
+    target_fixture="response",
+)
+def batch_aapl_and_other(client_with_fx: TestClient, other: str) -> object:
+    return _post_batch(client_with_fx, ["AAPL", other])
+
+
+@when('a client requests a batch of AAPL history with currency "XYZ"', target_fixture="response")
+def batch_invalid_currency(client_with_fx: TestClient) -> object:
+    return _post_batch(client_with_fx, ["AAPL"], "XYZ")
+
+
+@then(parsers.parse("the response status code is {status:d}"))
+def status_code(response: object, status: int) -> None:
+    assert response.status_code == status  # type: ignore[union-attr]
+
+
+@then("the batch contains 2 entries in the order AAPL, MSFT")
+def batch_order(response: object) -> None:
+    entries = response.json()["entries"]  # type: ignore[union-attr]
+    assert [e["ticker"] for e in entries] == ["AAPL", "MSFT"]
+
+
+@then(parsers.parse('every batch entry has status code 200 and currency "{currency}"'))
+def all_entries_ok(response: object, currency: str) -> None:
+    for entry in response.json()["entries"]:  # type: ignore[union-attr]
+        assert entry["status_code"] == 200
+        assert entry["history"]["currency"] == currency
+
+
+@then("the AAPL entry for 2025-01-02 has fx_rate 0.7884")
+def aapl_fx_rate(response: object) -> None:
+    entries = response.json()["entries"]  # type: ignore[union-attr]
+    aapl = next(e for e in entries if e["ticker"] == "AAPL")
+    point = next(p for p in aapl["history"]["prices"] if p["date"] == "2025-01-02")
+    assert point["fx_rate"] == pytest.approx(0.7884, rel=1e-4)
+    assert point["close"] == pytest.approx(185.50 * 0.7884, rel=1e-3)
+
+
+@then("the USDGBP FX series was fetched once")
+def fx_fetched_once(mock_fx_provider: MagicMock) -> None:
+    assert mock_fx_provider.get_price_history.call_count == 1
+
+
+@then("the AAPL batch entry has status code 200")
+def aapl_entry_ok(response: object) -> None:
+    entries = response.json()["entries"]  # type: ignore[union-attr]
+    assert entries[0]["ticker"] == "AAPL"
+    assert entries[0]["status_code"] == 200
+    assert entries[0]["history"]["prices"]
+
+
+@then(
+    parsers.parse(
+        'the {ticker} batch entry has status code {status:d} and error code "{code}"'
+    )
+)
+def entry_failed(response: object, ticker: str, status: int, code: str) -> None:
+    entries = response.json()["entries"]  # type: ignore[union-attr]
+    entry = next(e for e in entries if e["ticker"] == ticker)
+    assert entry["status_code"] == status
+    assert entry["history"] is None
+    assert entry["error"]["code"] == code
@@ -0,0 +1,115 @@
+from datetime import date
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from pytest_bdd import given, parsers, scenarios, then, when
+
+from app.cache.repository import CacheRepository
+
+scenarios("cache_memory_tier.feature")
+
+_FROM = "2025-01-02"
+_TO = "2025-01-03"
+
+
+def _records(close: float) -> list[tuple[date, float]]:
+    return [(date(2025, 1, 2), close), (date(2025, 1, 3), close)]
+
+
+@pytest.fixture()
+def responses() -> list[object]:
+    return []
+
+
+def _request(client: TestClient, ticker: str, responses: list[object]) -> None:
+    response = client.get(f"/securities/{ticker}/history", params={"from": _FROM, "to": _TO})
+    assert response.status_code == 200
+    responses.append(response)
+
+
+@given(parsers.parse('a cache file exists for ticker "{ticker}" with closes of {close:f}'))
+def seed_ticker(tmp_cache_dir: Path, ticker: str, close: float) -> None:
+    CacheRepository(tmp_cache_dir).write(ticker, _records(close))
+
+
+@given(
+    parsers.parse(
+        'cache files exist for tickers "AAPL", "MSFT" and "TSLA" with closes of {close:f}'
+    )
+)
+def seed_three(tmp_cache_dir: Path, close: float) -> None:
+    repo = CacheRepository(tmp_cache_dir)
+    for ticker in ("AAPL", "MSFT", "TSLA"):
+        repo.write(ticker, _records(close))
+
+
+@given(parsers.parse('YFinance returns closes of {close:f} for "AAPL"'))
+def yfinance_returns(mock_inner_provider: MagicMock, close: float) -> None:
+    mock_inner_provider.get_price_history.return_value = _records(close)
+
+
+@when('a consumer requests memory-cached price history for "AAPL" twice')
+def request_twice(client_with_memory_cache: TestClient, responses: list[object]) -> None:
+    _request(client_with_memory_cache, "AAPL", responses)
+    _request(client_with_memory_cache, "AAPL", responses)
+
+
+@when('a consumer requests memory-cached price history for "AAPL"')
+def request_once(client_with_memory_cache: TestClient, responses: list[object]) -> None:
+    _request(client_with_memory_cache, "AAPL", responses)
+
+
+@when('a consumer requests memory-cached price history for "AAPL", "MSFT" and "TSLA"')
+def request_three(client_with_memory_cache: TestClient, responses: list[object]) -> None:
+    for ticker in ("AAPL", "MSFT", "TSLA"):
+        _request(client_with_memory_cache, ticker, responses)
+
+
+@when('an operator deletes the cache for "AAPL"')
+def delete_aapl(client_with_memory_cache: TestClient) -> None:
+    assert client_with_memory_cache.delete("/cache/AAPL").status_code == 200
+
+
+@when("an operator clears the whole cache")
+def clear_all(client_with_memory_cache: TestClient) -> None:
+    assert client_with_memory_cache.delete("/cache").status_code == 200
+
+
+@then("YFinance was not called for the memory-cached ticker")
+def yfinance_not_called(mock_inner_provider: MagicMock) -> None:
+    mock_inner_provider.get_price_history.assert_not_called()
+
+
+@then(parsers.parse("the latest response has closes of {close:f}"))
+def latest_closes(responses: list[object], close: float) -> None:
+    prices = responses[-1].json()["prices"]  # type: ignore[attr-defined]
+    assert [p["close"] for p in prices] == [close, close]
+
+
+@then(
+    parsers.parse(
+        "the cache stats report {hits:d} hit, {misses:d} miss and {evictions:d} evictions"
+    )
+)
+def stats_hits_misses(
+    client_with_memory_cache: TestClient, hits: int, misses: int, evictions: int
+) -> None:
+    stats = client_with_memory_cache.get("/cache/stats").json()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (hits, misses, evictions)
+
+
+@then(parsers.parse("the cache stats report {misses:d} misses and {evictions:d} eviction"))
+def stats_misses_evictions(
+    client_with_memory_cache: TestClient, misses: int, evictions: int
+) -> None:
+    stats = client_with_memory_cache.get("/cache/stats").json()
+    assert (stats["misses"], stats["evictions"]) == (misses, evictions)
+
+
+@then(parsers.parse("the cache stats report {entries:d} entries held in memory"))
+def stats_entries(client_with_memory_cache: TestClient, entries: int) -> None:
+    stats = client_with_memory_cache.get("/cache/stats").json()
+    assert stats["entries"] == entries
+    assert stats["max_entries"] == 2
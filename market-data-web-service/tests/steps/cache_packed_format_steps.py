@@ -0,0 +1,125 @@
+from datetime import date
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from pytest_bdd import given, parsers, scenarios, then, when
+
+from app.cache.repository import CacheRepository, migrate_csv_cache
+
+scenarios("cache_packed_format.feature")
+
+_AAPL_CACHED: list[tuple[date, float]] = [
+    (date(2025, 1, 2), 185.00),
+    (date(2025, 3, 31), 190.00),
+    (date(2025, 6, 30), 200.00),
+]
+
+_MSFT_CSV: list[tuple[date, float]] = [
+    (date(2025, 1, 2), 400.00),
+    (date(2025, 1, 3), 401.50),
+]
+
+
+@pytest.fixture()
+def packed_bytes() -> dict[str, bytes]:
+    return {}
+
+
+@given('a packed cache file exists for ticker "AAPL" covering dates "2025-01-02" to "2025-06-30"')
+def seed_aapl_packed(tmp_cache_dir: Path, packed_bytes: dict[str, bytes]) -> None:
+    CacheRepository(tmp_cache_dir, "packed").write("AAPL", _AAPL_CACHED)
+    packed_bytes["AAPL"] = (tmp_cache_dir / "AAPL.bin").read_bytes()
+
+
+@given('YFinance returns packed-cache data for "AAPL" from "2025-07-01" to "2025-09-30"')
+def yfinance_after_segment(mock_inner_provider: MagicMock) -> None:
+    mock_inner_provider.get_price_history.return_value = [
+        (date(2025, 7, 1), 201.00),
+        (date(2025, 9, 30), 210.00),
+    ]
+
+
+@given('YFinance returns packed-cache data for "AAPL" from "2024-10-01" to "2024-12-31"')
+def yfinance_before_segment(mock_inner_provider: MagicMock) -> None:
+    mock_inner_provider.get_price_history.return_value = [
+        (date(2024, 10, 1), 170.00),
+        (date(2024, 12, 31), 180.00),
+    ]
+
+
+@given('a cache file exists for ticker "MSFT" in the CSV format')
+def seed_msft_csv(tmp_cache_dir: Path) -> None:
+    CacheRepository(tmp_cache_dir).write("MSFT", _MSFT_CSV)
+
+
+@when(
+    parsers.parse(
+        'a consumer requests packed-cached price history for "{ticker}" '
+        'from "{from_date}" to "{to_date}"'
+    ),
+    target_fixture="response",
+)
+def request_history(
+    client_with_packed_cache: TestClient, ticker: str, from_date: str, to_date: str
+) -> object:
+    return client_with_packed_cache.get(
+        f"/securities/{ticker}/history", params={"from": from_date, "to": to_date}
+    )
+
+
+@when("the cache directory is migrated to the packed format", target_fixture="migrated")
+def migrate(tmp_cache_dir: Path) -> int:
+    return migrate_csv_cache(tmp_cache_dir)
+
+
+@then(parsers.parse("the response status code is {status:d}"))
+def status_code(response: object, status: int) -> None:
+    assert response.status_code == status  # type: ignore[union-attr]
+
+
+@then("YFinance was not called for the packed cache")
+def yfinance_not_called(mock_inner_provider: MagicMock) -> None:
+    mock_inner_provider.get_price_history.assert_not_called()
+
+
+@then(parsers.parse('the response close on "{on_date}" is {close:f}'))
+def response_close(response: object, on_date: str, close: float) -> None:
+    prices = response.json()["prices"]  # type: ignore[union-attr]
+    point = next(p for p in prices if p["date"] == on_date)
+    assert point["close"] == pytest.approx(close)
+
+
+@then(parsers.parse('the packed cache file for "{ticker}" starts with its original bytes'))
+def file_appended(tmp_cache_dir: Path, packed_bytes: dict[str, bytes], ticker: str) -> None:
+    current = (tmp_cache_dir / f"{ticker}.bin").read_bytes()
+    assert len(current) > len(packed_bytes[ticker])
+    assert current.startswith(packed_bytes[ticker])
+
+
+@then(
+    parsers.parse('the packed cache for "{ticker}" covers dates "{from_date}" to "{to_date}"')
+)
+def packed_covers(tmp_cache_dir: Path, ticker: str, from_date: str, to_date: str) -> None:
+    records = CacheRepository(tmp_cache_dir, "packed").read(ticker)
+    assert records is not None
+    dates = [d for d, _ in records]
+    assert dates == sorted(dates)
+    assert dates[0] == date.fromisoformat(from_date)
+    assert dates[-1] == date.fromisoformat(to_date)
+
+
+@then(parsers.parse("{count:d} cache file is migrated"))
+def migrated_count(migrated: int, count: int) -> None:
+    assert migrated == count
+
+
+@then("no CSV cache files remain")
+def no_csv(tmp_cache_dir: Path) -> None:
+    assert list(tmp_cache_dir.glob("*.csv")) == []
+
+
+@then('the packed cache for "MSFT" holds the same records as the CSV file')
+def packed_matches_csv(tmp_cache_dir: Path) -> None:
+    assert CacheRepository(tmp_cache_dir, "packed").read("MSFT") == _MSFT_CSV
@@ -0,0 +1,142 @@
+import json
+import os
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from pytest_bdd import given, parsers, scenarios, then, when
+
+from app.main import app
+from app.repositories import fallback_config
+
+scenarios("fallback_config_reload.feature")
+
+_ENTRY = {
+    "csv_path": "tests/fixtures/priv01_prices.csv",
+    "currency": "GBP",
+    "date_column": "Date",
+    "price_column": "Close",
+    "use_local_only": True,
+}
+
+
+@pytest.fixture()
+def config_path(tmp_path: Path) -> Path:
+    return tmp_path / "fallback_config.json"
+
+
+@pytest.fixture()
+def responses() -> list[object]:
+    return []
+
+
+@pytest.fixture()
+def config_loads() -> Generator[MagicMock, None, None]:
+    with patch.object(fallback_config, "_load", wraps=fallback_config._load) as load:
+        yield load
+
+
+def _write_config(config_path: Path, content: str) -> None:
+    previous = config_path.stat().st_mtime_ns if config_path.exists() else None
+    config_path.write_text(content, encoding="utf-8")
+    if previous is not None:
+        # make sure the change is visible even on filesystems with coarse timestamps
+        later = previous + 1_000_000_000
+        os.utime(config_path, ns=(later, later))
+
+
+def _client(tmp_path: Path, config_path: Path) -> Generator[TestClient, None, None]:
+    from app.config import CacheSettings, FallbackSettings, Settings, get_settings
+
+    def override_settings() -> Settings:
+        return Settings(
+            cache=CacheSettings(directory=tmp_path / "cache"),
+            fallback=FallbackSettings(config_path=config_path),
+        )
+
+    app.dependency_overrides[get_settings] = override_settings
+    with TestClient(app) as c:
+        yield c
+    app.dependency_overrides.clear()
+
+
+@given(
+    'a fallback configuration file maps "PRIV01" to a local CSV file',
+    target_fixture="fallback_client",
+)
+def fallback_config_file(
+    tmp_path: Path, config_path: Path, config_loads: MagicMock
+) -> Generator[TestClient, None, None]:
+    _write_config(config_path, json.dumps({"PRIV01": _ENTRY}))
+    yield from _client(tmp_path, config_path)
+
+
+@given(
+    'a fallback configuration file maps "PRIV01" to a local CSV file '
+    'and "BAD01" to an invalid entry',
+    target_fixture="fallback_client",
+)
+def fallback_config_file_with_invalid_entry(
+    tmp_path: Path, config_path: Path, config_loads: MagicMock
+) -> Generator[TestClient, None, None]:
+    _write_config(
+        config_path, json.dumps({"PRIV01": _ENTRY, "BAD01": {**_ENTRY, "currency": "XX"}})
+    )
+    yield from _client(tmp_path, config_path)
+
+
+@when(parsers.parse('a consumer requests fallback price history for "{ticker}" {count:d} times'))
+@when(parsers.parse('a consumer requests fallback price history for "{ticker}" {count:d} time'))
+def request_history(
+    fallback_client: TestClient, responses: list[object], ticker: str, count: int
+) -> None:
+    for _ in range(count):
+        responses.append(
+            fallback_client.get(
+                f"/securities/{ticker}/history",
+                params={"from": "2025-01-02", "to": "2025-01-06"},
+            )
+        )
+
+
+@when(parsers.parse('the fallback configuration file is edited to also map "{ticker}"'))
+def edit_config(config_path: Path, ticker: str) -> None:
+    _write_config(config_path, json.dumps({"PRIV01": _ENTRY, ticker: _ENTRY}))
+
+
+@when("the fallback configuration file is overwritten with invalid JSON")
+def break_config(config_path: Path) -> None:
+    _write_config(config_path, '{"PRIV01": ')
+
+
+@when("the fallback configuration file is deleted")
+def delete_config(config_path: Path) -> None:
+    config_path.unlink()
+
+
+@when("an operator reloads the fallback configuration")
+def reload_config(fallback_client: TestClient, responses: list[object]) -> None:
+    responses.append(fallback_client.post("/fallback/reload"))
+
+
+@then(parsers.parse("the latest fallback response status is {status:d}"))
+def latest_status(responses: list[object], status: int) -> None:
+    assert responses[-1].status_code == status  # type: ignore[attr-defined]
+
+
+@then(parsers.parse("the fallback configuration file has been parsed {count:d} times"))
+@then(parsers.parse("the fallback configuration file has been parsed {count:d} time"))
+def parsed_count(config_loads: MagicMock, count: int) -> None:
+    assert config_loads.call_count == count
+
+
+@then(parsers.parse("the reload response reports {count:d} entries"))
+def reload_entries(responses: list[object], count: int) -> None:
+    assert responses[-1].json() == {"entries": count}  # type: ignore[attr-defined]
+
+
+@then(parsers.parse('the fallback configuration has no entry for "{identifier}"'))
+def no_entry(config_path: Path, identifier: str) -> None:
+    assert fallback_config.get_fallback_config_repository(config_path).lookup(identifier) is None
@@ -1,6 +1,11 @@
+import json
+import os
+from collections.abc import Iterator
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+import pandas as pd
+import pytest
 from fastapi.testclient import TestClient
 from pytest_bdd import given, scenarios, then, when
 
@@ -85,3 +90,79 @@ def descriptive_error(response: object) -> None:
 @then("the response status is 404")
 def status_404_edge(response: object) -> None:
     assert response.status_code == 404  # type: ignore[union-attr]
+
+
+# --- Scenario: parsed CSV cache ---
+
+@pytest.fixture()
+def read_csv_calls() -> Iterator[MagicMock]:
+    with patch("pandas.read_csv", wraps=pd.read_csv) as read_csv:
+        yield read_csv
+
+
+@given(
+    'a fallback configuration maps "PRIV01" to a local CSV file in a working directory',
+    target_fixture="edge_client",
+)
+def fallback_working_file(tmp_path: Path) -> TestClient:
+    csv_path = tmp_path / "priv01.csv"
+    csv_path.write_text("Date,Close\n2025-01-02,100.00\n2025-01-06,110.00\n")
+    config_path = tmp_path / "fallback_config.json"
+    config_path.write_text(json.dumps({
+        "PRIV01": {
+            "csv_path": str(csv_path),
+            "currency": "GBP",
+            "date_column": "Date",
+            "price_column": "Close",
+            "use_local_only": True,
+        }
+    }))
+    return _make_edge_client(config_path)
+
+
+def _get_history(edge_client: TestClient) -> object:
+    return edge_client.get(
+        "/securities/PRIV01/history", params={"from": "2025-01-02", "to": "2025-01-06"}
+    )
+
+
+@when('a consumer requests price history for "PRIV01" twice', target_fixture="response")
+def get_priv01_twice(edge_client: TestClient, read_csv_calls: MagicMock) -> object:
+    _get_history(edge_client)
+    return _get_history(edge_client)
+
+
+@when('the local CSV file is rewritten with a close of 120.00 on "2025-01-06"')
+def rewrite_local_csv(tmp_path: Path) -> None:
+    csv_path = tmp_path / "priv01.csv"
+    mtime_ns = csv_path.stat().st_mtime_ns
+    csv_path.write_text("Date,Close\n2025-01-02,100.00\n2025-01-06,120.00\n")
+    # make sure the change is visible even on filesystems with coarse timestamps
+    os.utime(csv_path, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+
+
+@when('a consumer requests price history for "PRIV01" again', target_fixture="response")
+def get_priv01_again(edge_client: TestClient) -> object:
+    from app.main import app
+
+    resp = _get_history(edge_client)
+    app.dependency_overrides.clear()
+    return resp
+
+
+@then("the local CSV file has been parsed 1 time")
+def parsed_once(read_csv_calls: MagicMock) -> None:
+    assert read_csv_calls.call_count == 1
+
+
+@then("the local CSV file has been parsed 2 times")
+def parsed_twice(read_csv_calls: MagicMock) -> None:
+    assert read_csv_calls.call_count == 2
+
+
+@then('the latest response has a close of 120.00 on "2025-01-06"')
+def latest_close(response: object) -> None:
+    assert response.status_code == 200  # type: ignore[union-attr]
+    prices = response.json()["prices"]  # type: ignore[union-attr]
+    by_date = {p["date"]: p["close"] for p in prices}
+    assert by_date["2025-01-06"] == pytest.approx(120.00)
@@ -16,6 +16,7 @@ _FALLBACK_CONFIG = Path("tests/fixtures/fallback_config.json")
 _FALLBACK_CONFIG_ISIN = Path("tests/fixtures/fallback_config_isin.json")
 _FALLBACK_CONFIG_LOCAL_ONLY = Path("tests/fixtures/fallback_config_local_only.json")
 _FALLBACK_CONFIG_PENCE = Path("tests/fixtures/fallback_config_pence.json")
+_FALLBACK_CONFIG_DAYFIRST = Path("tests/fixtures/fallback_config_dayfirst.json")
 
 
 def _make_fallback_client(config_path: Path) -> tuple[TestClient, MagicMock, MagicMock]:
@@ -292,6 +293,29 @@ def pence_prices_divided(response: object) -> None:
     assert by_date["2025-01-06"] == pytest.approx(110.00, rel=1e-4)
 
 
+# --- Scenario: day-first dates read with the entry's date_format ---
+
+@given(
+    'a fallback configuration maps "PRIV01" to a local CSV file with date format "%d/%m/%Y"',
+    target_fixture="fallback_client",
+)
+def fallback_config_priv01_dayfirst() -> tuple[TestClient, MagicMock, MagicMock]:
+    client, mock_inner, mock_id = _make_fallback_client(_FALLBACK_CONFIG_DAYFIRST)
+    return client, mock_inner, mock_id
+
+
+@then("the day-first dates are read as day, month, year")
+def dayfirst_dates_read(response: object) -> None:
+    prices = response.json()["prices"]  # type: ignore[union-attr]
+    by_date = {p["date"]: p["close"] for p in prices}
+    # 02/01/2025 is 2 January, not 1 February as a month-first parse would read it.
+    assert by_date == {
+        "2025-01-02": pytest.approx(100.00),
+        "2025-01-03": pytest.approx(100.00),
+        "2025-01-06": pytest.approx(110.00),
+    }
+
+
 # --- Scenario 5: use_local_only ---
 
 @given(
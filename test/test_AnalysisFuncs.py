@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 import pandas as pd
 import AnalysisFuncs as af
 
@@ -291,6 +292,46 @@ class TestCases(unittest.TestCase):
         # Call the utility function with test number 2
         self.utility_run_calculate_composite_returns(2)
 
+    ### ===================================
+    ### Tests for rolling_compound_return()
+    ### ===================================
+    def utility_run_rolling_compound_return(self, returns, window):
+        # The rolling apply that rolling_compound_return replaced is the reference result
+        expected = returns.rolling(window=window).apply(lambda x: 100.0 * ((1 + x / 100).cumprod().iloc[-1] - 1))
+
+        result = af.rolling_compound_return(returns, window)
+
+        pd.testing.assert_series_equal(result, expected, check_exact=False, rtol=1e-9, atol=1e-9)
+
+    def test_rolling_compound_return_1_random_daily_returns(self):
+        rng = np.random.default_rng(1)
+        returns = pd.Series(rng.normal(0.03, 1.0, 260 * 6), name='Portfolio Return %')
+
+        for window in (260 * 1, 260 * 3, 260 * 5):
+            self.utility_run_rolling_compound_return(returns, window)
+
+    def test_rolling_compound_return_2_shorter_than_window(self):
+        returns = pd.Series([1.0, -2.0, 0.5], name='Portfolio Return %')
+
+        self.utility_run_rolling_compound_return(returns, 260)
+
+    def test_rolling_compound_return_3_missing_returns(self):
+        returns = pd.Series([1.0, np.nan, 2.0, 0.5, -1.0, 3.0, 0.2], name='Portfolio Return %')
+
+        self.utility_run_rolling_compound_return(returns, 3)
+
+    def test_rolling_compound_return_4_total_loss_zeroes_window(self):
+        # a -100% day wipes out the window it is in
+        returns = pd.Series([1.0, 2.0, -100.0, 5.0, 1.0, 2.0, 3.0], name='Portfolio Return %')
+
+        self.utility_run_rolling_compound_return(returns, 3)
+
+    def test_rolling_compound_return_5_loss_beyond_total(self):
+        # returns below -100% give negative growth factors, which flip the sign of the product
+        returns = pd.Series([1.0, -150.0, 2.0, -250.0, 1.0, 3.0, 2.0], name='Portfolio Return %')
+
+        self.utility_run_rolling_compound_return(returns, 3)
+
     ### =============================================
     ### Tests for update_summary_with_daily_returns()
     ### =============================================
@@ -0,0 +1,180 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from Reports import BaseReport
+
+class SheetsReport(BaseReport.BaseReport):
+    # writes whatever sheets it is given, so the shared output helpers can be tested on their own
+
+    def generate(self, output_filename: str, data, report_args: dict = dict()):
+        self.write_sheets(output_filename, data, report_args)
+
+    def required_measures(self) -> list[str]:
+        return []
+
+def render_line(data, output_filename, title):
+    # a chart render call as a report would make, kept at module level so charts=defer can pickle it
+    import matplotlib.pyplot as plt
+    fig, ax = plt.subplots()
+    data.plot.line(ax=ax, title=title)
+    fig.savefig(output_filename)
+    plt.close(fig)
+
+class TestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dir = self.tmp.name
+
+    def create_frame(self, rows=25):
+        return pd.DataFrame({
+            'Settle date': pd.date_range('2024-01-01', periods=rows, freq='B'),
+            'Position name': [f'Holding {i % 4}' for i in range(rows)],
+            'Quantity': np.arange(rows, dtype=float),
+            'Close': [np.nan if i % 7 == 0 else 100.0 + i / 4 for i in range(rows)],
+        })
+
+    ### ====================================
+    ### Tests for flatten_for_output()
+    ### ====================================
+
+    def test_flatten_for_output_joins_multiindex_columns(self):
+        df = pd.DataFrame(
+            [[1.0, 2.0], [3.0, 4.0]],
+            index=pd.DatetimeIndex(['2024-01-01', '2024-01-02'], name='Settle date'),
+            columns=pd.MultiIndex.from_tuples([('Pivot value', 'Alpha'), ('Pivot value', 'Beta')], names=[None, 'Position name']),
+        )
+
+        flat = BaseReport.flatten_for_output(df, index=True)
+        self.assertEqual(list(flat.columns), ['Settle date', 'Pivot value Alpha', 'Pivot value Beta'])
+        self.assertIsInstance(flat.index, pd.RangeIndex)
+        np.testing.assert_array_equal(flat['Pivot value Beta'].to_numpy(), [2.0, 4.0])
+
+        # the index is dropped rather than written when it is not wanted
+        self.assertEqual(list(BaseReport.flatten_for_output(df, index=False).columns), ['Pivot value Alpha', 'Pivot value Beta'])
+
+    def test_flatten_for_output_skips_empty_levels(self):
+        df = pd.DataFrame([[1, 2]], columns=pd.MultiIndex.from_tuples([('Settle date', ''), ('Close', 'Alpha')]))
+        self.assertEqual(list(BaseReport.flatten_for_output(df, index=False).columns), ['Settle date', 'Close Alpha'])
+
+    ### ====================================
+    ### Tests for write_excel_streaming()
+    ### ====================================
+
+    def test_streamed_xlsx_matches_to_excel(self):
+        sheets = {'Details': self.create_frame(), 'Summary': self.create_frame(3)}
+        streamed = os.path.join(self.dir, 'streamed.xlsx')
+        written = os.path.join(self.dir, 'written.xlsx')
+
+        # a small chunk size, so frames span several chunks
+        BaseReport.write_excel_streaming(streamed, sheets, chunk_rows=10)
+        with pd.ExcelWriter(written, engine='openpyxl') as writer:
+            for sheet_name, df in sheets.items():
+                df.to_excel(writer, sheet_name=sheet_name, index=False)
+
+        expected = pd.read_excel(written, sheet_name=None)
+        result = pd.read_excel(streamed, sheet_name=None)
+        self.assertEqual(list(result), list(expected))
+        for sheet_name in sheets:
+            with self.subTest(sheet=sheet_name):
+                pd.testing.assert_frame_equal(result[sheet_name], expected[sheet_name])
+
+    def test_write_sheets_streams_xlsx_when_asked(self):
+        sheets = {'Details': self.create_frame()}
+        streamed = os.path.join(self.dir, 'streamed.xlsx')
+        written = os.path.join(self.dir, 'written.xlsx')
+
+        SheetsReport().write_sheets(streamed, sheets, {'streaming_excel': 'true'})
+        SheetsReport().write_sheets(written, sheets)
+
+        pd.testing.assert_frame_equal(pd.read_excel(streamed, sheet_name='Details'), pd.read_excel(written, sheet_name='Details'))
+
+    ### ====================================
+    ### Tests for output_format()
+    ### ====================================
+
+    def test_output_format_prefers_cli_then_extension_then_xlsx(self):
+        report = SheetsReport()
+        for output_filename, report_args, expected in [
+            ('out.csv', {'output_format': 'parquet'}, 'parquet'),
+            ('out.xlsx', {'output_format': 'FEATHER'}, 'feather'),
+            ('out.csv', {}, 'csv'),
+            ('out.Parquet', {}, 'parquet'),
+            ('out', {}, 'xlsx'),
+            ('out', {'output_format': ''}, 'xlsx'),
+        ]:
+            with self.subTest(output_filename=output_filename, report_args=report_args):
+                self.assertEqual(report.output_format(output_filename, report_args), expected)
+
+    def test_output_format_rejects_unsupported_formats(self):
+        report = SheetsReport()
+        with self.assertRaisesRegex(ValueError, "Unsupported output format 'json'"):
+            report.output_format('out.json')
+        with self.assertRaisesRegex(ValueError, "Unsupported output format 'txt'"):
+            report.output_format('out.xlsx', {'output_format': 'txt'})
+
+    ### ====================================
+    ### Tests for write_sheets()
+    ### ====================================
+
+    def written_files(self):
+        return sorted(os.path.relpath(os.path.join(root, f), self.dir) for root, _, files in os.walk(self.dir) for f in files)
+
+    def test_write_sheets_names_a_single_sheet_after_the_output_file(self):
+        SheetsReport().write_sheets(os.path.join(self.dir, 'out.xlsx'), {'Details': self.create_frame()}, {'output_format': 'csv'})
+        self.assertEqual(self.written_files(), ['out.csv'])
+        pd.testing.assert_frame_equal(pd.read_csv(os.path.join(self.dir, 'out.csv'), parse_dates=['Settle date']), self.create_frame())
+
+    def test_write_sheets_names_each_sheet_of_several(self):
+        sheets = {'Daily Details': self.create_frame(), 'Summary': self.create_frame(3)}
+        SheetsReport().write_sheets(os.path.join(self.dir, 'out.parquet'), sheets)
+        self.assertEqual(self.written_files(), ['out_DailyDetails.parquet', 'out_Summary.parquet'])
+        pd.testing.assert_frame_equal(pd.read_parquet(os.path.join(self.dir, 'out_Summary.parquet')), self.create_frame(3))
+
+    def test_write_sheets_writes_a_partition_per_sheet_as_a_dataset(self):
+        sheets = {'Daily Details': self.create_frame(), 'Summary': self.create_frame(3)}
+        SheetsReport().write_sheets(os.path.join(self.dir, 'out.feather'), sheets, {'dataset': 'true'})
+        self.assertEqual(self.written_files(), [
+            os.path.join('out', 'sheet=DailyDetails', 'part-0.feather'),
+            os.path.join('out', 'sheet=Summary', 'part-0.feather'),
+        ])
+        pd.testing.assert_frame_equal(pd.read_feather(os.path.join(self.dir, 'out', 'sheet=Summary', 'part-0.feather')), self.create_frame(3))
+
+    ### ====================================
+    ### Tests for charts_mode() and render_chart()
+    ### ====================================
+
+    def test_charts_mode(self):
+        for report_args, expected in [({}, 'true'), ({'charts': 'False'}, 'false'), ({'charts': 'defer'}, 'defer'), ({'charts': True}, 'true')]:
+            with self.subTest(report_args=report_args):
+                self.assertEqual(BaseReport.charts_mode(report_args), expected)
+        with self.assertRaisesRegex(ValueError, "Unsupported charts mode 'later'"):
+            BaseReport.charts_mode({'charts': 'later'})
+
+    def test_charts_false_skips_rendering(self):
+        chart = os.path.join(self.dir, 'out_Chart.png')
+        SheetsReport().render_chart({'charts': 'false'}, render_line, self.create_frame(), chart, 'Close')
+        self.assertEqual(os.listdir(self.dir), [])
+
+    def test_deferred_charts_round_trip(self):
+        output_filename = os.path.join(self.dir, 'out.xlsx')
+        report = SheetsReport()
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                charts = [report.chart_filename(output_filename, f'_Chart{i}') for i in range(2)]
+                for chart in charts:
+                    report.render_chart({'charts': 'defer'}, render_line, self.create_frame()[['Settle date', 'Close']], chart, 'Close')
+                    self.assertFalse(os.path.exists(chart))
+                    self.assertTrue(os.path.exists(chart + BaseReport.DEFERRED_CHART_SUFFIX))
+
+                self.assertEqual(BaseReport.render_deferred_charts(output_filename, workers), 2)
+                for chart in charts:
+                    self.assertTrue(os.path.exists(chart))
+                    self.assertFalse(os.path.exists(chart + BaseReport.DEFERRED_CHART_SUFFIX))
+                    os.remove(chart)
+
+if __name__ == '__main__':
+    unittest.main()
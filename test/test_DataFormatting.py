@@ -35,6 +35,8 @@ class TestCases(unittest.TestCase):
         # Ensure the expected DataFrame is in the correct format
         expected_df['Settle date'] = pd.to_datetime(expected_df['Settle date'])
         expected_df['Position name'] = expected_df['Position name'].astype(str)
+        expected_df['Theme'] = expected_df['Theme'].astype(str)
+        expected_df['Capital'] = pd.to_numeric(expected_df['Capital'], errors='coerce').astype('float')
         expected_df['Quantity'] = pd.to_numeric(expected_df['Quantity'], errors='coerce').astype('float')
         expected_df['Book cost'] = pd.to_numeric(expected_df['Book cost'], errors='coerce').astype('float')
         expected_df['Income Qty'] = pd.to_numeric(expected_df['Income Qty'], errors='coerce').astype('float')
@@ -45,7 +47,7 @@ class TestCases(unittest.TestCase):
         expected_df['ITD PnL'] = pd.to_numeric(expected_df['ITD PnL'], errors='coerce').astype('float')
 
         # Call the function
-        result_df = DataFormatting.create_holding_dataframe(dfTransactions, dfIncome, dsDateSeries, dfClosePrices, 'Test Holding ABC')
+        result_df = DataFormatting.create_holding_dataframe(dfTransactions, dfIncome, dsDateSeries, dfClosePrices, 'Test Holding ABC', 'Test Theme')
 
         # Check if the result matches the expected DataFrame
         pd.testing.assert_frame_equal(result_df, expected_df)
@@ -85,6 +87,122 @@ class TestCases(unittest.TestCase):
         # Call the utility function with test number 5
         self.utility_create_holding_dataframe(5, rootpath)
 
+    ### =====================================
+    ### Tests for create_portfolio_holdings()
+    ### =====================================
+
+    def test_create_portfolio_holdings_matches_fixtures(self):
+        # each of the create_holding_dataframe fixtures is a position in one portfolio
+        rootpath = "./test_data/create_holding_dataframe/"
+
+        positions, transactions, income, prices, expected = [], [], [], [], []
+        for testNum in range(1, 6):
+            name = f'Test Holding {testNum}'
+            dsDateSeries = pd.read_csv(f"{rootpath}date_series_{testNum}.csv", parse_dates=['Settle date'])
+            positions.append({'Position name': name, 'Theme': f'Theme {testNum % 2}', 'First date': dsDateSeries['Settle date'].min(), 'Last date': dsDateSeries['Settle date'].max()})
+            transactions.append(pd.read_csv(f"{rootpath}transactions_{testNum}.csv", parse_dates=['Settle date']).assign(**{'Position name': name}))
+            income.append(pd.read_csv(f"{rootpath}income_{testNum}.csv", parse_dates=['Settle date']).assign(**{'Position name': name}))
+            prices.append(pd.read_csv(f"{rootpath}close_prices_{testNum}.csv", parse_dates=['Settle date']).assign(**{'Position name': name}))
+            expected.append(DataFormatting.create_holding_dataframe(transactions[-1], income[-1], dsDateSeries, prices[-1], name, f'Theme {testNum % 2}'))
+
+        # a position not in the portfolio is ignored
+        transactions.append(transactions[0].assign(**{'Position name': 'Not held'}))
+
+        result_df = DataFormatting.create_portfolio_holdings(pd.DataFrame(positions), pd.concat(transactions, ignore_index=True),
+                                                             pd.concat([i for i in income if not i.empty], ignore_index=True), pd.concat(prices, ignore_index=True))
+
+        pd.testing.assert_frame_equal(result_df, pd.concat(expected, ignore_index=True))
+
+    ### ====================================
+    ### Tests for extend_holding_dataframe()
+    ### ====================================
+
+    def utility_extend_holding_dataframe(self, testNum, rootpath, dropPrices=False, fromStoredDay=False):
+        # Load the test data
+        dfTransactions = pd.read_csv(f"{rootpath}transactions_{testNum}.csv", parse_dates=['Settle date'])
+        dfIncome = pd.read_csv(f"{rootpath}income_{testNum}.csv", parse_dates=['Settle date'])
+        dsDateSeries = pd.read_csv(f"{rootpath}date_series_{testNum}.csv", parse_dates=['Settle date'])
+        dfClosePrices = pd.read_csv(f"{rootpath}close_prices_{testNum}.csv", parse_dates=['Settle date'])
+
+        # split the dates after the last transaction or income, which is as far back as a snapshot can be extended from
+        lastInput = pd.concat([dfTransactions['Settle date'], dfIncome['Settle date']]).max()
+        dsBefore = dsDateSeries[dsDateSeries['Settle date'] <= lastInput]
+        dfNewPrices = dfClosePrices[dfClosePrices['Settle date'] > lastInput]
+        if fromStoredDay:
+            # prices requested from the last stored day, as PortfolioAnalysis does, so that day comes back again
+            dfNewPrices = dfClosePrices[dfClosePrices['Settle date'] >= dsBefore['Settle date'].max()]
+        if dropPrices:
+            # no prices published after the snapshot, so the last close carries forward
+            dfNewPrices = dfNewPrices.iloc[0:0]
+            dfClosePrices = dfClosePrices[dfClosePrices['Settle date'] <= lastInput]
+
+        expected_df = DataFormatting.create_holding_dataframe(dfTransactions, dfIncome, dsDateSeries, dfClosePrices, 'Test Holding ABC', 'Theme')
+
+        stored_df = DataFormatting.create_holding_dataframe(dfTransactions, dfIncome, dsBefore, dfClosePrices, 'Test Holding ABC', 'Theme')
+        result_df = DataFormatting.extend_holding_dataframe(stored_df, dsDateSeries, dfNewPrices)
+
+        pd.testing.assert_frame_equal(result_df, expected_df)
+
+    def test_extend_holding_dataframe_matches_full_build(self):
+        rootpath = "./test_data/create_holding_dataframe/"
+
+        for testNum in range(1, 6):
+            with self.subTest(testNum=testNum):
+                self.utility_extend_holding_dataframe(testNum, rootpath)
+
+    def test_extend_holding_dataframe_prices_from_stored_day(self):
+        rootpath = "./test_data/create_holding_dataframe/"
+
+        for testNum in range(1, 6):
+            with self.subTest(testNum=testNum):
+                self.utility_extend_holding_dataframe(testNum, rootpath, fromStoredDay=True)
+
+    def test_extend_holding_dataframe_no_new_prices(self):
+        rootpath = "./test_data/create_holding_dataframe/"
+
+        self.utility_extend_holding_dataframe(1, rootpath, dropPrices=True)
+
+    ### =================================
+    ### Tests for partition_by_position()
+    ### =================================
+
+    def test_partition_by_position_matches_masking(self):
+        df = pd.DataFrame({
+            'Settle date': pd.to_datetime(['2023-01-03', '2023-01-01', '2023-01-02', '2023-01-01', '2023-01-04', '2023-01-05']),
+            'Position Name': ['B', 'A', 'B', None, 'A', 'C'],
+            'Adj Qty': [10, 20, 30, 40, 50, 60],
+        })
+
+        result = DataFormatting.partition_by_position(df)
+
+        self.assertEqual(list(result.keys()), ['B', 'A', 'C'])
+        for position, part in result.items():
+            pd.testing.assert_frame_equal(part, df[df['Position Name'] == position])
+
+    ### ===============================
+    ### Tests for compact_portfolio()
+    ### ===============================
+
+    def test_compact_portfolio_categoricals(self):
+        df = pd.DataFrame({
+            'Settle date': pd.to_datetime(['2023-01-02', '2023-01-02', '2023-01-03', '2023-01-03']),
+            'Position name': ['A', 'B', 'A', 'B'],
+            'Theme': ['Tech', 'Bonds', 'Tech', 'Bonds'],
+            'Market value': [100.0, 200.0, 110.0, 190.0],
+            'Day PnL': [0.0, 0.0, 10.0, -10.0],
+        })
+
+        result_df = DataFormatting.compact_portfolio(df, ['Day PnL'])
+
+        self.assertEqual(result_df['Position name'].dtype, 'category')
+        self.assertEqual(result_df['Theme'].dtype, 'category')
+        self.assertEqual(result_df['Day PnL'].dtype, 'float32')
+        pd.testing.assert_frame_equal(result_df.astype({'Position name': object, 'Theme': object, 'Day PnL': 'float64'}), df)
+
+        report = DataFormatting.memory_usage_report(df, result_df)
+        self.assertEqual(report.loc['Day PnL', 'After bytes'] * 2, report.loc['Day PnL', 'Before bytes'])
+        self.assertEqual(report.loc['Total', 'Before bytes'], df.memory_usage(index=False, deep=True).sum())
+
     ### ============================
     ### Tests for create_portfolio()
     ### ============================
@@ -0,0 +1,48 @@
+import unittest
+import numpy as np
+import pandas as pd
+from pandas.tseries.holiday import AbstractHolidayCalendar, Holiday, USFederalHolidayCalendar
+import DataGeneration
+
+class TestCases(unittest.TestCase):
+
+    def test_create_date_series_matches_date_range(self):
+        for start, end in [('2020-01-04', '2020-03-01'), ('2021-05-05', '2021-05-01'), ('1960-02-03', '2030-01-01')]:
+            with self.subTest(start=start, end=end):
+                expected = pd.DataFrame(pd.date_range(start=start, end=end, freq='B'), columns=['Settle date'])
+                pd.testing.assert_frame_equal(DataGeneration.create_date_series(pd.Timestamp(start), pd.Timestamp(end)), expected)
+
+    def test_busday_count_matches_numpy(self):
+        rng = np.random.default_rng(0)
+        begin = np.datetime64('1995-01-01') + rng.integers(0, 20000, 1000)
+        end = np.datetime64('1995-01-01') + rng.integers(0, 20000, 1000)
+
+        calendar = DataGeneration.BusinessDayCalendar()
+        np.testing.assert_array_equal(calendar.busday_count(begin, end), np.busday_count(begin, end))
+        np.testing.assert_array_equal(calendar.dates(calendar.ordinals(begin)), np.busday_offset(begin, 0, roll='forward').astype('datetime64[ns]'))
+
+    def test_holiday_calendar(self):
+        holidays = USFederalHolidayCalendar()
+        calendar = DataGeneration.business_day_calendar(holidays)
+        self.assertIs(calendar, DataGeneration.business_day_calendar(USFederalHolidayCalendar()))
+        self.assertIsNot(calendar, DataGeneration.business_day_calendar())
+
+        dates = calendar.date_range('2024-12-20', '2025-01-03')
+        self.assertNotIn(pd.Timestamp('2024-12-25'), dates)
+        self.assertNotIn(pd.Timestamp('2025-01-01'), dates)
+        self.assertEqual(len(dates), 9)
+
+        busdaycal = np.busdaycalendar(holidays=holidays.holidays().values.astype('datetime64[D]'))
+        self.assertEqual(calendar.busday_count('2000-01-01', '2025-01-01'), np.busday_count('2000-01-01', '2025-01-01', busdaycal=busdaycal))
+
+    def test_holiday_calendar_instances_with_different_holidays(self):
+        boxing_day = AbstractHolidayCalendar(rules=[Holiday('Boxing Day', month=12, day=26)])
+        new_year = AbstractHolidayCalendar(rules=[Holiday('New Year', month=1, day=1)])
+        calendar = DataGeneration.business_day_calendar(boxing_day)
+        self.assertIsNot(calendar, DataGeneration.business_day_calendar(new_year))
+        self.assertIs(calendar, DataGeneration.business_day_calendar(AbstractHolidayCalendar(rules=[Holiday('Boxing Day', month=12, day=26)])))
+        self.assertNotIn(pd.Timestamp('2024-12-26'), calendar.date_range('2024-12-20', '2025-01-03'))
+        self.assertIn(pd.Timestamp('2025-01-01'), calendar.date_range('2024-12-20', '2025-01-03'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+from Data.HoldingsSnapshot import HoldingsSnapshot, position_inputs_hash
+
+class TestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dir = self.tmp.name
+
+    def create_inputs(self):
+        transactions = pd.DataFrame({
+            'Settle date': pd.to_datetime(['2024-01-02', '2024-02-01']),
+            'Reference': ['Buy', 'Buy'],
+            'Quantity': [10.0, 5.0],
+            'Value (£)': [1000.0, 520.0],
+        })
+        income = pd.DataFrame({
+            'Settle date': pd.to_datetime(['2024-03-01']),
+            'Quantity': [0.0],
+            'Value (£)': [12.5],
+        })
+        static = {'isin': 'GB0000000001', 'ticker': 'ABC.L', 'theme': 'Growth'}
+        return transactions, income, static
+
+    def create_holdings(self, position='Test Holding ABC', end='2024-03-29'):
+        dates = pd.date_range('2024-01-02', end, freq='B')
+        return pd.DataFrame({
+            'Settle date': dates,
+            'Position name': pd.Categorical([position] * len(dates)),
+            'Theme': ['Growth'] * len(dates),
+            'Quantity': [10.0] * len(dates),
+            'Close': [100.0 + i for i in range(len(dates))],
+            'Market value': [1000.0 + 10 * i for i in range(len(dates))],
+        })
+
+    ### ====================================
+    ### Tests for position_inputs_hash()
+    ### ====================================
+
+    def test_position_inputs_hash_is_stable(self):
+        transactions, income, static = self.create_inputs()
+        self.assertEqual(position_inputs_hash(transactions, income, static), position_inputs_hash(transactions.copy(), income.copy(), dict(static)))
+
+    def test_position_inputs_hash_changes_with_inputs(self):
+        transactions, income, static = self.create_inputs()
+        expected = position_inputs_hash(transactions, income, static)
+
+        changed_transaction = transactions.copy()
+        changed_transaction.loc[1, 'Quantity'] = 6.0
+        changed_income = income.copy()
+        changed_income.loc[0, 'Value (£)'] = 13.0
+
+        for name, (t, i, s) in {
+            'transaction': (changed_transaction, income, static),
+            'new transaction': (pd.concat([transactions, transactions.tail(1)], ignore_index=True), income, static),
+            'income': (transactions, changed_income, static),
+            'static': (transactions, income, {**static, 'theme': 'Income'}),
+        }.items():
+            with self.subTest(changed=name):
+                self.assertNotEqual(position_inputs_hash(t, i, s), expected)
+
+    ### ====================================
+    ### Tests for HoldingsSnapshot
+    ### ====================================
+
+    def test_save_and_load_round_trips_dtypes(self):
+        holdings = self.create_holdings()
+        snapshot = HoldingsSnapshot(self.dir)
+        snapshot.save('Test Holding ABC', 'hash1', holdings)
+        snapshot.flush()
+
+        loaded = HoldingsSnapshot(self.dir).load('Test Holding ABC', 'hash1')
+        pd.testing.assert_frame_equal(loaded, holdings)
+
+    def test_hash_mismatch_forces_rebuild(self):
+        snapshot = HoldingsSnapshot(self.dir)
+        snapshot.save('Test Holding ABC', 'hash1', self.create_holdings())
+        snapshot.flush()
+
+        reopened = HoldingsSnapshot(self.dir)
+        self.assertIsNone(reopened.load('Test Holding ABC', 'hash2'))
+        self.assertIsNone(reopened.load('Unknown Holding', 'hash1'))
+
+    def test_flush_drops_positions_not_seen(self):
+        snapshot = HoldingsSnapshot(self.dir)
+        snapshot.save('Kept', 'hash1', self.create_holdings('Kept'))
+        snapshot.save('Sold', 'hash2', self.create_holdings('Sold'))
+        snapshot.flush()
+        self.assertEqual(len([f for f in os.listdir(self.dir) if f.endswith('.parquet')]), 2)
+
+        # a later run that only sees one of the positions
+        snapshot = HoldingsSnapshot(self.dir)
+        self.assertIsNotNone(snapshot.load('Kept', 'hash1'))
+        snapshot.flush()
+
+        reopened = HoldingsSnapshot(self.dir)
+        self.assertIsNotNone(reopened.load('Kept', 'hash1'))
+        self.assertIsNone(reopened.load('Sold', 'hash2'))
+        self.assertEqual(len([f for f in os.listdir(self.dir) if f.endswith('.parquet')]), 1)
+
+    def test_unflushed_saves_are_not_visible(self):
+        snapshot = HoldingsSnapshot(self.dir)
+        snapshot.save('Test Holding ABC', 'hash1', self.create_holdings())
+        self.assertIsNone(HoldingsSnapshot(self.dir).load('Test Holding ABC', 'hash1'))
+
+if __name__ == '__main__':
+    unittest.main()
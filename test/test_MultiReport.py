@@ -0,0 +1,68 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+import pandas as pd
+from Reports.BaseReport import BaseReport
+from Reports.MultiReport import MultiReport
+
+# child reports kept at module level, so they can be sent to the worker processes
+
+class WritingReport(BaseReport):
+
+    def generate(self, output_filename: str, data, report_args: dict = dict()):
+        data.to_csv(output_filename, index=False)
+
+    def required_measures(self) -> list[str]:
+        return []
+
+class FailingReport(BaseReport):
+
+    def generate(self, output_filename: str, data, report_args: dict = dict()):
+        # leave a trace that the report ran before failing
+        with open(output_filename, "w") as f:
+            f.write("started")
+        raise ValueError("failed on purpose")
+
+    def required_measures(self) -> list[str]:
+        return []
+
+class TestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.output_filename = os.path.join(self.tmp.name, "out.csv")
+        self.data = pd.DataFrame({
+            'Settle date': pd.date_range('2024-01-01', periods=5, freq='B'),
+            'Position name': ['Alpha'] * 5,
+            'Market value': [100.0, 101.0, 102.5, 101.5, 103.0],
+        })
+
+    def generate(self, report_args):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), self.assertRaises(RuntimeError) as raised:
+            MultiReport([WritingReport(), FailingReport()]).generate(self.output_filename, self.data, report_args)
+        return output.getvalue(), str(raised.exception)
+
+    def test_failures_are_collected_and_raised(self):
+        for report_args in ({}, {'report_workers': '2'}):
+            with self.subTest(report_args=report_args):
+                output, error = self.generate(report_args)
+
+                # both reports ran, whichever failed
+                written = pd.read_csv(os.path.join(self.tmp.name, "out_WritingReport.csv"), parse_dates=['Settle date'])
+                pd.testing.assert_frame_equal(written, self.data)
+                self.assertTrue(os.path.exists(os.path.join(self.tmp.name, "out_FailingReport.csv")))
+
+                timings = output[output.index("REPORT TIMINGS"):]
+                self.assertRegex(timings, r"WritingReport\s+[\d.]+\s+OK")
+                self.assertRegex(timings, r"FailingReport\s+[\d.]+\s+FAILED")
+                self.assertIn("ValueError: failed on purpose", timings)
+
+                self.assertEqual(error, "1 report(s) failed: FailingReport")
+                self.assertNotIn("WritingReport", error)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+import numpy as np
+import pandas as pd
+from Reports.PeriodicPerformance import PeriodicPerformanceReport
+
+def per_cell_periodic_performance(data, granularity, pivot_column, lookback=-1, pnl=False):
+    # the per-cell implementation create_periodic_performance_from_pivot replaced, which copied and pivoted the raw
+    # data again for every granularity, lookback and mode
+    data = data[['Settle date', pivot_column, 'Market value', 'Income', 'Book cost']].copy()
+    data = data.groupby(['Settle date', pivot_column]).agg({'Market value': 'sum', 'Income': 'sum', 'Book cost': 'sum'}).reset_index()
+    data['Income'] = data.groupby(['Settle date', pivot_column])['Income'].cumsum()
+    if pnl:
+        data['Pivot value'] = data['Market value'] + data['Income'] - data['Book cost']
+    else:
+        data['Pivot value'] = 100.0 * (((data['Market value'] + data['Income']) / data['Book cost']) - 1.0)
+    data = data[['Settle date', pivot_column, 'Pivot value']]
+    if lookback is not None and lookback > 0:
+        cutoff_date = data['Settle date'].max() - pd.Timedelta(days=lookback)
+        data = data[data['Settle date'] >= cutoff_date]
+    pivot_df = data.pivot(index='Settle date', columns=pivot_column, values=['Pivot value'])
+    pivot_df = pivot_df.groupby(pd.Grouper(freq=granularity)).last()
+    return pivot_df.drop(columns=['Cash'], errors='ignore')
+
+class TestCases(unittest.TestCase):
+
+    def create_holdings(self):
+        # two positions in one theme, one sold long before the end, and cash
+        rng = np.random.default_rng(0)
+        dates = pd.date_range('2020-01-01', '2023-06-30', freq='B')
+        frames = []
+        for position, theme, first, last in [('Alpha', 'Growth', 0, len(dates)), ('Beta', 'Growth', 100, 400), ('Gamma', 'Income', 50, len(dates)), ('Cash', 'Cash', 0, len(dates))]:
+            days = dates[first:last]
+            frames.append(pd.DataFrame({
+                'Settle date': days,
+                'Position name': position,
+                'Theme': theme,
+                'Market value': 1000.0 + rng.normal(0, 50, len(days)).cumsum(),
+                'Income': np.where(rng.random(len(days)) < 0.02, 10.0, 0.0).cumsum(),
+                'Book cost': 1000.0,
+            }))
+        return pd.concat(frames, ignore_index=True)
+
+    def test_periodic_performance_from_pivot_matches_per_cell(self):
+        data = self.create_holdings()
+        report = PeriodicPerformanceReport()
+        for pivot_column in ('Position name', 'Theme'):
+            daily = report.create_daily_pivot(data, pivot_column)
+            for granularity in ('D', 'ME'):
+                for lookback in (-1, 365):
+                    for pnl in (False, True):
+                        with self.subTest(pivot_column=pivot_column, granularity=granularity, lookback=lookback, pnl=pnl):
+                            expected = per_cell_periodic_performance(data, granularity, pivot_column, lookback, pnl)
+                            result = report.create_periodic_performance_from_pivot(daily, granularity, pivot_column, lookback, pnl)
+                            pd.testing.assert_frame_equal(result, expected, check_freq=False)
+
+    def test_lookback_drops_positions_without_data(self):
+        data = self.create_holdings()
+        result = PeriodicPerformanceReport().create_periodic_performance(data, 'ME', 'Position name', 365)
+        positions = list(result.columns.get_level_values('Position name'))
+        self.assertNotIn('Beta', positions)
+        self.assertIn('Alpha', positions)
+        self.assertIn('Gamma', positions)
+
+if __name__ == '__main__':
+    unittest.main()
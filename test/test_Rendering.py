@@ -0,0 +1,53 @@
+import unittest
+import numpy as np
+import pandas as pd
+from Reports.Rendering import decimate_min_max
+
+class TestCases(unittest.TestCase):
+
+    def create_series(self, rows=1000, columns=3):
+        rng = np.random.default_rng(0)
+        return pd.DataFrame(
+            rng.normal(0, 1, (rows, columns)).cumsum(axis=0),
+            index=pd.date_range('2000-01-03', periods=rows, freq='B', name='Settle date'),
+            columns=[f'Position {i}' for i in range(columns)],
+        )
+
+    ### ====================================
+    ### Tests for decimate_min_max()
+    ### ====================================
+
+    def test_keeps_first_last_min_and_max_of_each_bucket(self):
+        df = self.create_series()
+        for buckets in (7, 50, 200):
+            with self.subTest(buckets=buckets):
+                result = decimate_min_max(df, buckets)
+                self.assertLess(len(result), len(df))
+                self.assertTrue(result.index.is_monotonic_increasing)
+                pd.testing.assert_frame_equal(result, df.loc[result.index])
+
+                kept = set(result.index)
+                bucket = np.arange(len(df)) * buckets // len(df)
+                for b in range(buckets):
+                    rows = df[bucket == b]
+                    expected = {rows.index[0], rows.index[-1]}
+                    for column in df.columns:
+                        expected.add(rows[column].idxmin())
+                        expected.add(rows[column].idxmax())
+                    self.assertLessEqual(expected, kept, f"bucket {b}")
+
+    def test_small_frames_are_returned_unchanged(self):
+        df = self.create_series(rows=100)
+        for buckets in (100, 1000):
+            with self.subTest(buckets=buckets):
+                self.assertIs(decimate_min_max(df, buckets), df)
+        empty = df.iloc[:0]
+        self.assertIs(decimate_min_max(empty, 10), empty)
+
+    def test_nan_columns_do_not_change_the_rows_kept(self):
+        df = self.create_series()
+        with_nan = df.assign(**{'Closed position': np.nan})
+        pd.testing.assert_index_equal(decimate_min_max(with_nan, 50).index, decimate_min_max(df, 50).index)
+
+if __name__ == '__main__':
+    unittest.main()
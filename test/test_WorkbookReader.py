@@ -0,0 +1,90 @@
+import glob
+import importlib.util
+import os
+import tempfile
+import unittest
+from unittest import mock
+import pandas as pd
+from Data import WorkbookReader as wr
+
+class TestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.data_file = os.path.join(self.tmp.name, "InvestmentData.xlsx")
+        self.write_workbook(5)
+
+    def write_workbook(self, rows):
+        transactions = pd.DataFrame({
+            'Settle date': pd.date_range('2024-01-02', periods=rows, freq='B'),
+            'Position Name': [f'Holding {i % 3}' for i in range(rows)],
+            'Quantity': [float(i + 1) for i in range(rows)],
+            'Value (£)': [100.25 * (i + 1) for i in range(rows)],
+        })
+        income = pd.DataFrame({
+            'Settle date': pd.date_range('2024-03-01', periods=2, freq='MS'),
+            'Position Name': ['Holding 0', 'Holding 1'],
+            'Value (£)': [12.5, 7.0],
+        })
+        with pd.ExcelWriter(self.data_file, engine='openpyxl') as writer:
+            transactions.to_excel(writer, sheet_name='Transactions', index=False)
+            income.to_excel(writer, sheet_name='Income', index=False)
+
+    def read(self):
+        # the frames read, and whether the workbook itself had to be parsed to get them
+        with mock.patch.object(wr.pd, 'read_excel', wraps=pd.read_excel) as read_excel:
+            frames = wr.WorkbookReader(self.data_file).read_sheets(['Transactions', 'Income'])
+        return frames, read_excel.called
+
+    def sidecars(self):
+        return sorted(os.path.basename(p) for p in glob.glob(os.path.join(self.data_file + ".sheets", "*.feather")))
+
+    def test_second_read_comes_from_sidecar(self):
+        first, parsed = self.read()
+        self.assertTrue(parsed)
+        self.assertEqual(len(self.sidecars()), 2)
+
+        second, parsed = self.read()
+        self.assertFalse(parsed)
+        for sheet in ('Transactions', 'Income'):
+            pd.testing.assert_frame_equal(second[sheet], first[sheet])
+
+    def test_touching_workbook_invalidates_sidecar(self):
+        self.read()
+        before = self.sidecars()
+
+        stat = os.stat(self.data_file)
+        os.utime(self.data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        _, parsed = self.read()
+
+        self.assertTrue(parsed)
+        after = self.sidecars()
+        self.assertEqual(len(after), 2)
+        self.assertTrue(set(before).isdisjoint(after))
+
+    def test_resizing_workbook_invalidates_sidecar(self):
+        self.read()
+        stat = os.stat(self.data_file)
+
+        self.write_workbook(8)
+        # keep the modification time, so only the size tells the versions apart
+        os.utime(self.data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertNotEqual(os.stat(self.data_file).st_size, stat.st_size)
+        frames, parsed = self.read()
+
+        self.assertTrue(parsed)
+        self.assertEqual(len(frames['Transactions']), 8)
+        self.assertEqual(len(self.sidecars()), 2)
+
+    @unittest.skipUnless(importlib.util.find_spec("python_calamine") is not None, "python-calamine is not installed")
+    def test_calamine_and_openpyxl_read_the_same_frames(self):
+        for sheet in ('Transactions', 'Income'):
+            with self.subTest(sheet=sheet):
+                pd.testing.assert_frame_equal(
+                    pd.read_excel(self.data_file, sheet_name=sheet, engine='calamine'),
+                    pd.read_excel(self.data_file, sheet_name=sheet, engine='openpyxl'),
+                )
+
+if __name__ == '__main__':
+    unittest.main()